@@ -20,6 +20,7 @@ from app.agent.prompt_builder import (
     build_system_prompt_sync,
     check_prompt_includes_memories,
     check_prompt_includes_guidelines,
+    invalidate_prompt_cache,
 )
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     "build_system_prompt_sync",
     "check_prompt_includes_memories",
     "check_prompt_includes_guidelines",
+    "invalidate_prompt_cache",
 ]
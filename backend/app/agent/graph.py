@@ -8,19 +8,56 @@ Requirements: 6.1, 6.2, 6.3, 6.4, 6.6
 """
 
 import logging
-from typing import Any, Callable, Literal
+from typing import Any, AsyncIterator, Callable, Literal
+from uuid import UUID
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import ToolNode
 
-from app.agent.llm import get_llm_client, check_llm_availability, get_fallback_message
+from app.agent.llm import (
+    check_llm_availability,
+    get_fallback_message,
+    get_llm_client,
+    get_llm_semaphore,
+)
 from app.agent.state import AgentContext
 
 logger = logging.getLogger(__name__)
 
 
+# LLMs with tools bound, keyed by (base_url, model, tool names)
+_BOUND_LLM_CACHE: dict[tuple[str | None, str | None, tuple[str, ...]], Runnable] = {}
+
+
+def get_bound_llm(
+    tools: list[BaseTool], *, llm_base_url: str | None = None, llm_model: str | None = None
+) -> Runnable:
+    """
+    Get an LLM client with the given tools bound, reusing earlier bindings.
+
+    bind_tools converts every tool schema to an OpenAI function spec, so
+    the result is cached per configuration and tool set.
+
+    Args:
+        tools: List of available tools
+        llm_base_url: Optional LLM endpoint override
+        llm_model: Optional model name override
+
+    Returns:
+        Runnable LLM with tools bound
+    """
+    key = (llm_base_url, llm_model, tuple(t.name for t in tools))
+    bound = _BOUND_LLM_CACHE.get(key)
+    if bound is None:
+        llm = get_llm_client(base_url=llm_base_url, model=llm_model)
+        bound = llm.bind_tools(tools)
+        _BOUND_LLM_CACHE[key] = bound
+    return bound
+
+
 def create_agent_node(tools: list[BaseTool], *, llm_base_url: str | None = None, llm_model: str | None = None) -> Callable:
     """
     Create the agent node that processes messages and decides on tool calls.
@@ -31,8 +68,7 @@ def create_agent_node(tools: list[BaseTool], *, llm_base_url: str | None = None,
     Returns:
         Agent node function
     """
-    llm = get_llm_client(base_url=llm_base_url, model=llm_model)
-    llm_with_tools = llm.bind_tools(tools)
+    llm_with_tools = get_bound_llm(tools, llm_base_url=llm_base_url, llm_model=llm_model)
 
     async def agent_node(state: dict[str, Any]) -> dict[str, Any]:
         """
@@ -47,7 +83,8 @@ def create_agent_node(tools: list[BaseTool], *, llm_base_url: str | None = None,
         messages = state.get("messages", [])
 
         try:
-            response = await llm_with_tools.ainvoke(messages)
+            async with get_llm_semaphore():
+                response = await llm_with_tools.ainvoke(messages)
             return {"messages": [response]}
         except Exception as e:
             logger.error(f"LLM invocation failed: {e}")
@@ -147,45 +184,58 @@ class AESAAgent:
         self.tools = tools
         self.graph = create_agent_graph(tools, llm_base_url=llm_base_url, llm_model=llm_model)
 
+    @staticmethod
+    def _build_initial_state(
+        message: str,
+        user_id: UUID,
+        context: AgentContext | None,
+        history: list[BaseMessage] | None,
+    ) -> dict[str, Any]:
+        """Build the initial graph state for a user message."""
+        messages = list(history) if history else []
+        messages.append(HumanMessage(content=message))
+
+        return {
+            "messages": messages,
+            "user_id": user_id,
+            "context": context.to_dict() if context else {},
+            "tool_calls_made": [],
+            "error": None,
+        }
+
     async def process_message(
         self,
         message: str,
-        user_id: str,
+        user_id: UUID,
         context: AgentContext | None = None,
         history: list[BaseMessage] | None = None,
+        *,
+        assume_available: bool = False,
     ) -> dict[str, Any]:
         """
         Process a user message and return the response.
 
+        Callers that have already checked LLM availability (such as the
+        chat API) should pass assume_available=True to skip a second probe.
+
         Args:
             message: User's message
-            user_id: User UUID string
+            user_id: User UUID
             context: Optional agent context
             history: Optional conversation history
+            assume_available: Skip the LLM availability check
 
         Returns:
             Response dictionary with content and metadata
         """
-        # Check LLM availability first
-        is_available = await check_llm_availability()
-        if not is_available:
+        if not assume_available and not await check_llm_availability():
             return {
                 "content": get_fallback_message(message),
                 "tool_calls": [],
                 "error": "LLM service unavailable",
             }
 
-        # Build initial state
-        messages = list(history) if history else []
-        messages.append(HumanMessage(content=message))
-
-        initial_state = {
-            "messages": messages,
-            "user_id": user_id,
-            "context": context.to_dict() if context else {},
-            "tool_calls_made": [],
-            "error": None,
-        }
+        initial_state = self._build_initial_state(message, user_id, context, history)
 
         try:
             # Run the graph
@@ -194,15 +244,19 @@ class AESAAgent:
             # Extract the final response
             final_messages = result.get("messages", [])
 
-            # Find the last AI message
+            # Find the last AI message (almost always the final one)
             response_content = ""
             tool_calls = []
 
-            for msg in reversed(final_messages):
-                if isinstance(msg, AIMessage):
-                    response_content = msg.content
-                    tool_calls = msg.tool_calls if hasattr(msg, "tool_calls") else []
-                    break
+            last_ai = final_messages[-1] if final_messages else None
+            if not isinstance(last_ai, AIMessage):
+                last_ai = next(
+                    (m for m in reversed(final_messages) if isinstance(m, AIMessage)),
+                    None,
+                )
+            if last_ai is not None:
+                response_content = last_ai.content
+                tool_calls = last_ai.tool_calls
 
             return {
                 "content": response_content,
@@ -217,3 +271,68 @@ class AESAAgent:
                 "tool_calls": [],
                 "error": str(e),
             }
+
+    async def stream_message(
+        self,
+        message: str,
+        user_id: UUID,
+        context: AgentContext | None = None,
+        history: list[BaseMessage] | None = None,
+        *,
+        assume_available: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Process a user message, yielding events as the graph runs.
+
+        Args:
+            message: User's message
+            user_id: User UUID
+            context: Optional agent context
+            history: Optional conversation history
+            assume_available: Skip the LLM availability check
+
+        Yields:
+            Event dictionaries with a "type" of "token", "tool_call",
+            "tool_result" or "error"
+        """
+        if not assume_available and not await check_llm_availability():
+            yield {
+                "type": "error",
+                "content": get_fallback_message(message),
+                "error": "LLM service unavailable",
+            }
+            return
+
+        initial_state = self._build_initial_state(message, user_id, context, history)
+
+        try:
+            async for event in self.graph.astream_events(initial_state, version="v2"):
+                kind = event["event"]
+
+                if kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield {"type": "token", "content": content}
+
+                elif kind == "on_tool_start":
+                    yield {
+                        "type": "tool_call",
+                        "name": event["name"],
+                        "arguments": event["data"].get("input", {}),
+                    }
+
+                elif kind == "on_tool_end":
+                    output = event["data"].get("output")
+                    yield {
+                        "type": "tool_result",
+                        "name": event["name"],
+                        "content": str(getattr(output, "content", output)),
+                    }
+
+        except Exception as e:
+            logger.error(f"Agent streaming failed: {e}")
+            yield {
+                "type": "error",
+                "content": get_fallback_message(message),
+                "error": str(e),
+            }
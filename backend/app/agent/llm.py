@@ -7,7 +7,9 @@ for natural language processing capabilities.
 Requirements: 6.2, 6.6
 """
 
+import asyncio
 import logging
+import time
 
 import httpx
 from langchain_openai import ChatOpenAI
@@ -17,6 +19,65 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+# Shared HTTP client for copilot-api health checks (created lazily)
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+# Shared HTTP client handed to ChatOpenAI so LLM calls reuse connections
+_LLM_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+# Caps in-flight LLM calls per process (created lazily)
+_LLM_SEMAPHORE: asyncio.Semaphore | None = None
+
+# How long a health check result is trusted before re-probing copilot-api
+AVAILABILITY_TTL_SECONDS = 10.0
+
+
+class _AvailabilityCache:
+    """Short-lived cache of the last copilot-api health check result."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.result: bool | None = None
+        self.expires_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def get(self) -> bool | None:
+        """Return the cached result if it is still fresh."""
+        if self.result is not None and time.monotonic() < self.expires_at:
+            return self.result
+        return None
+
+    def set(self, result: bool) -> None:
+        """Store a fresh health check result."""
+        self.result = result
+        self.expires_at = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        """Forget the cached result."""
+        self.result = None
+        self.expires_at = 0.0
+
+
+_availability_cache = _AvailabilityCache(AVAILABILITY_TTL_SECONDS)
+
+
+def _copilot_endpoints() -> tuple[str, str]:
+    """
+    The copilot-api (health URL, OpenAI base URL) pair.
+
+    Read from the settings on every call so reset_settings() takes effect.
+    """
+    base = get_settings().copilot_api_url
+    return f"{base}/health", f"{base}/v1"
+
+
 class LLMUnavailableError(Exception):
     """Raised when the LLM service is unavailable."""
 
@@ -36,13 +97,13 @@ def get_llm_client(
     Args:
         temperature: Sampling temperature (0.0-1.0)
         max_tokens: Maximum tokens in response
+        base_url: Optional override for the OpenAI-compatible endpoint
+        model: Optional override for the model name
 
     Returns:
         Configured ChatOpenAI client
     """
-    settings = get_settings()
-
-    resolved_base_url = base_url or f"{settings.copilot_api_url}/v1"
+    resolved_base_url = base_url or _copilot_endpoints()[1]
     resolved_model = model or "gpt-4"
 
     return ChatOpenAI(
@@ -51,25 +112,151 @@ def get_llm_client(
         model=resolved_model,
         temperature=temperature,
         max_tokens=max_tokens,
+        http_async_client=get_llm_http_client(),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used to talk to copilot-api.
+
+    The client is created on first use and keeps connections alive
+    between calls so health checks don't pay a new handshake each time.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _HTTP_CLIENT
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used by ChatOpenAI for completions.
+
+    Pool sizes come from the LLM_MAX_CONNECTIONS / LLM_MAX_KEEPALIVE
+    settings rather than the OpenAI SDK defaults.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _LLM_HTTP_CLIENT
+    if _LLM_HTTP_CLIENT is None or _LLM_HTTP_CLIENT.is_closed:
+        settings = get_settings()
+        _LLM_HTTP_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_keepalive,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _LLM_HTTP_CLIENT
+
+
+async def prewarm_llm_connections() -> None:
+    """
+    Open keep-alive connections to copilot-api ahead of the first chat.
+
+    Fires llm_prewarm concurrent health requests through the LLM client so
+    its pool already holds idle connections. Failures are only logged and
+    each request gives up after 5 seconds, so startup is not held up long.
+    """
+    settings = get_settings()
+    if settings.llm_prewarm <= 0:
+        return
+
+    client = get_llm_http_client()
+    url = _copilot_endpoints()[0]
+    results = await asyncio.gather(
+        *(client.get(url, timeout=5.0) for _ in range(settings.llm_prewarm)),
+        return_exceptions=True,
     )
 
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logger.warning(
+            f"LLM connection pre-warm: {len(failures)}/{len(results)} failed: {failures[0]}"
+        )
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore that bounds concurrent LLM calls.
+
+    Sized to llm_max_connections so bursts of chat requests queue here
+    in order instead of timing out while waiting for a pooled connection.
+
+    Returns:
+        Shared asyncio.Semaphore
+    """
+    global _LLM_SEMAPHORE
+    if _LLM_SEMAPHORE is None:
+        _LLM_SEMAPHORE = asyncio.Semaphore(get_settings().llm_max_connections)
+    return _LLM_SEMAPHORE
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP clients (called on application shutdown)."""
+    global _HTTP_CLIENT, _LLM_HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+    if _LLM_HTTP_CLIENT is not None:
+        await _LLM_HTTP_CLIENT.aclose()
+        _LLM_HTTP_CLIENT = None
+    _availability_cache.clear()
+
 
 async def check_llm_availability() -> bool:
     """
     Check if the LLM service (copilot-api) is available.
 
+    The result is cached for AVAILABILITY_TTL_SECONDS so concurrent and
+    back-to-back chat requests share a single health probe.
+
     Returns:
         True if available, False otherwise
     """
-    settings = get_settings()
+    cached = _availability_cache.get()
+    if cached is not None:
+        return cached
+
+    async with _availability_cache.lock:
+        # Another request may have refreshed the result while we waited
+        cached = _availability_cache.get()
+        if cached is not None:
+            return cached
+
+        try:
+            response = await get_http_client().get(_copilot_endpoints()[0])
+            is_available = response.status_code == 200
+        except Exception as e:
+            logger.warning(f"LLM health check failed: {e}")
+            is_available = False
 
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.copilot_api_url}/health")
-            return response.status_code == 200
-    except Exception as e:
-        logger.warning(f"LLM health check failed: {e}")
-        return False
+        _availability_cache.set(is_available)
+        return is_available
+
+
+_FALLBACK_MESSAGE = (
+    "I'm having trouble connecting to my AI backend right now. "
+    "You can still use the schedule manually:\n\n"
+    "• Click 'Add Task' to create new tasks\n"
+    "• Drag tasks between columns to reschedule\n"
+    "• Use the timer to track your study sessions\n"
+    "• Check the Flow Board for your daily schedule\n\n"
+    "I'll be back online soon!"
+)
 
 
 def get_fallback_message(user_message: str) -> str:
@@ -77,17 +264,9 @@ def get_fallback_message(user_message: str) -> str:
     Provide a helpful fallback message when LLM is unavailable.
 
     Args:
-        user_message: The user's original message
+        user_message: The user's original message (currently unused)
 
     Returns:
         Helpful fallback response
     """
-    return (
-        "I'm having trouble connecting to my AI backend right now. "
-        "You can still use the schedule manually:\n\n"
-        "• Click 'Add Task' to create new tasks\n"
-        "• Drag tasks between columns to reschedule\n"
-        "• Use the timer to track your study sessions\n"
-        "• Check the Flow Board for your daily schedule\n\n"
-        "I'll be back online soon!"
-    )
+    return _FALLBACK_MESSAGE
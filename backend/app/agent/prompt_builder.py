@@ -8,13 +8,16 @@ Requirements: 6.5, 18.4
 """
 
 import logging
-from datetime import datetime
+import re
+import time
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, literal, literal_column, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.models.ai import AIMemory, AIGuideline
 from app.agent.state import AgentContext
 
@@ -76,57 +79,142 @@ CONTEXT_SECTION = """
 """
 
 
-async def get_user_memories(db: AsyncSession, user_id: str) -> list[dict[str, str]]:
+# Base prompt rendered for the current day: (date, rendered_prompt)
+_base_prompt_cache: tuple[Optional[date], str] = (None, "")
+
+
+def render_base_prompt() -> str:
+    """
+    Get BASE_SYSTEM_PROMPT rendered with today's date.
+
+    The rendered prompt only changes once a day, so it is cached and
+    rebuilt on the first call after the date rolls over.
+
+    Returns:
+        Base system prompt for today
     """
-    Get all memories for a user.
+    global _base_prompt_cache
+    today = date.today()
+    cached_date, rendered = _base_prompt_cache
+    if cached_date != today:
+        rendered = BASE_SYSTEM_PROMPT.format(today_date=today.strftime("%A, %B %d, %Y"))
+        _base_prompt_cache = (today, rendered)
+    return rendered
+
+
+# How long rendered memory/guideline sections are reused before re-querying
+PROMPT_SECTION_TTL_SECONDS = 60.0
+
+# Per-user cache of (memories_section, guidelines_section, expires_at)
+_prompt_section_cache: dict[UUID, tuple[str, str, float]] = {}
+
+
+def invalidate_prompt_cache(user_id: UUID) -> None:
+    """
+    Drop cached prompt sections for a user.
+
+    Call this whenever the user's memories or guidelines change.
+
+    Args:
+        user_id: User UUID
+    """
+    _prompt_section_cache.pop(user_id, None)
+
+
+async def get_prompt_sections(db: AsyncSession, user_id: UUID) -> tuple[str, str]:
+    """
+    Get the rendered memories and guidelines sections for a user.
+
+    Sections are cached per user for PROMPT_SECTION_TTL_SECONDS; an empty
+    string means the section is omitted from the prompt. If the query fails
+    both sections are omitted for this call only and nothing is cached.
 
     Args:
         db: Database session
-        user_id: User UUID string
+        user_id: User UUID
 
     Returns:
-        List of memory dictionaries with key and value
+        Tuple of (memories_section, guidelines_section)
     """
-    try:
-        result = await db.execute(
-            select(AIMemory).where(AIMemory.user_id == UUID(user_id))
-        )
-        memories = list(result.scalars().all())
+    cached = _prompt_section_cache.get(user_id)
+    if cached is not None and cached[2] > time.monotonic():
+        return cached[0], cached[1]
 
-        return [{"key": m.key, "value": m.value} for m in memories]
-    except Exception as e:
-        logger.error(f"Failed to get user memories: {e}")
-        return []
+    inputs = await fetch_prompt_inputs(db, user_id)
+    if inputs is None:
+        return "", ""
+    memories, guidelines = inputs
+
+    memories_section = render_memories_section(memories)
+    guidelines_section = render_guidelines_section(guidelines)
+
+    _prompt_section_cache[user_id] = (
+        memories_section,
+        guidelines_section,
+        time.monotonic() + PROMPT_SECTION_TTL_SECONDS,
+    )
+    return memories_section, guidelines_section
 
 
-async def get_active_guidelines(db: AsyncSession, user_id: str) -> list[str]:
+async def fetch_prompt_inputs(
+    db: AsyncSession, user_id: UUID
+) -> Optional[tuple[list[dict[str, str]], list[str]]]:
     """
-    Get all active guidelines for a user.
+    Get a user's memories and active guidelines in one round-trip.
+
+    Both tables are read with a single UNION ALL of column-only selects,
+    tagged with a discriminator so rows can be split afterwards. Only the
+    newest max_guidelines_in_prompt active guidelines are loaded.
 
     Args:
         db: Database session
-        user_id: User UUID string
+        user_id: User UUID
 
     Returns:
-        List of guideline strings
+        Tuple of (memory dictionaries with key and value, guideline strings),
+        or None if the query failed
     """
     try:
-        result = await db.execute(
-            select(AIGuideline)
+        memories_query = select(
+            literal("memory").label("kind"),
+            AIMemory.key.label("key"),
+            AIMemory.value.label("text"),
+            AIMemory.created_at.label("created_at"),
+        ).where(AIMemory.user_id == user_id)
+        guidelines_query = (
+            select(
+                literal("guideline"),
+                null(),
+                AIGuideline.guideline,
+                AIGuideline.created_at,
+            )
             .where(
                 and_(
-                    AIGuideline.user_id == UUID(user_id),
+                    AIGuideline.user_id == user_id,
                     AIGuideline.is_active,
                 )
             )
             .order_by(AIGuideline.created_at.desc())
+            .limit(get_settings().max_guidelines_in_prompt)
+        )
+        result = await db.execute(
+            union_all(memories_query, guidelines_query).order_by(
+                literal_column("created_at").desc()
+            )
         )
-        guidelines = list(result.scalars().all())
-
-        return [g.guideline for g in guidelines]
     except Exception as e:
-        logger.error(f"Failed to get active guidelines: {e}")
-        return []
+        logger.error(f"Failed to get prompt inputs: {e}")
+        return None
+
+    memories: list[dict[str, str]] = []
+    guidelines: list[str] = []
+    for kind, key, text, _ in result:
+        if kind == "memory":
+            memories.append({"key": key, "value": text})
+        else:
+            guidelines.append(text)
+
+    return memories, guidelines
 
 
 def format_memories(memories: list[dict[str, str]]) -> str:
@@ -137,16 +225,9 @@ def format_memories(memories: list[dict[str, str]]) -> str:
         memories: List of memory dictionaries
 
     Returns:
-        Formatted string of memories
+        Formatted string of memories (empty if there are none)
     """
-    if not memories:
-        return "No memories stored yet."
-
-    lines = []
-    for memory in memories:
-        lines.append(f"- **{memory['key']}**: {memory['value']}")
-
-    return "\n".join(lines)
+    return "\n".join(f"- **{memory['key']}**: {memory['value']}" for memory in memories)
 
 
 def format_guidelines(guidelines: list[str]) -> str:
@@ -157,16 +238,62 @@ def format_guidelines(guidelines: list[str]) -> str:
         guidelines: List of guideline strings
 
     Returns:
-        Formatted string of guidelines
+        Formatted string of guidelines (empty if there are none)
+    """
+    return "\n".join(f"{i}. {guideline}" for i, guideline in enumerate(guidelines, 1))
+
+
+def render_memories_section(memories: list[dict[str, str]]) -> str:
+    """
+    Render the memories section, or an empty string if there are none.
+
+    Args:
+        memories: List of memory dictionaries
+
+    Returns:
+        Rendered MEMORIES_SECTION
+    """
+    if not memories:
+        return ""
+    return MEMORIES_SECTION.format(memories=format_memories(memories))
+
+
+def render_guidelines_section(guidelines: list[str]) -> str:
+    """
+    Render the guidelines section, or an empty string if there are none.
+
+    Args:
+        guidelines: List of guideline strings
+
+    Returns:
+        Rendered GUIDELINES_SECTION
     """
     if not guidelines:
-        return "No custom guidelines set."
+        return ""
+    return GUIDELINES_SECTION.format(guidelines=format_guidelines(guidelines))
 
-    lines = []
-    for i, guideline in enumerate(guidelines, 1):
-        lines.append(f"{i}. {guideline}")
 
-    return "\n".join(lines)
+def render_context_section(context: Optional[AgentContext]) -> str:
+    """
+    Render the session context section, or an empty string if there is none.
+
+    Args:
+        context: Optional agent context
+
+    Returns:
+        Rendered CONTEXT_SECTION
+    """
+    if context is None:
+        return ""
+    formatted_context = format_context(context)
+    if not formatted_context:
+        return ""
+    return CONTEXT_SECTION.format(context_info=formatted_context)
+
+
+def _assemble_prompt(*sections: str) -> str:
+    """Join the base prompt with the non-empty sections."""
+    return "\n".join([render_base_prompt(), *(s for s in sections if s)])
 
 
 def format_context(context: AgentContext) -> str:
@@ -177,7 +304,7 @@ def format_context(context: AgentContext) -> str:
         context: Agent context object
 
     Returns:
-        Formatted context string
+        Formatted context string (empty if there is no context)
     """
     lines = []
 
@@ -195,15 +322,12 @@ def format_context(context: AgentContext) -> str:
             lines.append("- User preferences:")
             lines.extend(pref_items)
 
-    if not lines:
-        return "No specific context for this session."
-
     return "\n".join(lines)
 
 
 async def build_system_prompt(
     db: AsyncSession,
-    user_id: str,
+    user_id: UUID,
     context: Optional[AgentContext] = None,
 ) -> str:
     """
@@ -217,36 +341,18 @@ async def build_system_prompt(
 
     Args:
         db: Database session
-        user_id: User UUID string
+        user_id: User UUID
         context: Optional agent context
 
     Returns:
         Complete system prompt string
     """
-    # Get today's date
-    today_date = datetime.now().strftime("%A, %B %d, %Y")
+    # Memories and guidelines sections are cached per user
+    memories_section, guidelines_section = await get_prompt_sections(db, user_id)
 
-    # Start with base prompt
-    prompt_parts = [BASE_SYSTEM_PROMPT.format(today_date=today_date)]
-
-    # Add memories section
-    memories = await get_user_memories(db, user_id)
-    if memories:
-        formatted_memories = format_memories(memories)
-        prompt_parts.append(MEMORIES_SECTION.format(memories=formatted_memories))
-
-    # Add guidelines section
-    guidelines = await get_active_guidelines(db, user_id)
-    if guidelines:
-        formatted_guidelines = format_guidelines(guidelines)
-        prompt_parts.append(GUIDELINES_SECTION.format(guidelines=formatted_guidelines))
-
-    # Add context section
-    if context:
-        formatted_context = format_context(context)
-        prompt_parts.append(CONTEXT_SECTION.format(context_info=formatted_context))
-
-    return "\n".join(prompt_parts)
+    return _assemble_prompt(
+        memories_section, guidelines_section, render_context_section(context)
+    )
 
 
 def build_system_prompt_sync(
@@ -265,28 +371,36 @@ def build_system_prompt_sync(
     Returns:
         Complete system prompt string
     """
-    # Get today's date
-    today_date = datetime.now().strftime("%A, %B %d, %Y")
+    return _assemble_prompt(
+        render_memories_section(memories),
+        render_guidelines_section(guidelines),
+        render_context_section(context),
+    )
+
 
-    # Start with base prompt
-    prompt_parts = [BASE_SYSTEM_PROMPT.format(today_date=today_date)]
+def _prompt_includes_all(prompt: str, needles: list[str]) -> bool:
+    """
+    Check that every needle occurs in the prompt.
 
-    # Add memories section
-    if memories:
-        formatted_memories = format_memories(memories)
-        prompt_parts.append(MEMORIES_SECTION.format(memories=formatted_memories))
+    Unique needles are matched with one compiled alternation so the prompt
+    is scanned once. Matches don't overlap, so a needle hidden inside a
+    longer match is re-checked with a plain substring test.
 
-    # Add guidelines section
-    if guidelines:
-        formatted_guidelines = format_guidelines(guidelines)
-        prompt_parts.append(GUIDELINES_SECTION.format(guidelines=formatted_guidelines))
+    Args:
+        prompt: The system prompt
+        needles: Substrings that must be present
 
-    # Add context section
-    if context:
-        formatted_context = format_context(context)
-        prompt_parts.append(CONTEXT_SECTION.format(context_info=formatted_context))
+    Returns:
+        True if all needles are included
+    """
+    # Longest first so the alternation prefers the most specific match
+    unique = sorted({n for n in needles if n}, key=len, reverse=True)
+    if not unique:
+        return True
 
-    return "\n".join(prompt_parts)
+    pattern = re.compile("|".join(map(re.escape, unique)))
+    found = {m.group(0) for m in pattern.finditer(prompt)}
+    return all(n in prompt for n in unique if n not in found)
 
 
 def check_prompt_includes_memories(prompt: str, memories: list[dict[str, str]]) -> bool:
@@ -300,10 +414,8 @@ def check_prompt_includes_memories(prompt: str, memories: list[dict[str, str]])
     Returns:
         True if all memories are included
     """
-    for memory in memories:
-        if memory["key"] not in prompt or memory["value"] not in prompt:
-            return False
-    return True
+    needles = [part for memory in memories for part in (memory["key"], memory["value"])]
+    return _prompt_includes_all(prompt, needles)
 
 
 def check_prompt_includes_guidelines(prompt: str, guidelines: list[str]) -> bool:
@@ -317,7 +429,4 @@ def check_prompt_includes_guidelines(prompt: str, guidelines: list[str]) -> bool
     Returns:
         True if all guidelines are included
     """
-    for guideline in guidelines:
-        if guideline not in prompt:
-            return False
-    return True
+    return _prompt_includes_all(prompt, guidelines)
@@ -51,9 +51,14 @@ class AgentState:
     error: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert state to dictionary for serialization."""
+        """
+        Convert state to dictionary for serialization.
+
+        Not used on the request path: the graph runs on a plain dict state
+        built in AESAAgent, so this is only for debugging and logging.
+        """
         return {
-            "messages": [m.dict() for m in self.messages],
+            "messages": [m.model_dump(exclude_none=True) for m in self.messages],
             "user_id": self.user_id,
             "context": self.context.to_dict(),
             "tool_calls_made": self.tool_calls_made,
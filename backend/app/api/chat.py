@@ -2,20 +2,25 @@
 Chat API endpoint for AI agent interaction.
 
 This module provides the POST /api/chat endpoint for processing
-user messages through the LangGraph AI agent.
+user messages through the LangGraph AI agent, and POST /api/chat/stream
+for receiving the reply as Server-Sent Events.
 
 Requirements: 6.3, 6.4
 """
 
+import asyncio
 import logging
+import uuid
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import async_session_maker, get_db
 from app.core.logging import log_system
 from app.agent import (
     AESAAgent,
@@ -26,8 +31,13 @@ from app.agent import (
 from sqlalchemy import select
 from app.models import AssistantSettings
 
-from app.agent.prompt_builder import build_system_prompt
-from app.tools import ALL_TOOLS, set_tool_context
+from app.agent.prompt_builder import build_system_prompt, invalidate_prompt_cache
+from app.tools import (
+    ALL_TOOLS,
+    prompt_changed,
+    reset_tool_context,
+    set_tool_context,
+)
 from langchain_core.messages import SystemMessage
 
 logger = logging.getLogger(__name__)
@@ -39,7 +49,7 @@ class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
 
     message: str = Field(..., min_length=1, max_length=4000, description="User message")
-    user_id: str = Field(..., description="User UUID")
+    user_id: uuid.UUID = Field(..., description="User UUID")
     context: Optional[dict[str, Any]] = Field(
         default=None, description="Optional context"
     )
@@ -67,6 +77,74 @@ class ChatResponse(BaseModel):
 DEFAULT_USER_ID = "00000000-0000-0000-0000-000000000001"
 
 
+# Compiled agents keyed by (base_url, model) so the LangGraph graph and
+# the bound LLM client are built once per configuration, not per request
+_AGENT_CACHE: dict[tuple[Optional[str], Optional[str]], AESAAgent] = {}
+
+
+def get_agent(base_url: Optional[str] = None, model: Optional[str] = None) -> AESAAgent:
+    """
+    Get a cached agent for the given LLM configuration.
+
+    Construction has no await points, so the check-and-insert below is
+    atomic with respect to other requests on the event loop.
+
+    Args:
+        base_url: Optional LLM endpoint override
+        model: Optional model name override
+
+    Returns:
+        AESAAgent bound to ALL_TOOLS
+    """
+    key = (base_url, model)
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        agent = AESAAgent(tools=ALL_TOOLS, llm_base_url=base_url, llm_model=model)
+        _AGENT_CACHE[key] = agent
+    return agent
+
+
+def _build_agent_context(request: ChatRequest) -> Optional[AgentContext]:
+    """Build the agent context from the optional request context."""
+    if not request.context:
+        return None
+
+    return AgentContext(
+        current_task_id=request.context.get("current_task_id"),
+        current_task_title=request.context.get("current_task_title"),
+        active_subject=request.context.get("active_subject"),
+        preferences=request.context.get("preferences", {}),
+    )
+
+
+async def _load_assistant_settings(
+    db: AsyncSession, user_id: uuid.UUID
+) -> Optional[AssistantSettings]:
+    """Load per-user assistant settings, or None if absent or unreadable."""
+    try:
+        result = await db.execute(
+            select(AssistantSettings).where(AssistantSettings.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+    except Exception:
+        return None
+
+
+async def _load_prompt_and_settings(
+    db: AsyncSession, user_id: uuid.UUID, context: Optional[AgentContext]
+) -> tuple[str, Optional[AssistantSettings]]:
+    """
+    Build the system prompt and load assistant settings.
+
+    Both use the request session, which cannot run statements
+    concurrently, so they are awaited in turn here while the caller
+    overlaps this coroutine with the (HTTP) LLM health check.
+    """
+    system_prompt = await build_system_prompt(db, user_id, context)
+    assistant_settings = await _load_assistant_settings(db, user_id)
+    return system_prompt, assistant_settings
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def send_chat_message(
     request: ChatRequest,
@@ -92,8 +170,14 @@ async def send_chat_message(
     )
 
     try:
-        # Check LLM availability first
-        is_available = await check_llm_availability()
+        # Build agent context
+        context = _build_agent_context(request)
+
+        # Overlap the LLM health check with the DB preamble
+        is_available, (system_prompt, assistant_settings) = await asyncio.gather(
+            check_llm_availability(),
+            _load_prompt_and_settings(db, request.user_id, context),
+        )
         if not is_available:
             log_system("warning", "LLM service unavailable, returning fallback")
             return ChatResponse(
@@ -105,38 +189,10 @@ async def send_chat_message(
         # Set tool context for database operations
         set_tool_context(request.user_id, db)
 
-        # Build agent context
-        context = None
-        if request.context:
-            context = AgentContext(
-                current_task_id=request.context.get("current_task_id"),
-                current_task_title=request.context.get("current_task_title"),
-                active_subject=request.context.get("active_subject"),
-                preferences=request.context.get("preferences", {}),
-            )
-
-        # Build system prompt with user memories and guidelines
-        system_prompt = await build_system_prompt(db, request.user_id, context)
-
-        # Load per-user assistant settings (if present)
-        assistant_settings = None
-        try:
-            import uuid
-
-            settings_result = await db.execute(
-                select(AssistantSettings).where(
-                    AssistantSettings.user_id == uuid.UUID(request.user_id)
-                )
-            )
-            assistant_settings = settings_result.scalar_one_or_none()
-        except Exception:
-            assistant_settings = None
-
-        # Create agent with all tools
-        agent = AESAAgent(
-            tools=ALL_TOOLS,
-            llm_base_url=getattr(assistant_settings, "base_url", None),
-            llm_model=getattr(assistant_settings, "model", None),
+        # Reuse the compiled agent for this LLM configuration
+        agent = get_agent(
+            base_url=getattr(assistant_settings, "base_url", None),
+            model=getattr(assistant_settings, "model", None),
         )
 
         # Build message history with system prompt
@@ -148,18 +204,19 @@ async def send_chat_message(
             user_id=request.user_id,
             context=context,
             history=history,
+            assume_available=True,
         )
 
-        # Extract tool call information
-        tool_calls = []
-        for tc in result.get("tool_calls", []):
-            if isinstance(tc, dict):
-                tool_calls.append(
-                    ToolCallInfo(
-                        name=tc.get("name", "unknown"),
-                        arguments=tc.get("args", {}),
-                    )
-                )
+        # Extract tool call information; LangChain already parsed these
+        # into name/args dicts, so skip re-validating each one
+        tool_calls = [
+            ToolCallInfo.model_construct(
+                name=tc.get("name", "unknown"),
+                arguments=tc.get("args", {}),
+            )
+            for tc in result.get("tool_calls", [])
+            if isinstance(tc, dict)
+        ]
 
         # Log the interaction
         log_system(
@@ -173,6 +230,8 @@ async def send_chat_message(
 
         # Commit any database changes from tool calls
         await db.commit()
+        if prompt_changed():
+            invalidate_prompt_cache(request.user_id)
 
         return ChatResponse(
             content=result.get("content", ""),
@@ -183,7 +242,7 @@ async def send_chat_message(
     except Exception as e:
         logger.error(f"Chat processing failed: {e}")
         log_system(
-            "error", f"Chat processing failed: {e}", {"user_id": request.user_id}
+            "error", f"Chat processing failed: {e}", {"user_id": str(request.user_id)}
         )
 
         # Rollback any partial changes
@@ -196,6 +255,131 @@ async def send_chat_message(
         )
 
 
+def _sse(event: dict[str, Any]) -> str:
+    """Encode an event as a Server-Sent Events data frame."""
+    return f"data: {orjson.dumps(event, default=str).decode()}\n\n"
+
+
+async def _chat_event_stream(request: ChatRequest) -> AsyncIterator[str]:
+    """
+    Run the agent for a chat request and yield SSE frames.
+
+    The stream owns its database session: the response body outlives the
+    request's dependencies, so the get_db session cannot be used here.
+    """
+    async with async_session_maker() as db:
+        tool_context = None
+        try:
+            context = _build_agent_context(request)
+
+            is_available, (system_prompt, assistant_settings) = await asyncio.gather(
+                check_llm_availability(),
+                _load_prompt_and_settings(db, request.user_id, context),
+            )
+            if not is_available:
+                log_system("warning", "LLM service unavailable, returning fallback")
+                yield _sse(
+                    {"type": "token", "content": get_fallback_message(request.message)}
+                )
+                yield _sse(
+                    {
+                        "type": "done",
+                        "error": "LLM service unavailable",
+                        "timestamp": datetime.utcnow().isoformat(),
+                    }
+                )
+                return
+
+            tool_context = set_tool_context(request.user_id, db)
+
+            agent = get_agent(
+                base_url=getattr(assistant_settings, "base_url", None),
+                model=getattr(assistant_settings, "model", None),
+            )
+
+            error = None
+            async for event in agent.stream_message(
+                message=request.message,
+                user_id=request.user_id,
+                context=context,
+                history=[SystemMessage(content=system_prompt)],
+                assume_available=True,
+            ):
+                if event["type"] == "error":
+                    error = event["error"]
+                yield _sse(event)
+
+            # Commit any database changes from tool calls
+            await db.commit()
+            if prompt_changed():
+                invalidate_prompt_cache(request.user_id)
+
+            yield _sse(
+                {
+                    "type": "done",
+                    "error": error,
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Chat streaming failed: {e}")
+            log_system(
+                "error",
+                f"Chat streaming failed: {e}",
+                {"user_id": str(request.user_id)},
+            )
+
+            await db.rollback()
+
+            yield _sse(
+                {
+                    "type": "error",
+                    "content": get_fallback_message(request.message),
+                    "error": str(e),
+                }
+            )
+            yield _sse(
+                {
+                    "type": "done",
+                    "error": str(e),
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+            )
+
+        finally:
+            if tool_context is not None:
+                reset_tool_context(tool_context)
+
+
+@router.post("/chat/stream")
+async def stream_chat_message(request: ChatRequest) -> StreamingResponse:
+    """
+    Send a message to the AI agent and stream the response.
+
+    The reply is sent as Server-Sent Events so tokens reach the client
+    as they are generated. Each frame is a JSON object with a "type":
+    "token", "tool_call", "tool_result", "error", and finally "done".
+
+    Args:
+        request: Chat request with message and user context
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    log_system(
+        "info",
+        f"Chat stream requested by user {request.user_id}",
+        {"message_length": len(request.message)},
+    )
+
+    return StreamingResponse(
+        _chat_event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/chat/status")
 async def get_chat_status() -> dict[str, Any]:
     """
@@ -11,9 +11,12 @@ Requirements: 5.4, 19.1, 19.2, 19.3, 19.4
 
 from enum import Enum
 from typing import Optional, Any
+
+import orjson
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import log_system
 from app.scheduler.bridge import SchedulerError, SchedulerErrorCode
@@ -112,6 +115,37 @@ ERROR_SUGGESTIONS = {
 }
 
 
+# Complete lookup tables built once at import: every member has an entry,
+# so the handlers index them directly instead of falling back per error
+_STATUS_AND_SUGGESTION: dict[ErrorCode, tuple[int, Optional[str]]] = {
+    code: (ERROR_STATUS_MAP.get(code, 500), ERROR_SUGGESTIONS.get(code))
+    for code in ErrorCode
+}
+_SCHED_TO_API: dict[SchedulerErrorCode, ErrorCode] = {
+    code: SCHEDULER_ERROR_MAP.get(code, ErrorCode.INTERNAL_ERROR)
+    for code in SchedulerErrorCode
+}
+
+
+# HTTP status to error code mapping for HTTPException
+HTTP_STATUS_TO_CODE = {
+    400: ErrorCode.BAD_REQUEST,
+    401: ErrorCode.AUTHENTICATION_ERROR,
+    403: ErrorCode.PERMISSION_DENIED,
+    404: ErrorCode.NOT_FOUND,
+    409: ErrorCode.ALREADY_EXISTS,
+    422: ErrorCode.VALIDATION_ERROR,
+    429: ErrorCode.RATE_LIMITED,
+    500: ErrorCode.INTERNAL_ERROR,
+    503: ErrorCode.SERVICE_UNAVAILABLE,
+}
+
+# Dense table covering every HTTP status; unmapped statuses are internal errors
+_CODE_BY_HTTP_STATUS = tuple(
+    HTTP_STATUS_TO_CODE.get(status, ErrorCode.INTERNAL_ERROR) for status in range(600)
+)
+
+
 class APIError(Exception):
     """Custom API error with structured response."""
 
@@ -125,9 +159,10 @@ class APIError(Exception):
     ):
         self.code = code
         self.message = message
-        self.suggestion = suggestion or ERROR_SUGGESTIONS.get(code)
+        default_status, default_suggestion = _STATUS_AND_SUGGESTION[code]
+        self.suggestion = suggestion or default_suggestion
         self.context = context or {}
-        self.status_code = status_code or ERROR_STATUS_MAP.get(code, 500)
+        self.status_code = status_code or default_status
         super().__init__(message)
 
     def to_response(self) -> ErrorResponse:
@@ -143,8 +178,21 @@ class APIError(Exception):
         )
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return self.to_response().model_dump()
+        """
+        Convert to dictionary.
+
+        Builds the ErrorResponse shape directly rather than validating and
+        dumping the Pydantic models; use to_response() for a typed object.
+        """
+        return {
+            "success": False,
+            "error": {
+                "code": self.code.value,
+                "message": self.message,
+                "suggestion": self.suggestion,
+                "context": self.context,
+            },
+        }
 
 
 def create_error_response(
@@ -167,19 +215,29 @@ def create_error_response(
         "error": {
             "code": code.value,
             "message": message,
-            "suggestion": suggestion or ERROR_SUGGESTIONS.get(code),
+            "suggestion": suggestion or _STATUS_AND_SUGGESTION[code][1],
             "context": context or {},
         },
     }
 
 
+# Body for unhandled exceptions, encoded once since it never varies
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    create_error_response(
+        code=ErrorCode.INTERNAL_ERROR,
+        message="An unexpected error occurred",
+        suggestion="Please try again. If the problem persists, contact support.",
+    )
+)
+
+
 def handle_scheduler_error(error: SchedulerError) -> dict:
     """
     Convert SchedulerError to standardized error response.
 
     Provides graceful degradation for C engine failures.
     """
-    api_code = SCHEDULER_ERROR_MAP.get(error.code, ErrorCode.INTERNAL_ERROR)
+    api_code = _SCHED_TO_API[error.code]
 
     return create_error_response(
         code=api_code,
@@ -189,23 +247,36 @@ def handle_scheduler_error(error: SchedulerError) -> dict:
     )
 
 
+_LLM_FALLBACK_MESSAGE = (
+    "I'm having trouble connecting to my AI backend right now. "
+    "You can still use the schedule manually:\n"
+    "• Click 'Add Task' to create new tasks\n"
+    "• Drag tasks between columns to reschedule\n"
+    "• Use the timer to track your study sessions\n\n"
+    "I'll be back online soon!"
+)
+
+
 def handle_llm_fallback(user_message: str) -> str:
     """
     Provide helpful response when LLM is unavailable.
 
-    Graceful degradation for AI assistant failures.
+    Graceful degradation for AI assistant failures. The message does not
+    depend on user_message; the argument is kept for API compatibility.
     """
-    return (
-        "I'm having trouble connecting to my AI backend right now. "
-        "You can still use the schedule manually:\n"
-        "• Click 'Add Task' to create new tasks\n"
-        "• Drag tasks between columns to reschedule\n"
-        "• Use the timer to track your study sessions\n\n"
-        "I'll be back online soon!"
+    return _LLM_FALLBACK_MESSAGE
+
+
+def _json_response(status_code: int, content: dict) -> Response:
+    """Error response with its body encoded by orjson."""
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS),
+        status_code=status_code,
+        media_type="application/json",
     )
 
 
-async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+async def api_error_handler(request: Request, exc: APIError) -> Response:
     """FastAPI exception handler for APIError."""
     log_system(
         "error",
@@ -218,15 +289,10 @@ async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
         },
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=exc.to_dict(),
-    )
+    return _json_response(exc.status_code, exc.to_dict())
 
 
-async def scheduler_error_handler(
-    request: Request, exc: SchedulerError
-) -> JSONResponse:
+async def scheduler_error_handler(request: Request, exc: SchedulerError) -> Response:
     """FastAPI exception handler for SchedulerError."""
     log_system(
         "error",
@@ -240,44 +306,31 @@ async def scheduler_error_handler(
     )
 
     response = handle_scheduler_error(exc)
-    status_code = ERROR_STATUS_MAP.get(
-        SCHEDULER_ERROR_MAP.get(exc.code, ErrorCode.INTERNAL_ERROR),
-        500,
-    )
+    status_code = _STATUS_AND_SUGGESTION[_SCHED_TO_API[exc.code]][0]
 
-    return JSONResponse(
-        status_code=status_code,
-        content=response,
-    )
+    return _json_response(status_code, response)
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """FastAPI exception handler for HTTPException."""
     # Map HTTP status to error code
-    status_to_code = {
-        400: ErrorCode.BAD_REQUEST,
-        401: ErrorCode.AUTHENTICATION_ERROR,
-        403: ErrorCode.PERMISSION_DENIED,
-        404: ErrorCode.NOT_FOUND,
-        409: ErrorCode.ALREADY_EXISTS,
-        422: ErrorCode.VALIDATION_ERROR,
-        429: ErrorCode.RATE_LIMITED,
-        500: ErrorCode.INTERNAL_ERROR,
-        503: ErrorCode.SERVICE_UNAVAILABLE,
-    }
-
-    code = status_to_code.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
+    status = exc.status_code
+    code = (
+        _CODE_BY_HTTP_STATUS[status]
+        if 0 <= status < len(_CODE_BY_HTTP_STATUS)
+        else ErrorCode.INTERNAL_ERROR
+    )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=create_error_response(
+    return _json_response(
+        exc.status_code,
+        create_error_response(
             code=code,
             message=str(exc.detail),
         ),
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """FastAPI exception handler for unhandled exceptions."""
     log_system(
         "error",
@@ -289,19 +342,61 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         },
     )
 
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content=create_error_response(
-            code=ErrorCode.INTERNAL_ERROR,
-            message="An unexpected error occurred",
-            suggestion="Please try again. If the problem persists, contact support.",
-        ),
+        media_type="application/json",
     )
 
 
+class ErrorHandlingMiddleware:
+    """
+    Pure ASGI middleware turning APIError, SchedulerError and unhandled
+    exceptions into structured error responses.
+
+    One try/except around the app replaces a separate exception handler
+    registration per error type.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Too late to send an error response once headers are out
+            if response_started:
+                raise
+
+            request = Request(scope)
+            if isinstance(exc, APIError):
+                response = await api_error_handler(request, exc)
+            elif isinstance(exc, SchedulerError):
+                response = await scheduler_error_handler(request, exc)
+            else:
+                response = await generic_exception_handler(request, exc)
+            await response(scope, receive, send)
+
+
 def register_error_handlers(app: Any) -> None:
-    """Register all error handlers with the FastAPI app."""
-    app.add_exception_handler(APIError, api_error_handler)
-    app.add_exception_handler(SchedulerError, scheduler_error_handler)
+    """
+    Register error handling with the FastAPI app.
+
+    HTTPException keeps a regular exception handler because Starlette's
+    ExceptionMiddleware converts it before it can reach any middleware.
+    """
+    app.add_middleware(ErrorHandlingMiddleware)
     app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(Exception, generic_exception_handler)
@@ -14,7 +14,8 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from sqlalchemy import select, and_, func
+from sqlalchemy import Integer, String, bindparam, select, update, and_, case, func, or_
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -33,22 +34,41 @@ from app.api.schedule import get_current_user
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
+# list_goals filters with NULL-tolerant bind parameters, so the statements
+# below are built once and compile to the same SQL for every request
+_STATUS_PARAM = bindparam("status", type_=String)
+_CATEGORY_PARAM = bindparam("category_id", type_=PG_UUID(as_uuid=True))
+_LIST_GOALS_FILTERS = (
+    StudyGoal.user_id == bindparam("user_id", type_=PG_UUID(as_uuid=True)),
+    or_(_STATUS_PARAM.is_(None), StudyGoal.status == _STATUS_PARAM),
+    or_(_CATEGORY_PARAM.is_(None), StudyGoal.category_id == _CATEGORY_PARAM),
+)
+
+# Total count rides along on every row via a window function
+_LIST_GOALS_QUERY = (
+    select(StudyGoal, func.count().over().label("total"))
+    .where(*_LIST_GOALS_FILTERS)
+    .order_by(StudyGoal.created_at.desc())
+    .offset(bindparam("offset", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+
+_COUNT_GOALS_QUERY = select(func.count(StudyGoal.id)).where(*_LIST_GOALS_FILTERS)
+
+
 def _goal_to_schema(goal: StudyGoal) -> GoalSchema:
-    """Convert StudyGoal model to schema."""
-    return GoalSchema(
-        id=goal.id,
-        title=goal.title,
-        description=goal.description,
-        target_value=goal.target_value,
-        current_value=goal.current_value,
-        unit=goal.unit,
-        deadline=goal.deadline,
-        status=goal.status,
-        progress_percent=goal.progress_percent,
-        category_id=goal.category_id,
-        created_at=goal.created_at,
-        updated_at=goal.updated_at,
-    )
+    """Convert StudyGoal model to schema (GoalSchema reads attributes)."""
+    return GoalSchema.model_validate(goal)
+
+
+async def _get_user_goal(
+    db: AsyncSession, goal_id: UUID, user_id: UUID
+) -> Optional[StudyGoal]:
+    """Fetch a goal by primary key, or None if it doesn't belong to the user."""
+    goal = await db.get(StudyGoal, goal_id)
+    if goal is None or goal.user_id != user_id:
+        return None
+    return goal
 
 
 @router.get("", response_model=GoalListResponse)
@@ -67,30 +87,30 @@ async def list_goals(
 
     Returns goals with optional filtering by status and category.
     """
-    query = select(StudyGoal).where(StudyGoal.user_id == user.id)
-
-    if status:
-        query = query.where(StudyGoal.status == status)
-
-    if category_id:
-        query = query.where(StudyGoal.category_id == category_id)
-
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(StudyGoal.id)).where(StudyGoal.user_id == user.id)
-    )
-    total = count_result.scalar() or 0
-
-    # Execute with pagination
-    query = query.order_by(StudyGoal.created_at.desc())
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    goals = result.scalars().all()
+    params = {
+        "user_id": user.id,
+        "status": status or None,
+        "category_id": category_id,
+        "offset": offset,
+        "limit": limit,
+    }
+
+    result = await db.execute(_LIST_GOALS_QUERY, params)
+    rows = result.all()
+
+    goals = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page is past the end, so no row carried the total
+        count_result = await db.execute(_COUNT_GOALS_QUERY, params)
+        total = count_result.scalar() or 0
+    else:
+        total = 0
 
     return GoalListResponse(
         success=True,
-        goals=[_goal_to_schema(g) for g in goals],
+        goals=[GoalSchema.model_validate(g) for g in goals],
         total=total,
     )
 
@@ -117,9 +137,10 @@ async def create_goal(
         status=GoalStatus.ACTIVE.value,
     )
 
+    # id and timestamps come back with the INSERT (RETURNING), and the
+    # session doesn't expire on commit, so no refresh is needed
     db.add(goal)
     await db.commit()
-    await db.refresh(goal)
 
     return _goal_to_schema(goal)
 
@@ -133,15 +154,7 @@ async def get_goal(
     """
     Get a specific goal by ID.
     """
-    result = await db.execute(
-        select(StudyGoal).where(
-            and_(
-                StudyGoal.id == goal_id,
-                StudyGoal.user_id == user.id,
-            )
-        )
-    )
-    goal = result.scalar_one_or_none()
+    goal = await _get_user_goal(db, goal_id, user.id)
 
     if not goal:
         raise HTTPException(
@@ -165,33 +178,47 @@ async def update_goal_progress(
     Updates the current progress value for a goal.
     Automatically marks goal as completed if target is reached.
     """
+    # Apply StudyGoal.update_progress in a single UPDATE ... RETURNING
     result = await db.execute(
-        select(StudyGoal).where(
+        update(StudyGoal)
+        .where(
             and_(
                 StudyGoal.id == goal_id,
                 StudyGoal.user_id == user.id,
+                StudyGoal.status == GoalStatus.ACTIVE.value,
             )
         )
+        .values(
+            current_value=request.progress,
+            status=case(
+                (
+                    and_(
+                        StudyGoal.target_value.is_not(None),
+                        StudyGoal.target_value != 0,
+                        StudyGoal.target_value <= request.progress,
+                    ),
+                    GoalStatus.COMPLETED.value,
+                ),
+                else_=StudyGoal.status,
+            ),
+        )
+        .returning(StudyGoal)
     )
     goal = result.scalar_one_or_none()
 
     if not goal:
-        raise HTTPException(
-            status_code=404,
-            detail="Goal not found",
-        )
-
-    if goal.status != GoalStatus.ACTIVE.value:
+        # Nothing updated: tell a missing goal apart from a non-active one
+        if await _get_user_goal(db, goal_id, user.id) is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Goal not found",
+            )
         raise HTTPException(
             status_code=400,
             detail="Cannot update progress on non-active goal",
         )
 
-    # Update progress
-    goal.update_progress(request.progress)
-
     await db.commit()
-    await db.refresh(goal)
 
     return _goal_to_schema(goal)
 
@@ -206,26 +233,46 @@ async def get_goal_stats(
 
     Returns aggregated statistics about user's goals.
     """
-    # Get all goals
-    result = await db.execute(select(StudyGoal).where(StudyGoal.user_id == user.id))
-    goals = result.scalars().all()
+    # Same formula as StudyGoal.progress_percent, evaluated in SQL
+    progress_percent = case(
+        (
+            or_(StudyGoal.target_value.is_(None), StudyGoal.target_value == 0),
+            0.0,
+        ),
+        else_=func.least(
+            100.0,
+            func.coalesce(StudyGoal.current_value, 0.0) / StudyGoal.target_value * 100,
+        ),
+    )
+
+    # One row per status instead of every goal
+    result = await db.execute(
+        select(
+            StudyGoal.status,
+            func.count().label("n"),
+            func.avg(progress_percent).label("avg_progress"),
+        )
+        .where(StudyGoal.user_id == user.id)
+        .group_by(StudyGoal.status)
+    )
+    by_status = {row.status: row for row in result}
+
+    def _count(status: GoalStatus) -> int:
+        row = by_status.get(status.value)
+        return row.n if row else 0
 
-    total = len(goals)
-    active = sum(1 for g in goals if g.status == GoalStatus.ACTIVE.value)
-    completed = sum(1 for g in goals if g.status == GoalStatus.COMPLETED.value)
-    abandoned = sum(1 for g in goals if g.status == GoalStatus.ABANDONED.value)
+    total = sum(row.n for row in by_status.values())
+    active = _count(GoalStatus.ACTIVE)
+    completed = _count(GoalStatus.COMPLETED)
+    abandoned = _count(GoalStatus.ABANDONED)
 
     # Calculate completion rate
     finished = completed + abandoned
     completion_rate = (completed / finished * 100) if finished > 0 else 0.0
 
-    # Calculate average progress of active goals
-    active_goals = [g for g in goals if g.status == GoalStatus.ACTIVE.value]
-    avg_progress = (
-        sum(g.progress_percent for g in active_goals) / len(active_goals)
-        if active_goals
-        else 0.0
-    )
+    # Average progress of active goals
+    active_row = by_status.get(GoalStatus.ACTIVE.value)
+    avg_progress = float(active_row.avg_progress or 0.0) if active_row else 0.0
 
     return GoalSummaryResponse(
         success=True,
@@ -249,15 +296,7 @@ async def delete_goal(
     """
     Delete a goal.
     """
-    result = await db.execute(
-        select(StudyGoal).where(
-            and_(
-                StudyGoal.id == goal_id,
-                StudyGoal.user_id == user.id,
-            )
-        )
-    )
-    goal = result.scalar_one_or_none()
+    goal = await _get_user_goal(db, goal_id, user.id)
 
     if not goal:
         raise HTTPException(
@@ -281,12 +320,15 @@ async def abandon_goal(
     Mark a goal as abandoned.
     """
     result = await db.execute(
-        select(StudyGoal).where(
+        update(StudyGoal)
+        .where(
             and_(
                 StudyGoal.id == goal_id,
                 StudyGoal.user_id == user.id,
             )
         )
+        .values(status=GoalStatus.ABANDONED.value)
+        .returning(StudyGoal)
     )
     goal = result.scalar_one_or_none()
 
@@ -296,9 +338,6 @@ async def abandon_goal(
             detail="Goal not found",
         )
 
-    goal.status = GoalStatus.ABANDONED.value
-
     await db.commit()
-    await db.refresh(goal)
 
     return _goal_to_schema(goal)
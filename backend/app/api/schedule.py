@@ -11,17 +11,21 @@ Implements:
 Requirements: 5.1, 10.4
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, time
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models import User, UserPreferences, Task
+from app.scheduler.analytics import today_midnight
 from app.scheduler.service import SchedulerService, DaySchedule
 from app.scheduler.bridge import SchedulerError, TaskInput
+from app.scheduler.priority import effective_priority_expr
 from app.api.schemas import (
     DayScheduleSchema,
     WeekScheduleSchema,
@@ -38,9 +42,22 @@ from app.api.schemas import (
 router = APIRouter(prefix="/schedule", tags=["schedule"])
 
 
-# Temporary: Get or create a default user for development
-async def get_current_user(db: AsyncSession = Depends(get_db)) -> User:
-    """Get current user (placeholder for auth)."""
+# Id of the development user, remembered after the first lookup so later
+# requests resolve it with a primary-key get instead of a LIMIT 1 scan
+_cached_user_id: Optional[UUID] = None
+
+
+async def _load_current_user(db: AsyncSession) -> User:
+    """Load the development user, creating it on first use."""
+    global _cached_user_id
+
+    if _cached_user_id is not None:
+        user = await db.get(User, _cached_user_id)
+        if user is not None:
+            return user
+        # The cached user was deleted; look it up again
+        _cached_user_id = None
+
     result = await db.execute(select(User).limit(1))
     user = result.scalar_one_or_none()
 
@@ -54,15 +71,54 @@ async def get_current_user(db: AsyncSession = Depends(get_db)) -> User:
         await db.commit()
         await db.refresh(user)
 
+    _cached_user_id = user.id
+    return user
+
+
+# Temporary: Get or create a default user for development
+async def get_current_user(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get current user (placeholder for auth).
+
+    The user is kept on request.state, so it is loaded at most once per
+    request however many dependencies ask for it.
+    """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        user = await _load_current_user(db)
+        request.state.user = user
     return user
 
 
+async def get_current_user_id(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> UUID:
+    """
+    Get the current user's id (placeholder for auth).
+
+    For endpoints that only need the id: once the user is known no query
+    is made, where get_current_user would still load the row.
+    """
+    if _cached_user_id is not None:
+        return _cached_user_id
+
+    user = await get_current_user(request, db)
+    return user.id
+
+
 def _convert_day_schedule(schedule: DaySchedule) -> DayScheduleSchema:
-    """Convert internal DaySchedule to API schema."""
-    return DayScheduleSchema(
+    """
+    Convert internal DaySchedule to API schema.
+
+    The scheduler's dataclasses already hold correctly typed values, so the
+    schemas are built with model_construct to skip per-field validation.
+    """
+    return DayScheduleSchema.model_construct(
         date=schedule.date.date(),
         blocks=[
-            TimeBlockSchema(
+            TimeBlockSchema.model_construct(
                 title=getattr(b, "title", b.block_type),
                 block_type=b.block_type,
                 start_time=b.start_time,
@@ -72,7 +128,7 @@ def _convert_day_schedule(schedule: DaySchedule) -> DayScheduleSchema:
             for b in schedule.blocks
         ],
         gaps=[
-            GapSchema(
+            GapSchema.model_construct(
                 start_time=g.start_time,
                 end_time=g.end_time,
                 duration_minutes=g.duration_minutes,
@@ -83,7 +139,7 @@ def _convert_day_schedule(schedule: DaySchedule) -> DayScheduleSchema:
             for g in schedule.gaps
         ],
         classes=[
-            TimetableEntrySchema(
+            TimetableEntrySchema.model_construct(
                 subject_code=c.subject_code,
                 subject_name=c.subject_name,
                 class_type=c.class_type.value,
@@ -93,7 +149,7 @@ def _convert_day_schedule(schedule: DaySchedule) -> DayScheduleSchema:
             )
             for c in schedule.classes
         ],
-        stats=DayStatsSchema(
+        stats=DayStatsSchema.model_construct(
             total_study_minutes=schedule.total_study_minutes,
             deep_work_minutes=schedule.deep_work_minutes,
             has_deep_work_opportunity=schedule.has_deep_work_opportunity,
@@ -102,6 +158,30 @@ def _convert_day_schedule(schedule: DaySchedule) -> DayScheduleSchema:
     )
 
 
+def _deadline_slot(
+    deadline: Optional[datetime], start_ordinal: int, num_days: int
+) -> int:
+    """
+    Convert a task deadline to a 30-minute slot index for the C engine.
+
+    Args:
+        deadline: Task deadline, if any
+        start_ordinal: Proleptic ordinal of the first scheduled day
+        num_days: Number of days being optimized
+
+    Returns:
+        Slot index (48 per day), or -1 if there is no deadline in range
+    """
+    if deadline is None:
+        return -1
+
+    days_until = deadline.toordinal() - start_ordinal
+    if not 0 <= days_until < num_days:
+        return -1
+
+    return days_until * 48 + deadline.hour * 2 + deadline.minute // 30
+
+
 @router.get("/today", response_model=DayScheduleSchema)
 async def get_today_schedule(
     db: AsyncSession = Depends(get_db),
@@ -117,7 +197,7 @@ async def get_today_schedule(
     - Daily statistics
     """
     service = SchedulerService(db)
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = today_midnight()
 
     schedule = await service.get_day_schedule(user.id, today)
     return _convert_day_schedule(schedule)
@@ -140,9 +220,9 @@ async def get_week_schedule(
     service = SchedulerService(db)
 
     if start_date is None:
-        start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        start_dt = today_midnight()
     else:
-        start_dt = datetime.combine(start_date, datetime.min.time())
+        start_dt = datetime.combine(start_date, time.min)
 
     schedules = await service.get_week_schedule(user.id, start_dt)
 
@@ -168,21 +248,32 @@ async def optimize_schedule(
 
     # Determine start date
     if request.start_date is None:
-        start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        start_dt = today_midnight()
     else:
-        start_dt = datetime.combine(request.start_date, datetime.min.time())
-
-    # Get tasks to optimize
-    query = select(Task).where(
+        start_dt = datetime.combine(request.start_date, time.min)
+
+    # Get tasks to optimize. Only the columns TaskInput needs are selected,
+    # so no ORM instances are built.
+    query = select(
+        Task.title,
+        Task.task_type,
+        Task.duration_minutes,
+        effective_priority_expr().label("effective_priority"),
+        Task.deadline,
+    ).where(
         Task.user_id == user.id,
         ~Task.is_completed,
     )
 
     if request.task_ids:
-        query = query.where(Task.id.in_(request.task_ids))
+        # One array parameter rather than an IN list that changes the SQL
+        # (and the prepared statement) with every list length
+        query = query.where(
+            Task.id == any_(literal(request.task_ids, ARRAY(Task.id.type)))
+        )
 
     result = await db.execute(query)
-    tasks = result.scalars().all()
+    tasks = result.all()
 
     if not tasks:
         return OptimizeScheduleResponse(
@@ -191,32 +282,22 @@ async def optimize_schedule(
             schedule=None,
         )
 
-    # Convert tasks to TaskInput
-    task_inputs = []
-    for i, task in enumerate(tasks):
-        # Calculate deadline slot if deadline exists
-        deadline_slot = -1
-        if task.deadline:
-            days_until = (task.deadline.date() - start_dt.date()).days
-            if days_until >= 0 and days_until < request.num_days:
-                # Convert to slot index
-                deadline_slot = (
-                    days_until * 48
-                    + (task.deadline.hour * 2)
-                    + (task.deadline.minute // 30)
-                )
-
-        task_inputs.append(
-            TaskInput(
-                id=i,
-                name=task.title,
-                type=task.task_type,
-                duration_slots=task.duration_minutes // 30,
-                priority=task.effective_priority,
-                deadline_slot=deadline_slot,
-                is_fixed=False,
-            )
+    # Convert task rows to TaskInput
+    start_ordinal = start_dt.toordinal()
+    task_inputs = [
+        TaskInput(
+            id=i,
+            name=title,
+            type=task_type,
+            duration_slots=duration_minutes // 30,
+            priority=priority,
+            deadline_slot=_deadline_slot(deadline, start_ordinal, request.num_days),
+            is_fixed=False,
         )
+        for i, (title, task_type, duration_minutes, priority, deadline) in enumerate(
+            tasks
+        )
+    ]
 
     try:
         # Run optimization
@@ -265,17 +346,7 @@ async def get_preferences(
         # Return defaults
         return UserPreferencesSchema()
 
-    return UserPreferencesSchema(
-        sleep_start=prefs.sleep_start,
-        sleep_end=prefs.sleep_end,
-        wake_routine_mins=prefs.wake_routine_mins,
-        breakfast_mins=prefs.breakfast_mins,
-        lunch_time=prefs.lunch_time,
-        dinner_time=prefs.dinner_time,
-        max_study_block_mins=prefs.max_study_block_mins,
-        min_break_after_study=prefs.min_break_after_study,
-        preferences=prefs.preferences,
-    )
+    return UserPreferencesSchema.model_validate(prefs, from_attributes=True)
 
 
 @router.put("/preferences", response_model=UserPreferencesSchema)
@@ -290,33 +361,23 @@ async def update_preferences(
     Updates daily routine configuration and study constraints.
     Changes apply to future schedule optimizations.
     """
-    result = await db.execute(
-        select(UserPreferences).where(UserPreferences.user_id == user.id)
-    )
-    prefs = result.scalar_one_or_none()
-
-    if not prefs:
-        # Create new preferences
-        prefs = UserPreferences(user_id=user.id)
-        db.add(prefs)
-
     # Update only provided fields
-    update_data = request.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if value is not None:
-            setattr(prefs, field, value)
+    values = request.model_dump(exclude_unset=True, exclude_none=True)
+
+    # Upsert in one round-trip; omitted columns take their defaults on insert
+    stmt = (
+        pg_insert(UserPreferences)
+        .values(user_id=user.id, **values)
+        .on_conflict_do_update(
+            index_elements=[UserPreferences.user_id],
+            set_={**values, "updated_at": datetime.utcnow()},
+        )
+        .returning(UserPreferences)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    prefs = result.scalar_one()
 
     await db.commit()
-    await db.refresh(prefs)
-
-    return UserPreferencesSchema(
-        sleep_start=prefs.sleep_start,
-        sleep_end=prefs.sleep_end,
-        wake_routine_mins=prefs.wake_routine_mins,
-        breakfast_mins=prefs.breakfast_mins,
-        lunch_time=prefs.lunch_time,
-        dinner_time=prefs.dinner_time,
-        max_study_block_mins=prefs.max_study_block_mins,
-        min_break_after_study=prefs.min_break_after_study,
-        preferences=prefs.preferences,
-    )
+
+    return UserPreferencesSchema.model_validate(prefs, from_attributes=True)
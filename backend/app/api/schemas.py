@@ -1,14 +1,18 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime, date, time
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 from app.models.enums import TaskType
 
 
+# Accepted task/block type strings; pydantic-core checks membership natively
+TaskTypeValue = Literal[tuple(t.value for t in TaskType)]
+
+
 # ============================================================================
 # Base Schemas
 # ============================================================================
@@ -68,6 +72,8 @@ class TimeBlockSchema(BaseModel):
 class DayStatsSchema(BaseModel):
     """Daily statistics."""
 
+    model_config = {"frozen": True}
+
     total_study_minutes: int = 0
     deep_work_minutes: int = 0
     has_deep_work_opportunity: bool = False
@@ -107,6 +113,8 @@ class WeekScheduleSchema(BaseModel):
 class OptimizeScheduleRequest(BaseModel):
     """Request to optimize schedule."""
 
+    model_config = {"extra": "forbid"}
+
     start_date: Optional[date] = None
     num_days: int = Field(default=7, ge=1, le=14)
     task_ids: Optional[list[UUID]] = None
@@ -141,6 +149,8 @@ class UserPreferencesSchema(BaseModel):
 class UpdatePreferencesRequest(BaseModel):
     """Request to update user preferences."""
 
+    model_config = {"extra": "forbid"}
+
     sleep_start: Optional[time] = None
     sleep_end: Optional[time] = None
     wake_routine_mins: Optional[int] = Field(default=None, ge=0, le=120)
@@ -179,50 +189,36 @@ class TaskSchema(BaseModel):
 class CreateTaskRequest(BaseModel):
     """Request to create a task."""
 
+    model_config = {"extra": "forbid"}
+
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    task_type: str = Field(default="study")
+    task_type: TaskTypeValue = Field(default="study")
     duration_minutes: int = Field(..., ge=5, le=480)
     priority: Optional[int] = Field(default=50, ge=0, le=100)
     deadline: Optional[datetime] = None
     subject_id: Optional[UUID] = None
 
-    @field_validator("task_type")
-    @classmethod
-    def validate_task_type(cls, v: str) -> str:
-        valid_types = [t.value for t in TaskType]
-        if v not in valid_types:
-            raise ValueError(f"Invalid task type. Must be one of: {valid_types}")
-        return v
-
 
 class UpdateTaskRequest(BaseModel):
     """Request to update a task."""
 
+    model_config = {"extra": "forbid"}
+
     title: Optional[str] = Field(default=None, min_length=1, max_length=255)
     description: Optional[str] = None
-    task_type: Optional[str] = None
+    task_type: Optional[TaskTypeValue] = None
     duration_minutes: Optional[int] = Field(default=None, ge=5, le=480)
     priority: Optional[int] = Field(default=None, ge=0, le=100)
     deadline: Optional[datetime] = None
     is_completed: Optional[bool] = None
     subject_id: Optional[UUID] = None
 
-    @field_validator("task_type")
-    @classmethod
-    def validate_task_type(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        valid_types = [t.value for t in TaskType]
-        if v not in valid_types:
-            raise ValueError(f"Invalid task type. Must be one of: {valid_types}")
-        return v
-
 
 class TaskFilterParams(BaseModel):
     """Filter parameters for task listing."""
 
-    task_type: Optional[str] = None
+    task_type: Optional[TaskTypeValue] = None
     is_completed: Optional[bool] = None
     subject_id: Optional[UUID] = None
     priority_min: Optional[int] = Field(default=None, ge=0, le=100)
@@ -246,28 +242,24 @@ class TaskListResponse(BaseResponse):
 class CreateTimeBlockRequest(BaseModel):
     """Request to create a time block."""
 
+    model_config = {"extra": "forbid"}
+
     title: str = Field(..., min_length=1, max_length=255)
-    block_type: str = Field(default="study")
+    block_type: TaskTypeValue = Field(default="study")
     start_time: datetime
     end_time: datetime
     is_fixed: bool = False
     task_id: Optional[UUID] = None
     metadata: Optional[dict] = None
 
-    @field_validator("block_type")
-    @classmethod
-    def validate_block_type(cls, v: str) -> str:
-        valid_types = [t.value for t in TaskType]
-        if v not in valid_types:
-            raise ValueError(f"Invalid block type. Must be one of: {valid_types}")
-        return v
-
 
 class UpdateTimeBlockRequest(BaseModel):
     """Request to update/move a time block."""
 
+    model_config = {"extra": "forbid"}
+
     title: Optional[str] = Field(default=None, min_length=1, max_length=255)
-    block_type: Optional[str] = None
+    block_type: Optional[TaskTypeValue] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     is_fixed: Optional[bool] = None
@@ -336,6 +328,8 @@ class StudySessionSchema(BaseModel):
 class TimerAnalyticsSchema(BaseModel):
     """Timer analytics schema."""
 
+    model_config = {"frozen": True}
+
     total_study_minutes: int = 0
     deep_work_minutes: int = 0
     sessions_count: int = 0
@@ -380,6 +374,8 @@ class GoalSchema(BaseModel):
 class CreateGoalRequest(BaseModel):
     """Request to create a goal."""
 
+    model_config = {"extra": "forbid"}
+
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     target_value: Optional[float] = Field(default=None, ge=0)
@@ -391,6 +387,8 @@ class CreateGoalRequest(BaseModel):
 class UpdateGoalProgressRequest(BaseModel):
     """Request to update goal progress."""
 
+    model_config = {"extra": "forbid"}
+
     progress: float = Field(..., ge=0)
 
 
@@ -404,6 +402,8 @@ class GoalListResponse(BaseResponse):
 class GoalStatsSchema(BaseModel):
     """Goal statistics schema."""
 
+    model_config = {"frozen": True}
+
     total_goals: int = 0
     active_goals: int = 0
     completed_goals: int = 0
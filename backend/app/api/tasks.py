@@ -15,26 +15,41 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, delete, desc, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models import User, Task
-from app.scheduler.priority import sort_tasks_by_priority
+from app.scheduler.priority import effective_priority_expr
 from app.api.schemas import (
     TaskSchema,
     TaskListResponse,
     CreateTaskRequest,
     UpdateTaskRequest,
 )
-from app.api.schedule import get_current_user
+from app.api.schedule import get_current_user, get_current_user_id
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Columns list_tasks returns; "priority" is added as the effective priority
+_TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.task_type,
+    Task.duration_minutes,
+    Task.deadline,
+    Task.is_completed,
+    Task.completed_at,
+    Task.subject_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
 
 def _task_to_schema(task: Task) -> TaskSchema:
-    """Convert Task model to schema."""
-    return TaskSchema(
+    """Convert Task model to schema (ORM values are already typed)."""
+    return TaskSchema.model_construct(
         id=task.id,
         title=task.title,
         description=task.description,
@@ -50,6 +65,16 @@ def _task_to_schema(task: Task) -> TaskSchema:
     )
 
 
+async def _get_user_task(
+    db: AsyncSession, task_id: UUID, user_id: UUID
+) -> Optional[Task]:
+    """Fetch a task by primary key, or None if it doesn't belong to the user."""
+    task = await db.get(Task, task_id)
+    if task is None or task.user_id != user_id:
+        return None
+    return task
+
+
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
     task_type: Optional[str] = Query(default=None, description="Filter by task type"),
@@ -72,7 +97,7 @@ async def list_tasks(
     limit: int = Query(default=50, ge=1, le=200, description="Maximum results"),
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> TaskListResponse:
     """
     List tasks with optional filtering.
@@ -81,52 +106,67 @@ async def list_tasks(
     Supports filtering by type, completion status, subject,
     priority range, and deadline range.
     """
-    # Build query
-    query = select(Task).where(Task.user_id == user.id)
+    # Lambda statements cache their compiled SQL per combination of filters,
+    # so only the bound values change between requests
+    count_stmt = lambda_stmt(
+        lambda: select(func.count()).select_from(Task).where(Task.user_id == user_id)
+    )
+    # The page selects plain columns, so no ORM instances are built
+    now = datetime.utcnow()
+    page_stmt = lambda_stmt(
+        lambda: select(
+            *_TASK_LIST_COLUMNS, effective_priority_expr(now).label("priority")
+        ).where(Task.user_id == user_id)
+    )
+
+    criteria = []
 
-    # Apply filters
     if task_type is not None:
-        query = query.where(Task.task_type == task_type)
+        criteria.append(lambda s: s.where(Task.task_type == task_type))
 
     if is_completed is not None:
-        query = query.where(Task.is_completed == is_completed)
+        criteria.append(lambda s: s.where(Task.is_completed == is_completed))
 
     if subject_id is not None:
-        query = query.where(Task.subject_id == subject_id)
+        criteria.append(lambda s: s.where(Task.subject_id == subject_id))
 
     if priority_min is not None:
-        query = query.where(Task.priority >= priority_min)
+        criteria.append(lambda s: s.where(Task.priority >= priority_min))
 
     if priority_max is not None:
-        query = query.where(Task.priority <= priority_max)
+        criteria.append(lambda s: s.where(Task.priority <= priority_max))
 
     if deadline_before is not None:
-        query = query.where(Task.deadline <= deadline_before)
+        criteria.append(lambda s: s.where(Task.deadline <= deadline_before))
 
     if deadline_after is not None:
-        query = query.where(Task.deadline >= deadline_after)
+        criteria.append(lambda s: s.where(Task.deadline >= deadline_after))
 
-    # Get total count
-    count_query = select(Task.id).where(Task.user_id == user.id)
-    if task_type is not None:
-        count_query = count_query.where(Task.task_type == task_type)
-    if is_completed is not None:
-        count_query = count_query.where(Task.is_completed == is_completed)
-
-    count_result = await db.execute(count_query)
-    total = len(count_result.all())
-
-    # Execute query with pagination
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
-    tasks = list(result.scalars().all())
+    # The page query and the count share the filters
+    for criterion in criteria:
+        count_stmt += criterion
+        page_stmt += criterion
 
-    # Sort by priority (descending) - Property 10
-    sorted_tasks = sort_tasks_by_priority(tasks)
+    # Get total count
+    count_result = await db.execute(count_stmt)
+    total = count_result.scalar_one()
+
+    # Execute query with pagination, sorted by effective priority
+    # (descending) in SQL so each page is the right slice - Property 10
+    page_stmt += lambda s: (
+        s.order_by(
+            desc("priority"),
+            Task.deadline.asc().nulls_last(),
+            Task.id,
+        )
+        .offset(offset)
+        .limit(limit)
+    )
+    result = await db.execute(page_stmt)
 
     return TaskListResponse(
         success=True,
-        tasks=[_task_to_schema(t) for t in sorted_tasks],
+        tasks=[TaskSchema.model_construct(**row._mapping) for row in result],
         total=total,
     )
 
@@ -164,20 +204,12 @@ async def create_task(
 async def get_task(
     task_id: UUID = Path(..., description="Task ID"),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> TaskSchema:
     """
     Get a specific task by ID.
     """
-    result = await db.execute(
-        select(Task).where(
-            and_(
-                Task.id == task_id,
-                Task.user_id == user.id,
-            )
-        )
-    )
-    task = result.scalar_one_or_none()
+    task = await _get_user_task(db, task_id, user_id)
 
     if not task:
         raise HTTPException(
@@ -193,20 +225,41 @@ async def update_task(
     task_id: UUID = Path(..., description="Task ID"),
     request: UpdateTaskRequest = None,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> TaskSchema:
     """
     Update a task.
 
     Updates the specified task's properties.
     """
-    result = await db.execute(
-        select(Task).where(
-            and_(
-                Task.id == task_id,
-                Task.user_id == user.id,
+    # Fields that were sent with a value; explicit nulls are ignored
+    values = (
+        request.model_dump(exclude_unset=True, exclude_none=True) if request else {}
+    )
+
+    if not values:
+        # Nothing to change: report the task as-is without a write or commit
+        task = await _get_user_task(db, task_id, user_id)
+        if not task:
+            raise HTTPException(
+                status_code=404,
+                detail="Task not found",
             )
+        return _task_to_schema(task)
+
+    # Handle completion (same as Task.mark_completed)
+    if values.get("is_completed"):
+        values["completed_at"] = datetime.utcnow()
+
+    # Ownership check, update and re-read in one UPDATE ... RETURNING
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.id == task_id,
+            Task.user_id == user_id,
         )
+        .values(**values)
+        .returning(Task)
     )
     task = result.scalar_one_or_none()
 
@@ -216,19 +269,7 @@ async def update_task(
             detail="Task not found",
         )
 
-    if request:
-        update_data = request.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            if value is not None:
-                setattr(task, field, value)
-
-        # Handle completion
-        if "is_completed" in update_data and update_data["is_completed"]:
-            task.mark_completed()
-
     await db.commit()
-    await db.refresh(task)
 
     return _task_to_schema(task)
 
@@ -237,7 +278,7 @@ async def update_task(
 async def delete_task(
     task_id: UUID = Path(..., description="Task ID"),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> dict:
     """
     Delete a task.
@@ -245,22 +286,20 @@ async def delete_task(
     Removes the specified task from the system.
     """
     result = await db.execute(
-        select(Task).where(
-            and_(
-                Task.id == task_id,
-                Task.user_id == user.id,
-            )
+        delete(Task)
+        .where(
+            Task.id == task_id,
+            Task.user_id == user_id,
         )
+        .returning(Task.id)
     )
-    task = result.scalar_one_or_none()
 
-    if not task:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=404,
             detail="Task not found",
         )
 
-    await db.delete(task)
     await db.commit()
 
     return {"success": True, "message": "Task deleted"}
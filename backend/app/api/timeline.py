@@ -11,15 +11,23 @@ Implements:
 Requirements: 5.1
 """
 
-from datetime import datetime, date
+import heapq
+from datetime import datetime, date, time, timedelta
+from operator import attrgetter
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path
-from sqlalchemy import select, and_
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.core.database import get_db
 from app.models import User, TimeBlock
+from app.models.time_block import OVERLAP_CONSTRAINT
+from app.scheduler.analytics import today_midnight
 from app.scheduler.service import SchedulerService
 from app.api.schemas import (
     TimelineResponse,
@@ -29,14 +37,18 @@ from app.api.schemas import (
     UpdateTimeBlockRequest,
     GapSchema,
 )
-from app.api.schedule import get_current_user
+from app.api.schedule import get_current_user, get_current_user_id
 
 router = APIRouter(prefix="/timeline", tags=["timeline"])
 
+# Validators for the scheduler's block and gap lists, built once at import
+_TIME_BLOCK_LIST_ADAPTER = TypeAdapter(list[TimeBlockSchema])
+_GAP_LIST_ADAPTER = TypeAdapter(list[GapSchema])
+
 
 def _time_block_to_schema(block: TimeBlock) -> TimeBlockSchema:
-    """Convert TimeBlock model to schema."""
-    return TimeBlockSchema(
+    """Convert TimeBlock model to schema (ORM values are already typed)."""
+    return TimeBlockSchema.model_construct(
         id=block.id,
         title=block.title,
         block_type=block.block_type,
@@ -44,92 +56,118 @@ def _time_block_to_schema(block: TimeBlock) -> TimeBlockSchema:
         end_time=block.end_time,
         is_fixed=block.is_fixed,
         task_id=block.task_id,
-        metadata=block.block_metadata,
+        metadata=block.metadata_json,
     )
 
 
-@router.get("/today", response_model=TimelineResponse)
-async def get_today_timeline(
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
-) -> TimelineResponse:
-    """
-    Get today's timeline with all blocks and gaps.
+async def _get_user_block(
+    db: AsyncSession, block_id: UUID, user_id: UUID
+) -> Optional[TimeBlock]:
+    """Fetch a time block by primary key, or None if it isn't the user's."""
+    block = await db.get(TimeBlock, block_id)
+    if block is None or block.user_id != user_id:
+        return None
+    return block
 
-    Returns the optimized daily timeline including:
-    - All scheduled time blocks
-    - Available gaps for scheduling
+
+async def _build_timeline(
+    db: AsyncSession, user_id: UUID, day_start: datetime
+) -> TimelineResponse:
     """
-    service = SchedulerService(db)
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    Build the timeline for one day.
 
-    schedule = await service.get_day_schedule(user.id, today)
+    Combines the scheduler's fixed blocks and gaps with the user-created
+    time blocks starting that day.
 
-    # Also get user-created time blocks from database
-    tomorrow = (
-        today + datetime.timedelta(days=1)
-        if hasattr(datetime, "timedelta")
-        else today.replace(day=today.day + 1)
-    )
-    from datetime import timedelta
+    Args:
+        db: Database session
+        user_id: User UUID
+        day_start: Midnight at the start of the day
 
-    tomorrow = today + timedelta(days=1)
+    Returns:
+        Timeline with blocks sorted by start time
+    """
+    service = SchedulerService(db)
+    schedule = await service.get_day_schedule(user_id, day_start)
 
+    # User-created time blocks for the same day
     result = await db.execute(
         select(TimeBlock)
         .where(
-            and_(
-                TimeBlock.user_id == user.id,
-                TimeBlock.start_time >= today,
-                TimeBlock.start_time < tomorrow,
-            )
+            TimeBlock.user_id == user_id,
+            TimeBlock.start_time >= day_start,
+            TimeBlock.start_time < day_start + timedelta(days=1),
         )
         .order_by(TimeBlock.start_time)
     )
     user_blocks = result.scalars().all()
 
-    # Combine system blocks with user blocks
-    all_blocks = [
-        TimeBlockSchema(
-            title=getattr(b, "title", b.block_type),
-            block_type=b.block_type,
-            start_time=b.start_time,
-            end_time=b.end_time,
-            is_fixed=b.is_fixed,
+    # Both lists are already ordered by start time (the scheduler's merged
+    # blocks and the ORDER BY above), so merge them instead of re-sorting.
+    # The scheduler's blocks are validated in one call through a shared
+    # TypeAdapter rather than model by model.
+    system_blocks = _TIME_BLOCK_LIST_ADAPTER.validate_python(
+        [
+            {
+                "title": getattr(b, "title", b.block_type),
+                "block_type": b.block_type,
+                "start_time": b.start_time,
+                "end_time": b.end_time,
+                "is_fixed": b.is_fixed,
+            }
+            for b in schedule.blocks
+        ]
+    )
+    all_blocks = list(
+        heapq.merge(
+            system_blocks,
+            map(_time_block_to_schema, user_blocks),
+            key=attrgetter("start_time"),
         )
-        for b in schedule.blocks
-    ]
-
-    # Add user-created blocks
-    for block in user_blocks:
-        all_blocks.append(_time_block_to_schema(block))
-
-    # Sort by start time
-    all_blocks.sort(key=lambda b: b.start_time)
+    )
 
     return TimelineResponse(
         success=True,
-        date=today.date(),
+        date=day_start.date(),
         blocks=all_blocks,
-        gaps=[
-            GapSchema(
-                start_time=g.start_time,
-                end_time=g.end_time,
-                duration_minutes=g.duration_minutes,
-                gap_type=g.gap_type.value,
-                suggested_task_type=g.suggested_task_type,
-                is_deep_work_opportunity=g.is_deep_work_opportunity,
-            )
-            for g in schedule.gaps
-        ],
+        gaps=_GAP_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "start_time": g.start_time,
+                    "end_time": g.end_time,
+                    "duration_minutes": g.duration_minutes,
+                    "gap_type": g.gap_type.value,
+                    "suggested_task_type": g.suggested_task_type,
+                    "is_deep_work_opportunity": g.is_deep_work_opportunity,
+                }
+                for g in schedule.gaps
+            ]
+        ),
     )
 
 
+@router.get("/today", response_model=TimelineResponse)
+async def get_today_timeline(
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id),
+) -> TimelineResponse:
+    """
+    Get today's timeline with all blocks and gaps.
+
+    Returns the optimized daily timeline including:
+    - All scheduled time blocks
+    - Available gaps for scheduling
+    """
+    today = today_midnight()
+
+    return await _build_timeline(db, user_id, today)
+
+
 @router.get("/{target_date}", response_model=TimelineResponse)
 async def get_timeline_by_date(
     target_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> TimelineResponse:
     """
     Get timeline for a specific date.
@@ -137,62 +175,9 @@ async def get_timeline_by_date(
     Returns the timeline for the specified date including
     all blocks and available gaps.
     """
-    from datetime import timedelta
+    target_dt = datetime.combine(target_date, time.min)
 
-    service = SchedulerService(db)
-    target_dt = datetime.combine(target_date, datetime.min.time())
-
-    schedule = await service.get_day_schedule(user.id, target_dt)
-
-    # Get user-created time blocks
-    next_day = target_dt + timedelta(days=1)
-
-    result = await db.execute(
-        select(TimeBlock)
-        .where(
-            and_(
-                TimeBlock.user_id == user.id,
-                TimeBlock.start_time >= target_dt,
-                TimeBlock.start_time < next_day,
-            )
-        )
-        .order_by(TimeBlock.start_time)
-    )
-    user_blocks = result.scalars().all()
-
-    # Combine blocks
-    all_blocks = [
-        TimeBlockSchema(
-            title=getattr(b, "title", b.block_type),
-            block_type=b.block_type,
-            start_time=b.start_time,
-            end_time=b.end_time,
-            is_fixed=b.is_fixed,
-        )
-        for b in schedule.blocks
-    ]
-
-    for block in user_blocks:
-        all_blocks.append(_time_block_to_schema(block))
-
-    all_blocks.sort(key=lambda b: b.start_time)
-
-    return TimelineResponse(
-        success=True,
-        date=target_date,
-        blocks=all_blocks,
-        gaps=[
-            GapSchema(
-                start_time=g.start_time,
-                end_time=g.end_time,
-                duration_minutes=g.duration_minutes,
-                gap_type=g.gap_type.value,
-                suggested_task_type=g.suggested_task_type,
-                is_deep_work_opportunity=g.is_deep_work_opportunity,
-            )
-            for g in schedule.gaps
-        ],
-    )
+    return await _build_timeline(db, user_id, target_dt)
 
 
 @router.post("/blocks", response_model=TimeBlockResponse)
@@ -214,39 +199,42 @@ async def create_time_block(
             detail="End time must be after start time",
         )
 
-    # Check for overlapping blocks
-    result = await db.execute(
-        select(TimeBlock).where(
-            and_(
-                TimeBlock.user_id == user.id,
-                TimeBlock.start_time < request.end_time,
-                TimeBlock.end_time > request.start_time,
-            )
-        )
-    )
-    existing = result.scalars().first()
-
-    if existing:
-        raise HTTPException(
-            status_code=409,
-            detail=f"Time block overlaps with existing block: {existing.title}",
-        )
-
-    # Create the block
+    # Create the block; overlaps are rejected by the time_blocks_no_overlap
+    # exclusion constraint rather than a separate SELECT beforehand
+    user_id = user.id
     block = TimeBlock(
-        user_id=user.id,
+        user_id=user_id,
         title=request.title,
         block_type=request.block_type,
         start_time=request.start_time,
         end_time=request.end_time,
         is_fixed=request.is_fixed,
         task_id=request.task_id,
-        block_metadata=request.metadata,
+        metadata_json=request.metadata,
     )
 
     db.add(block)
-    await db.commit()
-    await db.refresh(block)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if OVERLAP_CONSTRAINT not in str(e.orig):
+            raise
+
+        result = await db.execute(
+            select(TimeBlock.title)
+            .where(
+                TimeBlock.user_id == user_id,
+                TimeBlock.start_time < request.end_time,
+                TimeBlock.end_time > request.start_time,
+            )
+            .limit(1)
+        )
+        existing_title = result.scalar_one_or_none()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Time block overlaps with existing block: {existing_title}",
+        )
 
     return TimeBlockResponse(
         success=True,
@@ -254,29 +242,26 @@ async def create_time_block(
     )
 
 
-@router.patch("/blocks/{block_id}", response_model=TimeBlockResponse)
-async def update_time_block(
-    block_id: UUID = Path(..., description="Time block ID"),
-    request: UpdateTimeBlockRequest = None,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
-) -> TimeBlockResponse:
+async def _check_block_update(
+    db: AsyncSession, block_id: UUID, user_id: UUID, values: dict
+) -> TimeBlock:
     """
-    Update or move a time block.
+    Re-check the guards of a time block update that changed no row.
 
-    Updates the specified time block's properties or moves it
-    to a new time slot.
+    Raises the HTTP error for the first guard that fails, in the order the
+    endpoint reports them. When there was nothing to update, the unchanged
+    block is returned instead.
+
+    Args:
+        db: Database session
+        block_id: Time block being updated
+        user_id: Owner of the block
+        values: Column values the update tried to set
+
+    Returns:
+        The unchanged time block
     """
-    # Get the block
-    result = await db.execute(
-        select(TimeBlock).where(
-            and_(
-                TimeBlock.id == block_id,
-                TimeBlock.user_id == user.id,
-            )
-        )
-    )
-    block = result.scalar_one_or_none()
+    block = await _get_user_block(db, block_id, user_id)
 
     if not block:
         raise HTTPException(
@@ -290,49 +275,109 @@ async def update_time_block(
             detail="Cannot modify fixed time blocks",
         )
 
-    # Update fields
-    if request:
-        update_data = request.model_dump(exclude_unset=True)
+    if not values:
+        return block
 
-        # Validate time range if both times are being updated
-        new_start = update_data.get("start_time", block.start_time)
-        new_end = update_data.get("end_time", block.end_time)
+    new_start = values.get("start_time", block.start_time)
+    new_end = values.get("end_time", block.end_time)
 
-        if new_end <= new_start:
-            raise HTTPException(
-                status_code=400,
-                detail="End time must be after start time",
-            )
+    if new_end <= new_start:
+        raise HTTPException(
+            status_code=400,
+            detail="End time must be after start time",
+        )
+
+    result = await db.execute(
+        select(TimeBlock.title)
+        .where(
+            TimeBlock.user_id == user_id,
+            TimeBlock.id != block_id,
+            TimeBlock.start_time < new_end,
+            TimeBlock.end_time > new_start,
+        )
+        .limit(1)
+    )
+    overlapping = result.scalar_one_or_none()
+
+    raise HTTPException(
+        status_code=409,
+        detail=(
+            f"New time range overlaps with: {overlapping}"
+            if overlapping is not None
+            else "Time block was modified concurrently"
+        ),
+    )
+
+
+@router.patch("/blocks/{block_id}", response_model=TimeBlockResponse)
+async def update_time_block(
+    block_id: UUID = Path(..., description="Time block ID"),
+    request: UpdateTimeBlockRequest = None,
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id),
+) -> TimeBlockResponse:
+    """
+    Update or move a time block.
 
-        # Check for overlaps with other blocks
-        if "start_time" in update_data or "end_time" in update_data:
-            result = await db.execute(
-                select(TimeBlock).where(
-                    and_(
-                        TimeBlock.user_id == user.id,
-                        TimeBlock.id != block_id,
-                        TimeBlock.start_time < new_end,
-                        TimeBlock.end_time > new_start,
-                    )
-                )
+    Updates the specified time block's properties or moves it
+    to a new time slot.
+    """
+    # Fields that were sent with a value; explicit nulls are ignored
+    values = (
+        request.model_dump(exclude_unset=True, exclude_none=True) if request else {}
+    )
+    if "metadata" in values:
+        values["metadata_json"] = values.pop("metadata")
+
+    if not values:
+        # Nothing to change: _check_block_update returns the block after the
+        # 404 / fixed-block checks, and there is nothing to commit
+        block = await _check_block_update(db, block_id, user_id, values)
+        return TimeBlockResponse(
+            success=True,
+            block=_time_block_to_schema(block),
+        )
+
+    # Guards (ownership, not fixed, valid range, no overlap) go in the
+    # WHERE clause so the update is a single UPDATE ... RETURNING
+    new_start = values.get("start_time", TimeBlock.start_time)
+    new_end = values.get("end_time", TimeBlock.end_time)
+    conditions = [
+        TimeBlock.id == block_id,
+        TimeBlock.user_id == user_id,
+        TimeBlock.is_fixed.is_not(True),
+        new_end > new_start,
+    ]
+
+    if "start_time" in values or "end_time" in values:
+        other = aliased(TimeBlock)
+        conditions.append(
+            ~exists().where(
+                other.user_id == user_id,
+                other.id != block_id,
+                other.start_time < new_end,
+                other.end_time > new_start,
             )
-            existing = result.scalars().first()
+        )
 
-            if existing:
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"New time range overlaps with: {existing.title}",
-                )
+    try:
+        result = await db.execute(
+            update(TimeBlock).where(*conditions).values(**values).returning(TimeBlock)
+        )
+        block = result.scalar_one_or_none()
+    except IntegrityError as e:
+        # A concurrent write overlapped after the WHERE check; the exclusion
+        # constraint caught it, and the guards below report the 409
+        await db.rollback()
+        if OVERLAP_CONSTRAINT not in str(e.orig):
+            raise
+        block = None
 
-        for field, value in update_data.items():
-            if value is not None:
-                if field == "metadata":
-                    setattr(block, "block_metadata", value)
-                else:
-                    setattr(block, field, value)
+    if not block:
+        # Nothing updated: re-check the guards in order to report why
+        await _check_block_update(db, block_id, user_id, values)
 
     await db.commit()
-    await db.refresh(block)
 
     return TimeBlockResponse(
         success=True,
@@ -344,23 +389,14 @@ async def update_time_block(
 async def delete_time_block(
     block_id: UUID = Path(..., description="Time block ID"),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> dict:
     """
     Delete a time block from the schedule.
 
     Removes the specified time block. Fixed blocks cannot be deleted.
     """
-    # Get the block
-    result = await db.execute(
-        select(TimeBlock).where(
-            and_(
-                TimeBlock.id == block_id,
-                TimeBlock.user_id == user.id,
-            )
-        )
-    )
-    block = result.scalar_one_or_none()
+    block = await _get_user_block(db, block_id, user_id)
 
     if not block:
         raise HTTPException(
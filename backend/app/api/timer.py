@@ -14,9 +14,11 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import delete, exists, func, insert, literal, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.database import get_db
 from app.models import User, Subject, StudySession, ActiveTimer
@@ -28,44 +30,90 @@ from app.api.schemas import (
     TimerAnalyticsResponse,
     StudySessionSchema,
 )
-from app.api.schedule import get_current_user
+from app.api.schedule import get_current_user, get_current_user_id
+from app.scheduler.analytics import AnalyticsCache, analytics_cache, calculate_streak
 
 router = APIRouter(prefix="/timer", tags=["timer"])
 
+# How long a timer state is served from memory before it is read again;
+# bounds how stale it gets after changes made elsewhere (e.g. a subject
+# renamed or deleted)
+TIMER_STATUS_CACHE_TTL_SECONDS = 30.0
+
+# Running timer per user, keyed (user_id,), as (subject_id, subject_code,
+# started_at), or _IDLE when no timer is running. Start and stop update it,
+# so status polls only touch the database once per TTL.
+_IDLE: tuple = ()
+_timer_states = AnalyticsCache(TIMER_STATUS_CACHE_TTL_SECONDS)
+
+
+def invalidate_timer_status(user_id: UUID) -> None:
+    """Forget the cached timer state after a start or stop outside this module."""
+    _timer_states.invalidate(user_id)
+
+
+def _timer_status_etag(status: TimerStatusSchema) -> str:
+    """ETag for a status body; changes with the timer, subject and elapsed minute."""
+    if not status.is_running:
+        return '"idle"'
+    return (
+        f'"{status.started_at.isoformat()}/{status.subject_code or ""}'
+        f'/{status.elapsed_minutes}"'
+    )
+
 
 @router.get("/status", response_model=TimerStatusSchema)
 async def get_timer_status(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ) -> TimerStatusSchema:
     """
     Get current timer status.
 
-    Returns whether a timer is running and its details.
+    Returns whether a timer is running and its details. Polling clients
+    can send the ETag back in If-None-Match to get a 304 while nothing
+    has changed.
     """
-    result = await db.execute(select(ActiveTimer).where(ActiveTimer.user_id == user.id))
-    timer = result.scalar_one_or_none()
-
-    if not timer:
-        return TimerStatusSchema(is_running=False)
+    state = _timer_states.get((user_id,))
+    if state is None:
+        # The subject comes back in the same query through a LEFT OUTER JOIN
+        result = await db.execute(
+            select(ActiveTimer)
+            .where(ActiveTimer.user_id == user_id)
+            .options(joinedload(ActiveTimer.subject))
+        )
+        timer = result.scalar_one_or_none()
+        state = (
+            (
+                timer.subject_id,
+                timer.subject.code if timer.subject else None,
+                timer.started_at,
+            )
+            if timer
+            else _IDLE
+        )
+        _timer_states.set((user_id,), state)
 
-    # Get subject code if subject is set
-    subject_code = None
-    if timer.subject_id:
-        subject_result = await db.execute(
-            select(Subject).where(Subject.id == timer.subject_id)
+    if not state:
+        status = TimerStatusSchema(is_running=False)
+    else:
+        subject_id, subject_code, started_at = state
+        status = TimerStatusSchema(
+            is_running=True,
+            subject_id=subject_id,
+            subject_code=subject_code,
+            started_at=started_at,
+            elapsed_minutes=int((datetime.utcnow() - started_at).total_seconds() / 60),
         )
-        subject = subject_result.scalar_one_or_none()
-        if subject:
-            subject_code = subject.code
 
-    return TimerStatusSchema(
-        is_running=True,
-        subject_id=timer.subject_id,
-        subject_code=subject_code,
-        started_at=timer.started_at,
-        elapsed_minutes=timer.elapsed_minutes,
-    )
+    etag = _timer_status_etag(status)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return status
 
 
 @router.post("/start", response_model=TimerStatusSchema)
@@ -80,53 +128,57 @@ async def start_timer(
     Starts a new timer for the current user. Only one timer
     can be active at a time.
     """
-    # Check if timer already running
-    result = await db.execute(select(ActiveTimer).where(ActiveTimer.user_id == user.id))
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="Timer already running. Stop it first.",
-        )
-
-    # Validate subject if provided
-    subject_code = None
     subject_id = request.subject_id if request else None
-
+    started_at = datetime.utcnow()
+
+    # One INSERT ... SELECT does all the checks: ON CONFLICT skips the row if
+    # a timer is already running (user_id is the primary key), the WHERE
+    # skips it if the subject isn't the user's, and RETURNING reads the
+    # subject code
+    source = select(
+        literal(user.id, ActiveTimer.user_id.type),
+        literal(subject_id, ActiveTimer.subject_id.type),
+        literal(started_at, ActiveTimer.started_at.type),
+    )
     if subject_id:
-        subject_result = await db.execute(
-            select(Subject).where(
-                and_(
-                    Subject.id == subject_id,
-                    Subject.user_id == user.id,
-                )
-            )
+        source = source.where(
+            exists().where(Subject.id == subject_id, Subject.user_id == user.id)
         )
-        subject = subject_result.scalar_one_or_none()
-        if not subject:
-            raise HTTPException(
-                status_code=404,
-                detail="Subject not found",
-            )
-        subject_code = subject.code
 
-    # Create active timer
-    timer = ActiveTimer(
-        user_id=user.id,
-        subject_id=subject_id,
-        started_at=datetime.utcnow(),
+    subject_code = (
+        select(Subject.code).where(Subject.id == subject_id).scalar_subquery()
+        if subject_id
+        else null()
+    )
+    result = await db.execute(
+        pg_insert(ActiveTimer)
+        .from_select(["user_id", "subject_id", "started_at"], source)
+        .on_conflict_do_nothing(index_elements=[ActiveTimer.user_id])
+        .returning(subject_code)
     )
+    row = result.one_or_none()
+
+    if row is None:
+        # Nothing inserted: a running timer wins over a bad subject, as the
+        # checks were ordered before
+        if not subject_id or await db.get(ActiveTimer, user.id) is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="Timer already running. Stop it first.",
+            )
+        raise HTTPException(
+            status_code=404,
+            detail="Subject not found",
+        )
 
-    db.add(timer)
     await db.commit()
-    await db.refresh(timer)
+    _timer_states.set((user.id,), (subject_id, row[0], started_at))
 
     return TimerStatusSchema(
         is_running=True,
-        subject_id=timer.subject_id,
-        subject_code=subject_code,
-        started_at=timer.started_at,
+        subject_id=subject_id,
+        subject_code=row[0],
+        started_at=started_at,
         elapsed_minutes=0,
     )
 
@@ -147,34 +199,47 @@ async def stop_timer(
     - duration_minutes = ended_at - started_at (in minutes)
     - is_deep_work = True if duration_minutes >= 90
     """
-    # Get active timer
-    result = await db.execute(select(ActiveTimer).where(ActiveTimer.user_id == user.id))
-    timer = result.scalar_one_or_none()
+    # Delete the active timer and record its session in one statement: the
+    # DELETE ... RETURNING feeds an INSERT ... SELECT through a CTE, and
+    # RETURNING reads back the duration and deep work flag that Postgres
+    # generates from the two timestamps
+    stopped = (
+        delete(ActiveTimer)
+        .where(ActiveTimer.user_id == user.id)
+        .returning(ActiveTimer.subject_id, ActiveTimer.started_at)
+        .cte("stopped")
+    )
+    result = await db.execute(
+        insert(StudySession)
+        .from_select(
+            ["user_id", "subject_id", "started_at", "ended_at", "notes"],
+            select(
+                literal(user.id, StudySession.user_id.type),
+                stopped.c.subject_id,
+                stopped.c.started_at,
+                literal(datetime.utcnow(), StudySession.ended_at.type),
+                literal(notes, StudySession.notes.type),
+            ),
+        )
+        .returning(
+            StudySession.id,
+            StudySession.duration_minutes,
+            StudySession.is_deep_work,
+        )
+    )
+    session = result.one_or_none()
 
-    if not timer:
+    if session is None:
         raise HTTPException(
             status_code=400,
             detail="No timer running",
         )
 
-    # Create study session
-    session = StudySession(
-        user_id=user.id,
-        subject_id=timer.subject_id,
-        started_at=timer.started_at,
-        notes=notes,
-    )
-
-    # Stop the session - this calculates duration and deep work
-    session.stop()
-
-    db.add(session)
-
-    # Delete active timer
-    await db.delete(timer)
-
     await db.commit()
-    await db.refresh(session)
+    _timer_states.set((user.id,), _IDLE)
+
+    # The new session changes this user's totals and streak
+    analytics_cache.invalidate(user.id)
 
     return StopTimerResponse(
         success=True,
@@ -216,62 +281,71 @@ async def get_timer_analytics(
             detail="Invalid period. Use: today, week, month",
         )
 
-    # Get sessions in period
-    result = await db.execute(
-        select(StudySession)
-        .where(
-            and_(
-                StudySession.user_id == user.id,
-                StudySession.started_at >= period_start,
-                StudySession.ended_at.isnot(None),
-            )
-        )
-        .order_by(StudySession.started_at.desc())
-    )
-    sessions = result.scalars().all()
+    # Keyed on the period start too, so a cached "today" never outlives today
+    cache_key = (user.id, period, period_start)
+    cached = analytics_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Calculate analytics
-    total_minutes = sum(s.duration_minutes or 0 for s in sessions)
-    deep_work_minutes = sum(s.duration_minutes or 0 for s in sessions if s.is_deep_work)
-    sessions_count = len(sessions)
+    period_filters = (
+        StudySession.user_id == user.id,
+        StudySession.started_at >= period_start,
+        StudySession.ended_at.isnot(None),
+    )
 
-    # Count unique subjects
-    subject_ids = set(s.subject_id for s in sessions if s.subject_id)
-    subjects_studied = len(subject_ids)
+    # Aggregate the period in SQL; the result is one row however many
+    # sessions there are
+    result = await db.execute(
+        select(
+            func.coalesce(func.sum(StudySession.duration_minutes), 0),
+            func.coalesce(
+                func.sum(StudySession.duration_minutes).filter(
+                    StudySession.is_deep_work
+                ),
+                0,
+            ),
+            func.count(),
+            func.count(StudySession.subject_id.distinct()),
+            func.coalesce(func.max(StudySession.duration_minutes), 0),
+        ).where(*period_filters)
+    )
+    (
+        total_minutes,
+        deep_work_minutes,
+        sessions_count,
+        subjects_studied,
+        longest_session,
+    ) = result.one()
 
     # Calculate averages
     avg_session = total_minutes / sessions_count if sessions_count > 0 else 0
-    longest_session = max((s.duration_minutes or 0 for s in sessions), default=0)
 
     # Calculate streak (consecutive days with study)
-    streak_days = await _calculate_streak(db, user.id)
-
-    # Get recent sessions (limit 10)
-    recent_sessions = []
-    for session in sessions[:10]:
-        subject_code = None
-        if session.subject_id:
-            subj_result = await db.execute(
-                select(Subject).where(Subject.id == session.subject_id)
-            )
-            subj = subj_result.scalar_one_or_none()
-            if subj:
-                subject_code = subj.code
-
-        recent_sessions.append(
-            StudySessionSchema(
-                id=session.id,
-                subject_id=session.subject_id,
-                subject_code=subject_code,
-                started_at=session.started_at,
-                ended_at=session.ended_at,
-                duration_minutes=session.duration_minutes,
-                is_deep_work=session.is_deep_work,
-                notes=session.notes,
-            )
+    streak_days = await calculate_streak(db, user.id)
+
+    # Get recent sessions (limit 10), batch-loading their subjects
+    result = await db.execute(
+        select(StudySession)
+        .where(*period_filters)
+        .order_by(StudySession.started_at.desc())
+        .limit(10)
+        .options(selectinload(StudySession.subject))
+    )
+    recent_sessions = [
+        StudySessionSchema(
+            id=session.id,
+            subject_id=session.subject_id,
+            subject_code=session.subject.code if session.subject else None,
+            started_at=session.started_at,
+            ended_at=session.ended_at,
+            duration_minutes=session.duration_minutes,
+            is_deep_work=session.is_deep_work,
+            notes=session.notes,
         )
+        for session in result.scalars()
+    ]
 
-    return TimerAnalyticsResponse(
+    response = TimerAnalyticsResponse(
         success=True,
         period=period,
         analytics=TimerAnalyticsSchema(
@@ -286,39 +360,5 @@ async def get_timer_analytics(
         recent_sessions=recent_sessions,
     )
 
-
-async def _calculate_streak(db: AsyncSession, user_id: UUID) -> int:
-    """Calculate consecutive days with study sessions."""
-    today = datetime.utcnow().date()
-    streak = 0
-    current_date = today
-
-    while True:
-        # Check if there's a session on this date
-        day_start = datetime.combine(current_date, datetime.min.time())
-        day_end = day_start + timedelta(days=1)
-
-        result = await db.execute(
-            select(StudySession.id)
-            .where(
-                and_(
-                    StudySession.user_id == user_id,
-                    StudySession.started_at >= day_start,
-                    StudySession.started_at < day_end,
-                    StudySession.ended_at.isnot(None),
-                )
-            )
-            .limit(1)
-        )
-
-        if result.scalar_one_or_none():
-            streak += 1
-            current_date -= timedelta(days=1)
-        else:
-            break
-
-        # Safety limit
-        if streak > 365:
-            break
-
-    return streak
+    analytics_cache.set(cache_key, response)
+    return response
@@ -1,6 +1,6 @@
 """Core module for AESA backend."""
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings, get_settings, reset_settings
 from app.core.database import (
     Base,
     engine,
@@ -9,11 +9,12 @@ from app.core.database import (
     init_db,
     close_db,
 )
-from app.core.logging import setup_logging, log_system
+from app.core.logging import setup_logging, log_system, stop_logging
 
 __all__ = [
     "Settings",
     "get_settings",
+    "reset_settings",
     "Base",
     "engine",
     "async_session_maker",
@@ -22,4 +23,5 @@ __all__ = [
     "close_db",
     "setup_logging",
     "log_system",
+    "stop_logging",
 ]
@@ -1,13 +1,16 @@
 """Database configuration and session management using async SQLAlchemy."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
 
@@ -18,6 +21,11 @@ class Base(DeclarativeBase):
     pass
 
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson instead of the stdlib."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 settings = get_settings()
 # NOTE (tests/Windows determinism):
@@ -25,14 +33,25 @@ settings = get_settings()
 # pending on the event loop which then causes rare "Event loop is closed" and
 # "coroutine Connection._cancel was never awaited" issues when the test suite
 # creates/tears down many loops.
-# Using NullPool makes test runs deterministic by avoiding connection reuse.
-from sqlalchemy.pool import NullPool
+# Under TESTING, NullPool makes test runs deterministic by avoiding connection
+# reuse; everywhere else connections are pooled so requests don't pay for a
+# new asyncpg connection each time.
+if settings.testing:
+    _pool_options: dict[str, Any] = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    poolclass=NullPool,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_pool_options,
 )
 
 # Create async session factory
@@ -64,12 +83,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and upgrade ones from an older schema."""
     # Import models here to avoid circular imports during module init
     from app import models  # noqa: F401
+    from app.core.schema_upgrades import upgrade_schema
 
     async with engine.begin() as conn:
+        # time_blocks' overlap exclusion constraint needs btree_gist
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
         await conn.run_sync(Base.metadata.create_all)
+        await upgrade_schema(conn)
 
 
 async def close_db() -> None:
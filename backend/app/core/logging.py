@@ -11,26 +11,30 @@ Implements:
 Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
 """
 
-import json
+import atexit
 import logging
+import queue
+import re
 import sys
+import time
 import traceback
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
-from uuid import UUID
+
+import orjson
 
 from app.core.config import get_settings
 
 
-class UUIDEncoder(json.JSONEncoder):
-    """JSON encoder that handles UUID objects."""
+# orjson encodes UUIDs and datetimes natively; non-string keys are
+# stringified as json.dumps did
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Parameter keys containing any of these (lowercased) are redacted
+_SENSITIVE_KEY_RE = re.compile(
+    "password|token|api_key|secret|authorization|auth|credential"
+    "|private_key|access_token"
+)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -41,18 +45,41 @@ class StructuredFormatter(logging.Formatter):
     message, and optional context as JSON.
     """
 
+    # Second-resolution timestamp prefix, reused while records keep arriving
+    # within the same second
+    _last_second: int = -1
+    _last_prefix: str = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """UTC ISO 8601 timestamp (milliseconds) from the record's creation time."""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._last_prefix}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured output."""
+        context = getattr(record, "context", None)
+        if not context and not record.exc_info:
+            # Fast path for plain records: only the message needs escaping,
+            # the other fields are fixed-format strings
+            return (
+                f'{{"timestamp":"{self._timestamp(record)}",'
+                f'"level":"{record.levelname}","logger":"{record.name}",'
+                f'"message":{orjson.dumps(record.getMessage()).decode()}}}'
+            )
+
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # Add context if present
-        if hasattr(record, "context") and record.context:
-            log_entry["context"] = record.context
+        if context:
+            log_entry["context"] = context
 
         # Add exception info if present
         if record.exc_info:
@@ -62,34 +89,69 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": traceback.format_exception(*record.exc_info),
             }
 
-        return json.dumps(log_entry, cls=UUIDEncoder)
+        return orjson.dumps(log_entry, option=_JSON_OPTIONS).decode()
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record is queued as-is
+        # and StructuredFormatter still sees its args, context and exc_info
+        return record
+
+
+# Background listener that formats and writes queued records
+_listener: Optional[QueueListener] = None
 
 
 def setup_logging() -> logging.Logger:
     """
     Set up the AESA logging system.
 
+    Records are only queued on the logging thread; a background
+    QueueListener formats them and writes to stdout, so request handling
+    never waits on JSON encoding or console I/O.
+
     Returns:
         Configured logger instance
     """
+    global _logger, _listener
     settings = get_settings()
 
     # Create logger
     logger = logging.getLogger("aesa")
     logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
 
-    # Remove existing handlers
+    # Remove existing handlers and drain the previous listener
     logger.handlers.clear()
+    stop_logging()
 
     # Console handler with structured format as it works
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
     console_handler.setFormatter(StructuredFormatter())
-    logger.addHandler(console_handler)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_PassthroughQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+
+    _logger = logger
     return logger
 
 
+def stop_logging() -> None:
+    """Write out any queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 # Initialize logger on module load
 _logger: Optional[logging.Logger] = None
 
@@ -290,27 +352,19 @@ def _sanitize_params(params: dict) -> dict:
     Returns:
         Sanitized parameters
     """
-    sensitive_keys = {
-        "password",
-        "token",
-        "api_key",
-        "secret",
-        "authorization",
-        "auth",
-        "credential",
-        "private_key",
-        "access_token",
-    }
-
-    sanitized = {}
-    for key, value in params.items():
-        key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in sensitive_keys):
-            sanitized[key] = "[REDACTED]"
-        elif isinstance(value, dict):
-            sanitized[key] = _sanitize_params(value)
-        else:
-            sanitized[key] = value
+    sanitized: dict = {}
+    # Nested dicts are walked with an explicit stack rather than recursion
+    stack = [(params, sanitized)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if _SENSITIVE_KEY_RE.search(key.lower()):
+                target[key] = "[REDACTED]"
+            elif isinstance(value, dict):
+                target[key] = nested = {}
+                stack.append((value, nested))
+            else:
+                target[key] = value
 
     return sanitized
 
@@ -326,14 +380,18 @@ def _truncate_dict(data: dict, max_length: int = 500) -> dict:
     Returns:
         Truncated dictionary
     """
-    truncated = {}
-    for key, value in data.items():
-        if isinstance(value, str) and len(value) > max_length:
-            truncated[key] = value[:max_length] + "... [truncated]"
-        elif isinstance(value, dict):
-            truncated[key] = _truncate_dict(value, max_length)
-        else:
-            truncated[key] = value
+    truncated: dict = {}
+    stack = [(data, truncated)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, str) and len(value) > max_length:
+                target[key] = value[:max_length] + "... [truncated]"
+            elif isinstance(value, dict):
+                target[key] = nested = {}
+                stack.append((value, nested))
+            else:
+                target[key] = value
 
     return truncated
 
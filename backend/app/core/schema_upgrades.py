@@ -0,0 +1,119 @@
+"""
+In-place upgrades for databases created before a schema change.
+
+database/init.sql only runs when the Postgres volume is first created, and
+create_all never alters existing tables, so changes to existing tables are
+applied here by init_db on startup. Every upgrade is idempotent.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.logging import log_system
+from app.models.study import SESSION_DEEP_WORK_SQL, SESSION_DURATION_SQL
+from app.models.time_block import OVERLAP_CONSTRAINT
+
+# study_sessions.duration_minutes/is_deep_work used to be plain columns filled
+# by the session_duration trigger; they are now generated by Postgres. The
+# old values are recomputed from the timestamps when the columns are re-added.
+_GENERATED_SESSION_COLUMNS = f"""
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'study_sessions'
+          AND column_name = 'duration_minutes'
+          AND is_generated = 'NEVER'
+    ) THEN
+        DROP TRIGGER IF EXISTS session_duration ON study_sessions;
+        DROP FUNCTION IF EXISTS calculate_session_duration();
+        ALTER TABLE study_sessions
+            DROP COLUMN duration_minutes,
+            DROP COLUMN IF EXISTS is_deep_work;
+        ALTER TABLE study_sessions
+            ADD COLUMN duration_minutes INT
+                GENERATED ALWAYS AS ({SESSION_DURATION_SQL}) STORED,
+            ADD COLUMN is_deep_work BOOLEAN
+                GENERATED ALWAYS AS ({SESSION_DEEP_WORK_SQL}) STORED;
+    END IF;
+END $$
+"""
+
+_DEEP_WORK_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_study_sessions_user_deep_work
+    ON study_sessions(user_id, started_at) WHERE is_deep_work
+"""
+
+# idx_study_sessions_user_completed gained INCLUDE columns so the timer
+# analytics aggregate is an index-only scan. An index without them (no
+# columns beyond its keys) is dropped and rebuilt.
+_COMPLETED_SESSIONS_INDEX_WITHOUT_INCLUDE = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_index
+        WHERE indexrelid = to_regclass('idx_study_sessions_user_completed')
+          AND indnatts = indnkeyatts
+    ) THEN
+        DROP INDEX idx_study_sessions_user_completed;
+    END IF;
+END $$
+"""
+
+_COMPLETED_SESSIONS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_study_sessions_user_completed
+    ON study_sessions(user_id, started_at DESC)
+    INCLUDE (duration_minutes, is_deep_work, subject_id)
+    WHERE ended_at IS NOT NULL
+"""
+
+_ACTIVE_GUIDELINES_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_ai_guidelines_user_active_created
+    ON ai_guidelines(user_id, is_active, created_at DESC)
+"""
+
+# Overlapping time blocks are rejected by this constraint (btree_gist is
+# created by init_db before the upgrades run)
+_TIME_BLOCK_OVERLAP_CONSTRAINT = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = '{OVERLAP_CONSTRAINT}'
+          AND conrelid = 'time_blocks'::regclass
+    ) THEN
+        ALTER TABLE time_blocks ADD CONSTRAINT {OVERLAP_CONSTRAINT}
+            EXCLUDE USING gist (
+                user_id WITH =,
+                tsrange(start_time, end_time) WITH &&
+            );
+    END IF;
+END $$
+"""
+
+
+async def upgrade_schema(conn: AsyncConnection) -> None:
+    """
+    Bring tables created by an older schema up to date.
+
+    Args:
+        conn: Connection inside init_db's transaction, after create_all
+    """
+    await conn.execute(text(_GENERATED_SESSION_COLUMNS))
+    await conn.execute(text(_DEEP_WORK_INDEX))
+    await conn.execute(text(_COMPLETED_SESSIONS_INDEX_WITHOUT_INCLUDE))
+    await conn.execute(text(_COMPLETED_SESSIONS_INDEX))
+    await conn.execute(text(_ACTIVE_GUIDELINES_INDEX))
+
+    try:
+        async with conn.begin_nested():
+            await conn.execute(text(_TIME_BLOCK_OVERLAP_CONSTRAINT))
+    except IntegrityError:
+        # Existing rows already overlap; the constraint can only be added
+        # once they are resolved, so startup carries on without it
+        log_system(
+            "warning",
+            f"Could not add {OVERLAP_CONSTRAINT}: existing time blocks overlap",
+        )
@@ -0,0 +1,167 @@
+"""
+Converters from ORM models and scheduler results to GraphQL types.
+
+Kept apart from the resolvers and fully annotated so the module can be
+compiled with mypyc (`mypyc app/graphql/converters.py`) without changes.
+Attributes are read directly, except for the optional scheduler block
+title in to_gql_time_block, which keeps getattr with a fallback.
+"""
+
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from functools import lru_cache
+from typing import Optional
+from uuid import UUID
+
+import strawberry
+
+from app.graphql.types import (
+    DaySchedule,
+    DayStats,
+    Subject,
+    Task,
+    TimeBlock,
+    TimetableEntry,
+    TimetableSlot,
+)
+from app.models import Subject as SubjectModel
+from app.models import Task as TaskModel
+from app.models.timetable import KUTimetable
+from app.scheduler.gaps import TimeBlock as SchedulerTimeBlock
+from app.scheduler.service import DaySchedule as SchedulerDaySchedule
+from app.scheduler.timetable import TimetableEntry as SchedulerTimetableEntry
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def uuid_to_id(value: UUID) -> strawberry.ID:
+    return strawberry.ID(str(value))
+
+
+def to_gql_subject(subject: SubjectModel) -> Subject:
+    return Subject(
+        id=uuid_to_id(subject.id),
+        code=subject.code,
+        name=subject.name,
+        color=subject.color,
+        created_at=subject.created_at,
+    )
+
+
+def to_gql_task(task: TaskModel, subject: Optional[SubjectModel] = None) -> Task:
+    subject_id: Optional[UUID] = task.subject_id
+    return Task(
+        id=uuid_to_id(task.id),
+        title=task.title,
+        description=task.description,
+        task_type=task.task_type,
+        duration_minutes=task.duration_minutes,
+        priority=int(task.effective_priority),
+        deadline=task.deadline,
+        is_completed=bool(task.is_completed),
+        completed_at=task.completed_at,
+        subject_id=uuid_to_id(subject_id) if subject_id else None,
+        subject=to_gql_subject(subject) if subject else None,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
+
+
+def to_gql_time_block(block: SchedulerTimeBlock) -> TimeBlock:
+    # SchedulerService returns internal blocks without DB ids. Provide deterministic IDs.
+    start_time = block.start_time
+    end_time = block.end_time
+    block_type: str = block.block_type
+    stable_id = f"{start_time.isoformat()}-{end_time.isoformat()}-{block_type}"
+    return TimeBlock(
+        id=strawberry.ID(stable_id),
+        # Routine blocks carry a title; gap-detection blocks don't
+        title=getattr(block, "title", block_type),
+        block_type=block_type,
+        start_time=start_time,
+        end_time=end_time,
+        is_fixed=bool(block.is_fixed),
+        task_id=None,
+        task=None,
+        metadata=None,
+        # timedelta floor division gives whole minutes without a float
+        duration_minutes=(end_time - start_time) // _ONE_MINUTE,
+    )
+
+
+def to_gql_day_stats(schedule: SchedulerDaySchedule) -> DayStats:
+    return DayStats(
+        total_study_minutes=int(schedule.total_study_minutes),
+        deep_work_minutes=int(schedule.deep_work_minutes),
+        has_deep_work_opportunity=bool(schedule.has_deep_work_opportunity),
+        gap_count=len(schedule.gaps),
+        tasks_completed=0,
+        energy_level=50,
+    )
+
+
+@lru_cache(maxsize=4096, typed=True)
+def format_hhmm(value: object) -> str:
+    # Cached per value: the same class times repeat across slots and days
+    if isinstance(value, time):
+        return f"{value.hour:02d}:{value.minute:02d}"
+    s = str(value)
+    # Normalize "HH:MM:SS" -> "HH:MM" for UI consistency
+    if len(s) >= 5:
+        return s[:5]
+    return s
+
+
+def to_gql_timetable_slot(
+    slot: KUTimetable, subject: Optional[SubjectModel] = None
+) -> TimetableSlot:
+    return TimetableSlot(
+        id=uuid_to_id(slot.id),
+        subject_id=uuid_to_id(slot.subject_id),
+        subject=to_gql_subject(subject) if subject else None,
+        day_of_week=int(slot.day_of_week),
+        start_time=format_hhmm(slot.start_time),
+        end_time=format_hhmm(slot.end_time),
+        room=slot.room,
+        class_type=str(slot.class_type),
+    )
+
+
+def to_gql_timetable_entry(entry: SchedulerTimetableEntry) -> TimetableEntry:
+    return TimetableEntry(
+        subject_code=entry.subject_code,
+        subject_name=entry.subject_name,
+        # Loaded from the string column, so already the plain value
+        class_type=str(entry.class_type),
+        start_time=format_hhmm(entry.start_time),
+        end_time=format_hhmm(entry.end_time),
+        room=entry.room,
+    )
+
+
+def to_gql_day_schedule(schedule: SchedulerDaySchedule) -> DaySchedule:
+    return DaySchedule(
+        schedule_date=schedule.date.date().isoformat(),
+        blocks=[to_gql_time_block(b) for b in schedule.blocks],
+        gaps=[],
+        classes=[to_gql_timetable_entry(c) for c in schedule.classes],
+        stats=to_gql_day_stats(schedule),
+    )
+
+
+def create_empty_day_schedule(target_date: date) -> DaySchedule:
+    return DaySchedule(
+        schedule_date=target_date.isoformat(),
+        blocks=[],
+        gaps=[],
+        classes=[],
+        stats=DayStats(
+            total_study_minutes=0,
+            deep_work_minutes=0,
+            has_deep_work_opportunity=False,
+            gap_count=0,
+            tasks_completed=0,
+            energy_level=50,
+        ),
+    )
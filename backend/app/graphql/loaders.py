@@ -0,0 +1,49 @@
+"""Request-scoped DataLoaders for GraphQL resolvers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.models import Subject as SubjectModel
+
+
+@dataclass
+class Loaders:
+    """DataLoaders shared by every resolver of one GraphQL request."""
+
+    subject: DataLoader[UUID, Optional[SubjectModel]]
+
+
+def create_loaders(db: AsyncSession) -> Loaders:
+    """
+    Create the DataLoaders for one request.
+
+    Loads requested in the same tick are batched into a single query, and
+    each key is cached for the rest of the request.
+
+    Args:
+        db: The request's database session
+
+    Returns:
+        Fresh loaders bound to the session
+    """
+
+    async def load_subjects(keys: list[UUID]) -> list[Optional[SubjectModel]]:
+        # = ANY(array) binds the keys as one parameter, so the statement is
+        # prepared once whatever the batch size (IN would vary per size)
+        result = await db.execute(
+            select(SubjectModel).where(
+                SubjectModel.id == any_(literal(keys, ARRAY(SubjectModel.id.type)))
+            )
+        )
+        by_id = {subject.id: subject for subject in result.scalars()}
+        return [by_id.get(key) for key in keys]
+
+    return Loaders(subject=DataLoader(load_fn=load_subjects))
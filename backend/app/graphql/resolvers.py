@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 import strawberry
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, noload, selectinload
 from strawberry.types import Info
+from strawberry.types.nodes import SelectedField
 
 from app.api.chat import ChatRequest
+from app.api.timer import invalidate_timer_status
 from app.core.database import get_db
 from app.graphql.assistant_settings_types import AssistantSettings, UpdateAssistantSettingsInput
+from app.graphql.converters import (
+    to_gql_day_schedule,
+    to_gql_subject,
+    to_gql_task,
+    to_gql_timetable_slot,
+    uuid_to_id,
+)
+from app.graphql.loaders import Loaders, create_loaders
 from app.graphql.types import (
     AnalyticsPeriod,
     ChatResponse,
@@ -23,7 +35,6 @@ from app.graphql.types import (
     CreateTimeBlockInput,
     UpdateTaskInput,
     DaySchedule,
-    DayStats,
     Goal,
     GoalStatusEnum,
     Notification,
@@ -34,7 +45,6 @@ from app.graphql.types import (
     TaskFilter,
     TimeBlock,
     TimerStatus,
-    TimetableEntry,
     TimetableSlot,
     CreateTimetableSlotInput,
     UpdateTimetableSlotInput,
@@ -49,9 +59,11 @@ from app.models import Subject as SubjectModel
 from app.models import Task as TaskModel
 from app.models import TimeBlock as TimeBlockModel
 from app.models import User
+from app.models.time_block import OVERLAP_CONSTRAINT
 from app.models.timetable import KUTimetable
 from app.models.study import StudyGoal as GoalModel, ActiveTimer as ActiveTimerModel, StudySession as StudySessionModel
 from app.scheduler.service import SchedulerService
+from app.scheduler.analytics import analytics_cache, today_midnight
 
 
 # ==========================================================================
@@ -73,6 +85,62 @@ def _get_user_from_context(info: Info) -> User:
     return user
 
 
+def _selects_field(info: Info, name: str) -> bool:
+    """Whether the resolved field's selection set asks for the child field `name`."""
+    pending = [selection for field in info.selected_fields for selection in field.selections]
+    while pending:
+        selection = pending.pop()
+        if isinstance(selection, SelectedField):
+            if selection.name == name:
+                return True
+        else:
+            # Fragment spreads and inline fragments
+            pending.extend(selection.selections)
+    return False
+
+
+def _task_subject_option(info: Info, loader: Callable = selectinload) -> Any:
+    """Eager-load Task.subject only when the query selects it; otherwise never load it."""
+    if _selects_field(info, "subject"):
+        return loader(TaskModel.subject)
+    return noload(TaskModel.subject)
+
+
+def _get_loaders_from_context(info: Info) -> Loaders:
+    loaders = info.context.get("loaders")
+    if loaders is None:
+        # Contexts built outside the router (e.g. direct schema.execute calls)
+        loaders = create_loaders(_get_db_from_context(info))
+        info.context["loaders"] = loaders
+    return loaders
+
+
+async def _load_user_subject(info: Info, subject_id: UUID, user: User) -> SubjectModel | None:
+    """Load a subject through the request's loader, or None if it isn't the user's."""
+    subject = await _get_loaders_from_context(info).subject.load(subject_id)
+    if subject is None or subject.user_id != user.id:
+        return None
+    return subject
+
+
+async def _flush_time_block(db: AsyncSession, block: TimeBlockModel, **changes: Any) -> None:
+    """Write a new or changed time block, rejecting overlaps the constraint catches."""
+    # Changes are applied inside the savepoint (begin_nested flushes anything
+    # pending first), so a rejected block doesn't abort the session for the
+    # rest of the operation
+    try:
+        async with db.begin_nested():
+            for name, value in changes.items():
+                setattr(block, name, value)
+            db.add(block)
+            await db.flush()
+    except IntegrityError as e:
+        if OVERLAP_CONSTRAINT not in str(e.orig):
+            raise
+        raise ValueError("Time block overlaps with an existing block") from e
+    await db.refresh(block)
+
+
 async def _get_or_create_default_user(db: AsyncSession) -> User:
     result = await db.execute(select(User).limit(1))
     user = result.scalar_one_or_none()
@@ -86,110 +154,10 @@ async def _get_or_create_default_user(db: AsyncSession) -> User:
     return user
 
 
-def _uuid_to_id(value: UUID) -> strawberry.ID:
-    return strawberry.ID(str(value))
-
-
 def _id_to_uuid(value: strawberry.ID) -> UUID:
     return UUID(str(value))
 
 
-def _to_gql_subject(subject: SubjectModel) -> Subject:
-    return Subject(
-        id=_uuid_to_id(subject.id),
-        code=subject.code,
-        name=subject.name,
-        color=getattr(subject, "color", None),
-        created_at=getattr(subject, "created_at", None),
-    )
-
-
-def _to_gql_task(task: TaskModel, subject: SubjectModel | None = None) -> Task:
-    subj = _to_gql_subject(subject) if subject else None
-    return Task(
-        id=_uuid_to_id(task.id),
-        title=task.title,
-        description=getattr(task, "description", None),
-        task_type=task.task_type,
-        duration_minutes=task.duration_minutes,
-        priority=int(getattr(task, "effective_priority", task.priority)),
-        deadline=getattr(task, "deadline", None),
-        is_completed=bool(task.is_completed),
-        completed_at=getattr(task, "completed_at", None),
-        subject_id=_uuid_to_id(task.subject_id) if getattr(task, "subject_id", None) else None,
-        subject=subj,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
-
-
-def _to_gql_time_block(block: Any) -> TimeBlock:
-    # SchedulerService returns internal blocks without DB ids. Provide deterministic IDs.
-    stable_id = f"{block.start_time.isoformat()}-{block.end_time.isoformat()}-{block.block_type}"
-    return TimeBlock(
-        id=strawberry.ID(stable_id),
-        title=getattr(block, "title", block.block_type),
-        block_type=block.block_type,
-        start_time=block.start_time,
-        end_time=block.end_time,
-        is_fixed=bool(getattr(block, "is_fixed", False)),
-        task_id=None,
-        task=None,
-        metadata=None,
-        duration_minutes=int((block.end_time - block.start_time).total_seconds() // 60),
-    )
-
-
-def _to_gql_day_stats(schedule: Any) -> DayStats:
-    return DayStats(
-        total_study_minutes=int(getattr(schedule, "total_study_minutes", 0)),
-        deep_work_minutes=int(getattr(schedule, "deep_work_minutes", 0)),
-        has_deep_work_opportunity=bool(getattr(schedule, "has_deep_work_opportunity", False)),
-        gap_count=len(getattr(schedule, "gaps", []) or []),
-        tasks_completed=0,
-        energy_level=50,
-    )
-
-
-def _format_hhmm(value: Any) -> str:
-    s = str(value)
-    # Normalize "HH:MM:SS" -> "HH:MM" for UI consistency
-    if len(s) >= 5:
-        return s[:5]
-    return s
-
-
-def _to_gql_timetable_slot(slot: KUTimetable, subject: SubjectModel | None = None) -> TimetableSlot:
-    subj = _to_gql_subject(subject) if subject else None
-    return TimetableSlot(
-        id=_uuid_to_id(slot.id),
-        subject_id=_uuid_to_id(slot.subject_id),
-        subject=subj,
-        day_of_week=int(slot.day_of_week),
-        start_time=_format_hhmm(slot.start_time),
-        end_time=_format_hhmm(slot.end_time),
-        room=getattr(slot, "room", None),
-        class_type=str(slot.class_type),
-    )
-
-
-def _create_empty_day_schedule(target_date: date) -> DaySchedule:
-    return DaySchedule(
-        schedule_date=target_date.isoformat(),
-        blocks=[],
-        gaps=[],
-        classes=[],
-        stats=DayStats(
-            total_study_minutes=0,
-            deep_work_minutes=0,
-            has_deep_work_opportunity=False,
-            gap_count=0,
-            tasks_completed=0,
-            energy_level=50,
-        ),
-    )
-
-
 # ============================================================================
 # Query Resolvers
 # ============================================================================
@@ -206,26 +174,10 @@ class Query:
         user = _get_user_from_context(info)
 
         service = SchedulerService(db)
-        today_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_dt = today_midnight()
         schedule = await service.get_day_schedule(user.id, today_dt)
 
-        return DaySchedule(
-            schedule_date=schedule.date.date().isoformat(),
-            blocks=[_to_gql_time_block(b) for b in schedule.blocks],
-            gaps=[],
-            classes=[
-                TimetableEntry(
-                    subject_code=c.subject_code,
-                    subject_name=c.subject_name,
-                    class_type=c.class_type.value,
-                    start_time=_format_hhmm(c.start_time),
-                    end_time=_format_hhmm(c.end_time),
-                    room=c.room,
-                )
-                for c in schedule.classes
-            ],
-            stats=_to_gql_day_stats(schedule),
-        )
+        return to_gql_day_schedule(schedule)
 
     @strawberry.field(description="Get schedule for a week starting from a date")
     async def week_schedule(
@@ -242,29 +194,7 @@ class Query:
         start_dt = datetime.combine(start, datetime.min.time())
         schedules = await service.get_week_schedule(user.id, start_dt)
 
-        days: list[DaySchedule] = []
-        for s in schedules:
-            days.append(
-                DaySchedule(
-                    schedule_date=s.date.date().isoformat(),
-                    blocks=[_to_gql_time_block(b) for b in s.blocks],
-                    gaps=[],
-                    classes=[
-                        TimetableEntry(
-                            subject_code=c.subject_code,
-                            subject_name=c.subject_name,
-                            class_type=c.class_type.value,
-                            start_time=_format_hhmm(c.start_time),
-                            end_time=_format_hhmm(c.end_time),
-                            room=c.room,
-                        )
-                        for c in s.classes
-                    ],
-                    stats=_to_gql_day_stats(s),
-                )
-            )
-
-        return days
+        return [to_gql_day_schedule(s) for s in schedules]
 
     @strawberry.field(description="Get all tasks with optional filtering")
     async def tasks(
@@ -276,7 +206,13 @@ class Query:
         db = _get_db_from_context(info)
         user = _get_user_from_context(info)
 
-        query = select(TaskModel).where(TaskModel.user_id == user.id)
+        # Subjects are batch-loaded by the same execute (one IN query) when
+        # the query asks for them
+        query = (
+            select(TaskModel)
+            .where(TaskModel.user_id == user.id)
+            .options(_task_subject_option(info))
+        )
 
         if filter is not None:
             if filter.task_type is not None:
@@ -291,16 +227,7 @@ class Query:
                 query = query.where(TaskModel.priority <= filter.priority_max)
 
         result = await db.execute(query.order_by(TaskModel.created_at.desc()))
-        tasks = result.scalars().all()
-
-        subject_ids = {t.subject_id for t in tasks if t.subject_id}
-        subjects_by_id: dict[UUID, SubjectModel] = {}
-        if subject_ids:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id.in_(subject_ids)))
-            for s in sres.scalars().all():
-                subjects_by_id[s.id] = s
-
-        return [_to_gql_task(t, subjects_by_id.get(t.subject_id)) for t in tasks]
+        return [to_gql_task(t, t.subject) for t in result.scalars()]
 
     @strawberry.field(description="Get a single task by ID")
     async def task(
@@ -312,17 +239,17 @@ class Query:
         user = _get_user_from_context(info)
 
         task_id = _id_to_uuid(id)
-        result = await db.execute(select(TaskModel).where(TaskModel.id == task_id, TaskModel.user_id == user.id))
+        # The subject comes back in the same round-trip when it is selected
+        result = await db.execute(
+            select(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.user_id == user.id)
+            .options(_task_subject_option(info, joinedload))
+        )
         task = result.scalar_one_or_none()
         if task is None:
             return None
 
-        subject = None
-        if task.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == task.subject_id))
-            subject = sres.scalar_one_or_none()
-
-        return _to_gql_task(task, subject)
+        return to_gql_task(task, task.subject)
 
     @strawberry.field(description="Get all subjects")
     async def subjects(self, info: Info) -> list[Subject]:
@@ -333,8 +260,7 @@ class Query:
         result = await db.execute(
             select(SubjectModel).where(SubjectModel.user_id == user.id).order_by(SubjectModel.code.asc())
         )
-        subjects = result.scalars().all()
-        return [_to_gql_subject(s) for s in subjects]
+        return [to_gql_subject(s) for s in result.scalars()]
 
     @strawberry.field(description="Get single subject")
     async def subject(self, info: Info, id: strawberry.ID) -> Optional[Subject]:
@@ -346,7 +272,7 @@ class Query:
             select(SubjectModel).where(SubjectModel.id == subject_id, SubjectModel.user_id == user.id)
         )
         subject = result.scalar_one_or_none()
-        return _to_gql_subject(subject) if subject else None
+        return to_gql_subject(subject) if subject else None
 
     @strawberry.field(description="List timetable slots")
     async def timetable_slots(
@@ -358,11 +284,13 @@ class Query:
         db = _get_db_from_context(info)
         user = _get_user_from_context(info)
 
-        stmt = (
-            select(KUTimetable, SubjectModel)
-            .join(SubjectModel, KUTimetable.subject_id == SubjectModel.id)
-            .where(KUTimetable.user_id == user.id)
-        )
+        # Only join subjects when the query selects them
+        with_subject = _selects_field(info, "subject")
+        stmt = select(KUTimetable).where(KUTimetable.user_id == user.id)
+        if with_subject:
+            stmt = stmt.add_columns(SubjectModel).join(
+                SubjectModel, KUTimetable.subject_id == SubjectModel.id
+            )
 
         if day_of_week is not None:
             stmt = stmt.where(KUTimetable.day_of_week == int(day_of_week))
@@ -373,8 +301,10 @@ class Query:
         stmt = stmt.order_by(KUTimetable.day_of_week.asc(), KUTimetable.start_time.asc())
 
         result = await db.execute(stmt)
+        if not with_subject:
+            return [to_gql_timetable_slot(slot) for slot in result.scalars()]
         rows = result.all()
-        return [_to_gql_timetable_slot(slot=row[0], subject=row[1]) for row in rows]
+        return [to_gql_timetable_slot(slot=row[0], subject=row[1]) for row in rows]
 
     @strawberry.field(description="Get a single timetable slot")
     async def timetable_slot(self, info: Info, id: strawberry.ID) -> Optional[TimetableSlot]:
@@ -390,7 +320,7 @@ class Query:
         row = result.first()
         if row is None:
             return None
-        return _to_gql_timetable_slot(slot=row[0], subject=row[1])
+        return to_gql_timetable_slot(slot=row[0], subject=row[1])
 
     @strawberry.field(description="Get goals with optional status filter")
     async def goals(
@@ -406,11 +336,9 @@ class Query:
             query = query.where(GoalModel.status == status.value)
 
         result = await db.execute(query.order_by(GoalModel.created_at.desc()))
-        goals = result.scalars().all()
-
         return [
             Goal(
-                id=_uuid_to_id(g.id),
+                id=uuid_to_id(g.id),
                 title=g.title,
                 description=g.description,
                 target_value=g.target_value,
@@ -419,11 +347,11 @@ class Query:
                 deadline=g.deadline.isoformat() if g.deadline else None,
                 status=g.status,
                 progress_percent=g.progress_percent,
-                category_id=_uuid_to_id(g.category_id) if g.category_id else None,
+                category_id=uuid_to_id(g.category_id) if g.category_id else None,
                 created_at=g.created_at,
                 updated_at=g.updated_at,
             )
-            for g in goals
+            for g in result.scalars()
         ]
 
     @strawberry.field(description="Get study analytics for a period")
@@ -459,11 +387,9 @@ class Query:
             query = query.where(NotificationModel.is_read.is_(False))
 
         result = await db.execute(query.order_by(NotificationModel.created_at.desc()))
-        notifications = result.scalars().all()
-
         return [
             Notification(
-                id=_uuid_to_id(n.id),
+                id=uuid_to_id(n.id),
                 notification_type=n.type,
                 title=n.title,
                 message=n.message,
@@ -471,7 +397,7 @@ class Query:
                 scheduled_for=n.scheduled_for,
                 created_at=n.created_at,
             )
-            for n in notifications
+            for n in result.scalars()
         ]
 
     @strawberry.field(description="Get assistant settings")
@@ -492,7 +418,11 @@ class Query:
         db = _get_db_from_context(info)
         user = _get_user_from_context(info)
 
-        result = await db.execute(select(ActiveTimerModel).where(ActiveTimerModel.user_id == user.id))
+        result = await db.execute(
+            select(ActiveTimerModel)
+            .where(ActiveTimerModel.user_id == user.id)
+            .options(joinedload(ActiveTimerModel.subject))
+        )
         timer = result.scalar_one_or_none()
         if timer is None:
             return TimerStatus(
@@ -503,17 +433,10 @@ class Query:
                 elapsed_minutes=0,
             )
 
-        subject = None
-        if timer.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == timer.subject_id))
-            sm = sres.scalar_one_or_none()
-            if sm is not None:
-                subject = _to_gql_subject(sm)
-
         return TimerStatus(
             is_running=True,
-            subject_id=_uuid_to_id(timer.subject_id) if timer.subject_id else None,
-            subject=subject,
+            subject_id=uuid_to_id(timer.subject_id) if timer.subject_id else None,
+            subject=to_gql_subject(timer.subject) if timer.subject else None,
             started_at=timer.started_at,
             elapsed_minutes=timer.elapsed_minutes,
         )
@@ -569,7 +492,7 @@ class Mutation:
         db.add(subject)
         await db.flush()
         await db.refresh(subject)
-        return _to_gql_subject(subject)
+        return to_gql_subject(subject)
 
     @strawberry.mutation(description="Update a subject")
     async def update_subject(self, info: Info, id: strawberry.ID, input: UpdateSubjectInput) -> Subject:
@@ -594,7 +517,7 @@ class Mutation:
         db.add(subject)
         await db.flush()
         await db.refresh(subject)
-        return _to_gql_subject(subject)
+        return to_gql_subject(subject)
 
     @strawberry.mutation(description="Delete a subject")
     async def delete_subject(self, info: Info, id: strawberry.ID) -> bool:
@@ -622,8 +545,7 @@ class Mutation:
         user = _get_user_from_context(info)
 
         subject_uuid = _id_to_uuid(input.subject_id)
-        sres = await db.execute(select(SubjectModel).where(SubjectModel.id == subject_uuid, SubjectModel.user_id == user.id))
-        subject = sres.scalar_one_or_none()
+        subject = await _load_user_subject(info, subject_uuid, user)
         if subject is None:
             raise ValueError("Subject not found")
 
@@ -651,7 +573,7 @@ class Mutation:
         await db.flush()
         await db.refresh(slot)
 
-        return _to_gql_timetable_slot(slot, subject)
+        return to_gql_timetable_slot(slot, subject)
 
     @strawberry.mutation(description="Update a timetable slot")
     async def update_timetable_slot(
@@ -675,8 +597,7 @@ class Mutation:
         subject = None
         if input.subject_id is not None:
             subject_uuid = _id_to_uuid(input.subject_id)
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == subject_uuid, SubjectModel.user_id == user.id))
-            subject = sres.scalar_one_or_none()
+            subject = await _load_user_subject(info, subject_uuid, user)
             if subject is None:
                 raise ValueError("Subject not found")
             slot.subject_id = subject_uuid
@@ -708,10 +629,9 @@ class Mutation:
         await db.refresh(slot)
 
         if subject is None:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == slot.subject_id))
-            subject = sres.scalar_one_or_none()
+            subject = await _get_loaders_from_context(info).subject.load(slot.subject_id)
 
-        return _to_gql_timetable_slot(slot, subject)
+        return to_gql_timetable_slot(slot, subject)
 
     @strawberry.mutation(description="Delete a timetable slot")
     async def delete_timetable_slot(self, info: Info, id: strawberry.ID) -> bool:
@@ -742,13 +662,12 @@ class Mutation:
 
         # Map subject_code -> SubjectModel for the user
         sres = await db.execute(select(SubjectModel).where(SubjectModel.user_id == user.id))
-        subjects = sres.scalars().all()
-        by_code = {s.code.upper(): s for s in subjects}
+        by_code = {s.code.upper(): s for s in sres.scalars()}
 
         if mode == "REPLACE":
             # Delete all existing timetable slots for user
             existing = await db.execute(select(KUTimetable).where(KUTimetable.user_id == user.id))
-            for slot in existing.scalars().all():
+            for slot in existing.scalars():
                 await db.delete(slot)
             await db.flush()
 
@@ -805,8 +724,7 @@ class Mutation:
 
         subject_uuid = _id_to_uuid(input.subject_id) if input.subject_id else None
         if subject_uuid:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == subject_uuid, SubjectModel.user_id == user.id))
-            if sres.scalar_one_or_none() is None:
+            if await _load_user_subject(info, subject_uuid, user) is None:
                 raise ValueError("Subject not found")
 
         task = TaskModel(
@@ -825,10 +743,9 @@ class Mutation:
 
         subject = None
         if task.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == task.subject_id))
-            subject = sres.scalar_one_or_none()
+            subject = await _get_loaders_from_context(info).subject.load(task.subject_id)
 
-        return _to_gql_task(task, subject)
+        return to_gql_task(task, subject)
 
     @strawberry.mutation(description="Update an existing task")
     async def update_task(
@@ -861,8 +778,7 @@ class Mutation:
             task.deadline = input.deadline
         if input.subject_id is not None:
             subject_uuid = _id_to_uuid(input.subject_id)
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == subject_uuid, SubjectModel.user_id == user.id))
-            if sres.scalar_one_or_none() is None:
+            if await _load_user_subject(info, subject_uuid, user) is None:
                 raise ValueError("Subject not found")
             task.subject_id = subject_uuid
 
@@ -879,10 +795,9 @@ class Mutation:
 
         subject = None
         if task.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == task.subject_id))
-            subject = sres.scalar_one_or_none()
+            subject = await _get_loaders_from_context(info).subject.load(task.subject_id)
 
-        return _to_gql_task(task, subject)
+        return to_gql_task(task, subject)
 
     @strawberry.mutation(description="Delete a task")
     async def delete_task(
@@ -922,22 +837,20 @@ class Mutation:
             end_time=input.end_time,
             is_fixed=input.is_fixed,
             task_id=_id_to_uuid(input.task_id) if input.task_id else None,
-            block_metadata=None,
+            metadata_json=None,
         )
-        db.add(block)
-        await db.flush()
-        await db.refresh(block)
+        await _flush_time_block(db, block)
 
         return TimeBlock(
-            id=_uuid_to_id(block.id),
+            id=uuid_to_id(block.id),
             title=block.title,
             block_type=block.block_type,
             start_time=block.start_time,
             end_time=block.end_time,
             is_fixed=block.is_fixed,
-            task_id=_uuid_to_id(block.task_id) if block.task_id else None,
+            task_id=uuid_to_id(block.task_id) if block.task_id else None,
             task=None,
-            metadata=block.block_metadata,
+            metadata=block.metadata_json,
             duration_minutes=block.duration_minutes,
         )
 
@@ -980,22 +893,18 @@ class Mutation:
         if existing:
             raise ValueError(f"New time range overlaps with: {existing.title}")
 
-        block.start_time = new_start
-        block.end_time = new_end
-        db.add(block)
-        await db.flush()
-        await db.refresh(block)
+        await _flush_time_block(db, block, start_time=new_start, end_time=new_end)
 
         return TimeBlock(
-            id=_uuid_to_id(block.id),
+            id=uuid_to_id(block.id),
             title=block.title,
             block_type=block.block_type,
             start_time=block.start_time,
             end_time=block.end_time,
             is_fixed=block.is_fixed,
-            task_id=_uuid_to_id(block.task_id) if block.task_id else None,
+            task_id=uuid_to_id(block.task_id) if block.task_id else None,
             task=None,
-            metadata=block.block_metadata,
+            metadata=block.metadata_json,
             duration_minutes=block.duration_minutes,
         )
 
@@ -1044,8 +953,7 @@ class Mutation:
         subject_uuid = _id_to_uuid(subject_id) if subject_id else None
         if subject_uuid is not None:
             # validate ownership
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == subject_uuid, SubjectModel.user_id == user.id))
-            if sres.scalar_one_or_none() is None:
+            if await _load_user_subject(info, subject_uuid, user) is None:
                 raise ValueError("Subject not found")
 
         timer = ActiveTimerModel(
@@ -1056,17 +964,17 @@ class Mutation:
         db.add(timer)
         await db.flush()
         await db.refresh(timer)
+        invalidate_timer_status(user.id)
 
         subject = None
         if timer.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == timer.subject_id))
-            sm = sres.scalar_one_or_none()
+            sm = await _get_loaders_from_context(info).subject.load(timer.subject_id)
             if sm is not None:
-                subject = _to_gql_subject(sm)
+                subject = to_gql_subject(sm)
 
         return TimerStatus(
             is_running=True,
-            subject_id=_uuid_to_id(timer.subject_id) if timer.subject_id else None,
+            subject_id=uuid_to_id(timer.subject_id) if timer.subject_id else None,
             subject=subject,
             started_at=timer.started_at,
             elapsed_minutes=0,
@@ -1095,17 +1003,18 @@ class Mutation:
         await db.delete(timer)
         await db.flush()
         await db.refresh(session)
+        analytics_cache.invalidate(user.id)
+        invalidate_timer_status(user.id)
 
         subject = None
         if session.subject_id:
-            sres = await db.execute(select(SubjectModel).where(SubjectModel.id == session.subject_id))
-            sm = sres.scalar_one_or_none()
+            sm = await _get_loaders_from_context(info).subject.load(session.subject_id)
             if sm is not None:
-                subject = _to_gql_subject(sm)
+                subject = to_gql_subject(sm)
 
         return StudySession(
-            id=_uuid_to_id(session.id),
-            subject_id=_uuid_to_id(session.subject_id) if session.subject_id else None,
+            id=uuid_to_id(session.id),
+            subject_id=uuid_to_id(session.subject_id) if session.subject_id else None,
             subject=subject,
             started_at=session.started_at,
             ended_at=session.ended_at,
@@ -1141,7 +1050,7 @@ class Mutation:
         await db.refresh(goal)
 
         return Goal(
-            id=_uuid_to_id(goal.id),
+            id=uuid_to_id(goal.id),
             title=goal.title,
             description=goal.description,
             target_value=goal.target_value,
@@ -1150,7 +1059,7 @@ class Mutation:
             deadline=goal.deadline.isoformat() if goal.deadline else None,
             status=goal.status,
             progress_percent=goal.progress_percent,
-            category_id=_uuid_to_id(goal.category_id) if goal.category_id else None,
+            category_id=uuid_to_id(goal.category_id) if goal.category_id else None,
             created_at=goal.created_at,
             updated_at=goal.updated_at,
         )
@@ -1178,7 +1087,7 @@ class Mutation:
         await db.refresh(goal)
 
         return Goal(
-            id=_uuid_to_id(goal.id),
+            id=uuid_to_id(goal.id),
             title=goal.title,
             description=goal.description,
             target_value=goal.target_value,
@@ -1187,7 +1096,7 @@ class Mutation:
             deadline=goal.deadline.isoformat() if goal.deadline else None,
             status=goal.status,
             progress_percent=goal.progress_percent,
-            category_id=_uuid_to_id(goal.category_id) if goal.category_id else None,
+            category_id=uuid_to_id(goal.category_id) if goal.category_id else None,
             created_at=goal.created_at,
             updated_at=goal.updated_at,
         )
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import orjson
 import strawberry
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.fastapi import GraphQLRouter
 
 from app.core.config import get_settings
 from app.core.database import async_session_maker, get_db
+from app.graphql.loaders import create_loaders
 from app.graphql.resolvers import Mutation, Query
 from app.models import User
 
@@ -20,11 +23,20 @@ async def _close_db_session(response, context):
         await db.close()
 
 
+# Distinct query documents kept parsed and validated; clients send a small,
+# fixed set of operations, so repeats skip graphql-core's parse/validate
+_DOCUMENT_CACHE_SIZE = 256
+
+
 def create_graphql_schema() -> strawberry.Schema:
     """Create the Strawberry GraphQL schema."""
     return strawberry.Schema(
         query=Query,
         mutation=Mutation,
+        extensions=[
+            ParserCache(maxsize=_DOCUMENT_CACHE_SIZE),
+            ValidationCache(maxsize=_DOCUMENT_CACHE_SIZE),
+        ],
     )
 
 
@@ -49,12 +61,26 @@ async def _context_getter(request: Request):
 
     try:
         user = await _get_or_create_default_user(db)
-        return {"request": request, "db": db, "user": user}
+        return {
+            "request": request,
+            "db": db,
+            "user": user,
+            "loaders": create_loaders(db),
+        }
     finally:
         if getattr(getattr(request, "state", None), "db", None) is None:
             await db.close()
 
 
+class _ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQL router that encodes response bodies with orjson."""
+
+    def encode_json(self, response_data: object) -> str:
+        # Strawberry has already serialized every scalar, so the payload is
+        # plain JSON data; a str keeps multipart responses working
+        return orjson.dumps(response_data).decode()
+
+
 def create_graphql_router() -> GraphQLRouter:
     """
     Create the GraphQL router for FastAPI integration.
@@ -64,7 +90,7 @@ def create_graphql_router() -> GraphQLRouter:
     settings = get_settings()
     schema = create_graphql_schema()
 
-    return GraphQLRouter(
+    return _ORJSONGraphQLRouter(
         schema,
         graphiql=settings.debug,  # Enable GraphiQL in debug mode
         path="/graphql",
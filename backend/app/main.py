@@ -3,14 +3,13 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from app.core.config import get_settings
-from app.core.logging import setup_logging, log_system
+from app.core.logging import setup_logging, log_system, stop_logging
 from app.core.database import close_db, init_db
 from app.api import (
     schedule_router,
@@ -22,6 +21,7 @@ from app.api import (
     register_error_handlers,
 )
 from app.core.database import async_session_maker
+from app.agent.llm import close_http_client, get_http_client, prewarm_llm_connections
 from app.graphql import create_graphql_router
 
 
@@ -36,12 +36,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     log_system("info", f"Debug mode: {settings.debug}")
 
     await init_db()
+    await prewarm_llm_connections()
 
     yield
 
     # Shutdown
     log_system("info", "AESA Backend shutting down")
+    await close_http_client()
     await close_db()
+    stop_logging()
 
 
 async def _graphql_db_session_middleware(request, call_next) -> Response:
@@ -68,6 +71,10 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Register error handlers first so the error middleware sits innermost
+    # and its responses still pass through CORS
+    register_error_handlers(app)
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -80,9 +87,6 @@ def create_app() -> FastAPI:
     # Ensure GraphQL DB sessions are always closed
     app.add_middleware(BaseHTTPMiddleware, dispatch=_graphql_db_session_middleware)
 
-    # Register error handlers
-    register_error_handlers(app)
-
     # Register routes
     register_routes(app)
 
@@ -116,11 +120,8 @@ def register_routes(app: FastAPI) -> None:
         copilot_status = "unknown"
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{settings.copilot_api_url}/health")
-                copilot_status = (
-                    "healthy" if response.status_code == 200 else "unhealthy"
-                )
+            response = await get_http_client().get(f"{settings.copilot_api_url}/health")
+            copilot_status = "healthy" if response.status_code == 200 else "unhealthy"
         except Exception:
             copilot_status = "unavailable"
 
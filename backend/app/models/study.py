@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Integer, Boolean, Text, Float, Date, ForeignKey
+from sqlalchemy import String, Integer, Boolean, Text, Float, Date, ForeignKey, Computed
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,18 @@ if TYPE_CHECKING:
     from app.models.subject import Subject
 
 
+# Sessions at least this long count as deep work (Property 15)
+DEEP_WORK_SESSION_MINUTES = 90
+
+# Generation expressions for study_sessions.duration_minutes/is_deep_work;
+# database/init.sql and the schema upgrade use the same SQL
+_SESSION_SECONDS_SQL = "EXTRACT(EPOCH FROM (ended_at - started_at))"
+SESSION_DURATION_SQL = f"FLOOR({_SESSION_SECONDS_SQL} / 60)::INT"
+SESSION_DEEP_WORK_SQL = (
+    f"COALESCE({_SESSION_SECONDS_SQL} >= {DEEP_WORK_SESSION_MINUTES * 60}, FALSE)"
+)
+
+
 class StudySession(Base, UUIDMixin):
     """Study session tracking."""
 
@@ -34,8 +46,16 @@ class StudySession(Base, UUIDMixin):
     )
     started_at: Mapped[datetime] = mapped_column(nullable=False)
     ended_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
-    duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    is_deep_work: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Generated by Postgres from started_at/ended_at (see database/init.sql);
+    # never written by the application
+    duration_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed(SESSION_DURATION_SQL, persisted=True),
+    )
+    is_deep_work: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed(SESSION_DEEP_WORK_SQL, persisted=True),
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
@@ -47,15 +67,12 @@ class StudySession(Base, UUIDMixin):
 
     def stop(self) -> None:
         """
-        Stop the study session and calculate duration.
+        Stop the study session.
 
-        Sets ended_at, calculates duration_minutes, and determines is_deep_work.
+        Sets ended_at; the database derives duration_minutes and
+        is_deep_work from it when the row is written.
         """
         self.ended_at = datetime.utcnow()
-        delta = self.ended_at - self.started_at
-        self.duration_minutes = int(delta.total_seconds() / 60)
-        # Deep work is 90+ minutes
-        self.is_deep_work = self.duration_minutes >= 90
 
 
 class ActiveTimer(Base):
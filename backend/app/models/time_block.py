@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Boolean, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Boolean, ForeignKey, column, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
     from app.models.task import Task
 
 
+# Exclusion constraint keeping a user's time blocks from overlapping
+OVERLAP_CONSTRAINT = "time_blocks_no_overlap"
+
+
 class TimeBlock(Base, UUIDMixin):
     """TimeBlock model representing a scheduled activity in the calendar."""
 
@@ -43,6 +47,16 @@ class TimeBlock(Base, UUIDMixin):
     user: Mapped["User"] = relationship("User", back_populates="time_blocks")
     task: Mapped[Optional["Task"]] = relationship("Task", back_populates="time_blocks")
 
+    __table_args__ = (
+        # Requires the btree_gist extension (created by init_db / init.sql)
+        ExcludeConstraint(
+            ("user_id", "="),
+            (func.tsrange(column("start_time"), column("end_time")), "&&"),
+            name=OVERLAP_CONSTRAINT,
+            using="gist",
+        ),
+    )
+
     @property
     def duration_minutes(self) -> int:
         """Calculate duration in minutes."""
@@ -39,6 +39,7 @@ from app.scheduler.routine import (
 from app.scheduler.service import (
     DaySchedule,
     SchedulerService,
+    build_day_schedule,
 )
 from app.scheduler.priority import (
     PriorityLevel,
@@ -49,12 +50,15 @@ from app.scheduler.priority import (
     elevate_overdue_tasks,
     elevate_due_today_tasks,
     get_tasks_sorted_by_priority,
+    effective_priority_expr,
     sort_tasks_by_priority,
     compare_task_priority,
 )
 from app.scheduler.analytics import (
+    AnalyticsCache,
     AnalyticsPeriod,
     StudyAnalytics,
+    analytics_cache,
     aggregate_sessions,
     get_analytics_for_period,
     calculate_streak,
@@ -98,6 +102,7 @@ __all__ = [
     # Service
     "DaySchedule",
     "SchedulerService",
+    "build_day_schedule",
     # Priority
     "PriorityLevel",
     "calculate_priority",
@@ -107,6 +112,7 @@ __all__ = [
     "elevate_overdue_tasks",
     "elevate_due_today_tasks",
     "get_tasks_sorted_by_priority",
+    "effective_priority_expr",
     "sort_tasks_by_priority",
     "compare_task_priority",
     # Analytics
@@ -117,4 +123,6 @@ __all__ = [
     "calculate_streak",
     "get_subject_breakdown",
     "update_daily_stats",
+    "AnalyticsCache",
+    "analytics_cache",
 ]
@@ -9,17 +9,74 @@ Implements:
 Requirements: 17.2, 17.3, 17.4, 17.5
 """
 
+import time
 from datetime import datetime, date, timedelta
-from typing import Optional, List
+from typing import Any, Hashable, Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import Date, select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.study import StudySession, DailyStudyStats
 from app.models.subject import Subject
 
 
+# How many days back calculate_streak looks (the longest streak it reports)
+MAX_STREAK_DAYS = 366
+
+# Shared by the day-boundary arithmetic below rather than rebuilt per call
+_MIDNIGHT = datetime.min.time()
+_ONE_DAY = timedelta(days=1)
+_STREAK_WINDOW = timedelta(days=MAX_STREAK_DAYS - 1)
+
+
+def today_midnight() -> datetime:
+    """Return midnight at the start of today (local time)."""
+    return datetime.combine(date.today(), _MIDNIGHT)
+
+
+# How long computed analytics are served from memory before re-aggregating
+ANALYTICS_CACHE_TTL_SECONDS = 60.0
+
+
+class AnalyticsCache:
+    """
+    Short-lived per-process cache of computed analytics.
+
+    Keys are tuples whose first item is the user id, so everything cached
+    for a user can be dropped when one of their study sessions ends.
+    """
+
+    # Expired entries are pruned once the cache grows past this many keys
+    MAX_ENTRIES = 1024
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[Hashable, ...], tuple[float, Any]] = {}
+
+    def get(self, key: tuple[Hashable, ...]) -> Any:
+        """Return the cached value for key, or None if missing or stale."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def set(self, key: tuple[Hashable, ...], value: Any) -> None:
+        """Store a freshly computed value."""
+        now = time.monotonic()
+        if len(self._entries) >= self.MAX_ENTRIES:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+        self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget everything cached for a user."""
+        for key in [k for k in self._entries if k[0] == user_id]:
+            del self._entries[key]
+
+
+analytics_cache = AnalyticsCache(ANALYTICS_CACHE_TTL_SECONDS)
+
+
 class AnalyticsPeriod:
     """Analytics period definitions."""
 
@@ -256,36 +313,26 @@ async def calculate_streak(db: AsyncSession, user_id: UUID) -> int:
         Number of consecutive days with study sessions
     """
     today = datetime.utcnow().date()
-    streak = 0
-    current_date = today
 
-    while True:
-        # Check if there's a session on this date
-        day_start = datetime.combine(current_date, datetime.min.time())
-        day_end = day_start + timedelta(days=1)
-
-        result = await db.execute(
-            select(StudySession.id)
-            .where(
-                and_(
-                    StudySession.user_id == user_id,
-                    StudySession.started_at >= day_start,
-                    StudySession.started_at < day_end,
-                    StudySession.ended_at.isnot(None),
-                )
-            )
-            .limit(1)
+    # One query for every day with a completed session in the window; the
+    # streak is then walked back from today in memory
+    window_start = datetime.combine(today - _STREAK_WINDOW, _MIDNIGHT)
+    result = await db.execute(
+        select(func.date(StudySession.started_at, type_=Date))
+        .where(
+            StudySession.user_id == user_id,
+            StudySession.started_at >= window_start,
+            StudySession.ended_at.isnot(None),
         )
+        .distinct()
+    )
+    study_dates = set(result.scalars())
 
-        if result.scalar_one_or_none():
-            streak += 1
-            current_date -= timedelta(days=1)
-        else:
-            break
-
-        # Safety limit
-        if streak > 365:
-            break
+    streak = 0
+    current_date = today
+    while current_date in study_dates:
+        streak += 1
+        current_date -= _ONE_DAY
 
     return streak
 
@@ -380,8 +427,8 @@ async def update_daily_stats(
         Updated DailyStudyStats record
     """
     # Get all sessions for the date
-    day_start = datetime.combine(stat_date, datetime.min.time())
-    day_end = day_start + timedelta(days=1)
+    day_start = datetime.combine(stat_date, _MIDNIGHT)
+    day_end = day_start + _ONE_DAY
 
     result = await db.execute(
         select(StudySession).where(
@@ -60,9 +60,9 @@ class SchedulerError(Exception):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskInput:
-    """Task input for the C scheduler."""
+    """Task input for the C scheduler (slotted; built once per task per run)."""
 
     id: int
     name: str
@@ -12,7 +12,7 @@ from enum import IntEnum
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Task
@@ -247,6 +247,31 @@ async def get_tasks_sorted_by_priority(
     return list(result.scalars().all())
 
 
+def effective_priority_expr(now: Optional[datetime] = None):
+    """
+    SQL expression computing Task.effective_priority.
+
+    Incomplete tasks whose deadline has passed rank as OVERDUE; everything
+    else uses the stored priority.
+
+    Args:
+        now: Reference time (defaults to utcnow, as Task.is_overdue uses)
+
+    Returns:
+        CASE expression usable in SELECT lists and ORDER BY
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    return case(
+        (
+            and_(~Task.is_completed, Task.deadline < now),
+            PriorityLevel.OVERDUE.value,
+        ),
+        else_=Task.priority,
+    )
+
+
 def sort_tasks_by_priority(tasks: list[Task]) -> list[Task]:
     """
     Sort a list of tasks by effective priority (descending).
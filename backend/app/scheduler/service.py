@@ -89,6 +89,57 @@ class DaySchedule:
         }
 
 
+def build_day_schedule(
+    date: datetime,
+    routine_config: RoutineConfig,
+    classes: list[TimetableEntry],
+) -> DaySchedule:
+    """
+    Build a day's blocks and gaps from already loaded data.
+
+    Pure computation with no database access: routine and class blocks are
+    clipped to the active hours, merged, and swept once for gaps.
+
+    Args:
+        date: The date to build the schedule for
+        routine_config: User's routine configuration
+        classes: University classes on that date
+
+    Returns:
+        DaySchedule with blocks, gaps, and classes
+    """
+    routine_generator = RoutineGenerator(routine_config)
+
+    # Get active hours for the day
+    day_start, day_end = routine_generator.get_active_hours(date)
+
+    # Generate routine blocks
+    routine_blocks = routine_generator.generate_routine_blocks(date)
+    class_blocks = [c.to_time_block(date) for c in classes]
+
+    # Combine all fixed blocks
+    all_blocks = routine_blocks + class_blocks
+
+    # Filter blocks to only those within active hours
+    active_blocks = [
+        b for b in all_blocks if b.end_time > day_start and b.start_time < day_end
+    ]
+
+    # Merge overlapping blocks
+    merged_blocks = merge_overlapping_blocks(active_blocks)
+
+    # Find gaps
+    gaps = find_gaps(merged_blocks, day_start, day_end)
+
+    return DaySchedule(
+        date=date,
+        blocks=merged_blocks,
+        gaps=gaps,
+        classes=classes,
+        routine_config=routine_config,
+    )
+
+
 class SchedulerService:
     """
     Main scheduler service for schedule optimization.
@@ -128,41 +179,11 @@ class SchedulerService:
         Returns:
             DaySchedule with blocks, gaps, and classes
         """
-        # Load user's routine config
+        # Load user's routine config and university classes
         routine_config = await load_user_routine_config(self.db, user_id)
-        routine_generator = RoutineGenerator(routine_config)
-
-        # Get active hours for the day
-        day_start, day_end = routine_generator.get_active_hours(date)
-
-        # Generate routine blocks
-        routine_blocks = routine_generator.generate_routine_blocks(date)
-
-        # Get university classes
         classes = await self.timetable_loader.get_date_classes(user_id, date)
-        class_blocks = [c.to_time_block(date) for c in classes]
-
-        # Combine all fixed blocks
-        all_blocks = routine_blocks + class_blocks
-
-        # Filter blocks to only those within active hours
-        active_blocks = [
-            b for b in all_blocks if b.end_time > day_start and b.start_time < day_end
-        ]
 
-        # Merge overlapping blocks
-        merged_blocks = merge_overlapping_blocks(active_blocks)
-
-        # Find gaps
-        gaps = find_gaps(merged_blocks, day_start, day_end)
-
-        return DaySchedule(
-            date=date,
-            blocks=merged_blocks,
-            gaps=gaps,
-            classes=classes,
-            routine_config=routine_config,
-        )
+        return build_day_schedule(date, routine_config, classes)
 
     async def get_week_schedule(
         self,
@@ -179,11 +200,14 @@ class SchedulerService:
         Returns:
             List of DaySchedule for 7 days
         """
+        # The routine config doesn't depend on the day, so load it once
+        routine_config = await load_user_routine_config(self.db, user_id)
+
         schedules = []
         for i in range(7):
             date = start_date + timedelta(days=i)
-            schedule = await self.get_day_schedule(user_id, date)
-            schedules.append(schedule)
+            classes = await self.timetable_loader.get_date_classes(user_id, date)
+            schedules.append(build_day_schedule(date, routine_config, classes))
         return schedules
 
     async def find_deep_work_opportunities(
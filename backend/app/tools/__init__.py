@@ -16,7 +16,10 @@ from app.tools.schedule_tools import (
     get_weekly_timeline,
     reschedule_all,
     set_tool_context,
+    reset_tool_context,
     get_tool_context,
+    mark_prompt_changed,
+    prompt_changed,
 )
 
 from app.tools.planning_tools import (
@@ -75,5 +78,8 @@ __all__ = [
     "get_active_guidelines",
     # Context management
     "set_tool_context",
+    "reset_tool_context",
     "get_tool_context",
+    "mark_prompt_changed",
+    "prompt_changed",
 ]
@@ -17,7 +17,7 @@ from sqlalchemy import select, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.ai import AIMemory, AIGuideline
-from app.tools.schedule_tools import get_tool_context
+from app.tools.schedule_tools import get_tool_context, mark_prompt_changed
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,7 @@ async def save_memory(key: str, value: str) -> dict[str, Any]:
         result = await db.execute(
             select(AIMemory).where(
                 and_(
-                    AIMemory.user_id == UUID(user_id),
+                    AIMemory.user_id == user_id,
                     AIMemory.key == key,
                 )
             )
@@ -57,6 +57,7 @@ async def save_memory(key: str, value: str) -> dict[str, Any]:
             existing.updated_at = datetime.utcnow()
             await db.flush()
             await db.refresh(existing)
+            mark_prompt_changed()
 
             logger.info(f"Updated memory: {key}")
 
@@ -70,7 +71,7 @@ async def save_memory(key: str, value: str) -> dict[str, Any]:
         else:
             # Create new memory
             memory = AIMemory(
-                user_id=UUID(user_id),
+                user_id=user_id,
                 key=key,
                 value=value,
             )
@@ -78,6 +79,7 @@ async def save_memory(key: str, value: str) -> dict[str, Any]:
             db.add(memory)
             await db.flush()
             await db.refresh(memory)
+            mark_prompt_changed()
 
             logger.info(f"Saved new memory: {key}")
 
@@ -117,7 +119,7 @@ async def get_memory(key: str) -> dict[str, Any]:
         result = await db.execute(
             select(AIMemory).where(
                 and_(
-                    AIMemory.user_id == UUID(user_id),
+                    AIMemory.user_id == user_id,
                     AIMemory.key == key,
                 )
             )
@@ -171,7 +173,7 @@ async def forget_memory(key: str) -> dict[str, Any]:
         result = await db.execute(
             delete(AIMemory).where(
                 and_(
-                    AIMemory.user_id == UUID(user_id),
+                    AIMemory.user_id == user_id,
                     AIMemory.key == key,
                 )
             )
@@ -179,6 +181,7 @@ async def forget_memory(key: str) -> dict[str, Any]:
 
         if result.rowcount > 0:
             await db.flush()
+            mark_prompt_changed()
             logger.info(f"Forgot memory: {key}")
 
             return {
@@ -220,7 +223,7 @@ async def add_guideline(guideline: str) -> dict[str, Any]:
     try:
         # Create new guideline
         ai_guideline = AIGuideline(
-            user_id=UUID(user_id),
+            user_id=user_id,
             guideline=guideline,
             is_active=True,
         )
@@ -228,6 +231,7 @@ async def add_guideline(guideline: str) -> dict[str, Any]:
         db.add(ai_guideline)
         await db.flush()
         await db.refresh(ai_guideline)
+        mark_prompt_changed()
 
         logger.info(f"Added guideline: {guideline[:50]}...")
 
@@ -265,7 +269,7 @@ async def list_guidelines() -> dict[str, Any]:
             select(AIGuideline)
             .where(
                 and_(
-                    AIGuideline.user_id == UUID(user_id),
+                    AIGuideline.user_id == user_id,
                     AIGuideline.is_active,
                 )
             )
@@ -314,7 +318,7 @@ async def deactivate_guideline(guideline_id: str) -> dict[str, Any]:
             select(AIGuideline).where(
                 and_(
                     AIGuideline.id == UUID(guideline_id),
-                    AIGuideline.user_id == UUID(user_id),
+                    AIGuideline.user_id == user_id,
                 )
             )
         )
@@ -328,6 +332,7 @@ async def deactivate_guideline(guideline_id: str) -> dict[str, Any]:
 
         guideline.is_active = False
         await db.flush()
+        mark_prompt_changed()
 
         logger.info(f"Deactivated guideline: {guideline_id}")
 
@@ -348,18 +353,18 @@ async def deactivate_guideline(guideline_id: str) -> dict[str, Any]:
 # Helper functions for memory operations (used by prompt builder)
 
 
-async def get_all_memories(db: AsyncSession, user_id: str) -> list[dict[str, Any]]:
+async def get_all_memories(db: AsyncSession, user_id: UUID) -> list[dict[str, Any]]:
     """
     Get all memories for a user.
 
     Args:
         db: Database session
-        user_id: User UUID string
+        user_id: User UUID
 
     Returns:
         List of memory dictionaries
     """
-    result = await db.execute(select(AIMemory).where(AIMemory.user_id == UUID(user_id)))
+    result = await db.execute(select(AIMemory).where(AIMemory.user_id == user_id))
     memories = list(result.scalars().all())
 
     return [
@@ -371,13 +376,13 @@ async def get_all_memories(db: AsyncSession, user_id: str) -> list[dict[str, Any
     ]
 
 
-async def get_active_guidelines(db: AsyncSession, user_id: str) -> list[str]:
+async def get_active_guidelines(db: AsyncSession, user_id: UUID) -> list[str]:
     """
     Get all active guidelines for a user.
 
     Args:
         db: Database session
-        user_id: User UUID string
+        user_id: User UUID
 
     Returns:
         List of guideline strings
@@ -385,7 +390,7 @@ async def get_active_guidelines(db: AsyncSession, user_id: str) -> list[str]:
     result = await db.execute(
         select(AIGuideline).where(
             and_(
-                AIGuideline.user_id == UUID(user_id),
+                AIGuideline.user_id == user_id,
                 AIGuideline.is_active,
             )
         )
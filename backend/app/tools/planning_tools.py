@@ -11,7 +11,6 @@ Requirements: 8.1, 8.2, 8.3, 8.4, 8.5
 import logging
 from datetime import datetime, timedelta
 from typing import Any
-from uuid import UUID
 
 from langchain_core.tools import tool
 
@@ -74,7 +73,7 @@ async def backward_plan(
         available_slots = []
         for day_offset in range(days_available):
             date = today + timedelta(days=day_offset)
-            schedule = await service.get_day_schedule(UUID(user_id), date)
+            schedule = await service.get_day_schedule(user_id, date)
 
             # Collect deep work and standard gaps
             for gap in schedule.gaps:
@@ -189,6 +188,7 @@ async def schedule_chapter_revision(
 
         # Schedule revisions at each interval
         scheduled_revisions = []
+        revision_blocks = []
 
         for interval in SPACED_REPETITION_INTERVALS:
             revision_date = completed + timedelta(days=interval)
@@ -198,7 +198,7 @@ async def schedule_chapter_revision(
                 continue
 
             # Find a suitable gap on that day
-            schedule = await service.get_day_schedule(UUID(user_id), revision_date)
+            schedule = await service.get_day_schedule(user_id, revision_date)
 
             # Look for a standard or micro gap (revision is usually quick)
             suitable_gap = None
@@ -217,7 +217,7 @@ async def schedule_chapter_revision(
                 )  # 30 min max for revision
 
                 time_block = TimeBlock(
-                    user_id=UUID(user_id),
+                    user_id=user_id,
                     title=revision_title,
                     block_type="revision",
                     start_time=suitable_gap.start_time,
@@ -225,7 +225,7 @@ async def schedule_chapter_revision(
                     is_fixed=False,
                 )
 
-                db.add(time_block)
+                revision_blocks.append(time_block)
 
                 scheduled_revisions.append(
                     {
@@ -237,7 +237,11 @@ async def schedule_chapter_revision(
                     }
                 )
 
-        await db.flush()
+        # Written under a savepoint: a rejected block (e.g. an overlap) rolls
+        # back only this tool's writes, not the rest of the chat turn
+        async with db.begin_nested():
+            db.add_all(revision_blocks)
+            await db.flush()
 
         return {
             "success": True,
@@ -311,6 +315,7 @@ async def schedule_event_prep(
         # Find available slots
         total_minutes = int(prep_hours * 60)
         scheduled_blocks = []
+        prep_blocks = []
         remaining_minutes = total_minutes
 
         for day_offset in range(start_days_before):
@@ -318,7 +323,7 @@ async def schedule_event_prep(
                 break
 
             date = event - timedelta(days=day_offset + 1)
-            schedule = await service.get_day_schedule(UUID(user_id), date)
+            schedule = await service.get_day_schedule(user_id, date)
 
             # Prioritize deep work slots for exam prep
             for gap in schedule.gaps:
@@ -337,7 +342,7 @@ async def schedule_event_prep(
                         prep_title = f"Prep: {event_name} ({event_type.title()})"
 
                         time_block = TimeBlock(
-                            user_id=UUID(user_id),
+                            user_id=user_id,
                             title=prep_title,
                             block_type="study",
                             start_time=gap.start_time,
@@ -345,7 +350,7 @@ async def schedule_event_prep(
                             is_fixed=False,
                         )
 
-                        db.add(time_block)
+                        prep_blocks.append(time_block)
 
                         scheduled_blocks.append(
                             {
@@ -359,7 +364,9 @@ async def schedule_event_prep(
 
                         remaining_minutes -= allocate
 
-        await db.flush()
+        async with db.begin_nested():
+            db.add_all(prep_blocks)
+            await db.flush()
 
         hours_scheduled = (total_minutes - remaining_minutes) / 60
 
@@ -409,7 +416,7 @@ async def allocate_free_time(
 
         # Get schedule
         service = SchedulerService(db)
-        schedule = await service.get_day_schedule(UUID(user_id), date)
+        schedule = await service.get_day_schedule(user_id, date)
 
         # Find a suitable gap (prefer afternoon/evening for free time)
         suitable_gap = None
@@ -430,7 +437,7 @@ async def allocate_free_time(
 
         # Create free time block
         time_block = TimeBlock(
-            user_id=UUID(user_id),
+            user_id=user_id,
             title="Free Time - Relax & Recharge",
             block_type="free_time",
             start_time=suitable_gap.start_time,
@@ -438,8 +445,9 @@ async def allocate_free_time(
             is_fixed=False,
         )
 
-        db.add(time_block)
-        await db.flush()
+        async with db.begin_nested():
+            db.add(time_block)
+            await db.flush()
         await db.refresh(time_block)
 
         return {
@@ -487,7 +495,7 @@ async def find_deep_work_slots(
         # Get schedule
         service = SchedulerService(db)
         deep_work_gaps = await service.find_deep_work_opportunities(
-            UUID(user_id),
+            user_id,
             date,
             min_duration_minutes,
         )
@@ -8,6 +8,8 @@ Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6
 """
 
 import logging
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
@@ -24,23 +26,58 @@ from app.scheduler.bridge import TaskInput
 logger = logging.getLogger(__name__)
 
 
-# Global user_id for tool context (set by the agent before tool execution)
-_current_user_id: Optional[str] = None
-_current_db_session: Optional[AsyncSession] = None
+@dataclass
+class ToolContext:
+    """User and database session the tools act on for the current request."""
 
+    user_id: UUID
+    db: AsyncSession
+    # Set when a tool changes the user's memories or guidelines, so the
+    # cached prompt sections are dropped once the request commits
+    prompt_changed: bool = False
 
-def set_tool_context(user_id: str, db: AsyncSession) -> None:
-    """Set the current user context for tools."""
-    global _current_user_id, _current_db_session
-    _current_user_id = user_id
-    _current_db_session = db
 
+# Per-request tool context. asyncio copies context variables into each task,
+# so concurrent requests never see each other's user or session.
+_tool_context: ContextVar[Optional[ToolContext]] = ContextVar(
+    "tool_context", default=None
+)
 
-def get_tool_context() -> tuple[str, AsyncSession]:
+
+def set_tool_context(user_id: UUID, db: AsyncSession) -> Token[Optional[ToolContext]]:
+    """
+    Set the current user context for tools.
+
+    Returns:
+        Token that reset_tool_context uses to restore the previous context
+    """
+    return _tool_context.set(ToolContext(user_id=user_id, db=db))
+
+
+def reset_tool_context(token: Token[Optional[ToolContext]]) -> None:
+    """Restore the tool context that was current before set_tool_context."""
+    _tool_context.reset(token)
+
+
+def get_tool_context() -> tuple[UUID, AsyncSession]:
     """Get the current tool context."""
-    if _current_user_id is None or _current_db_session is None:
+    ctx = _tool_context.get()
+    if ctx is None:
         raise RuntimeError("Tool context not set. Call set_tool_context first.")
-    return _current_user_id, _current_db_session
+    return ctx.user_id, ctx.db
+
+
+def mark_prompt_changed() -> None:
+    """Record that the current request changed the user's prompt inputs."""
+    ctx = _tool_context.get()
+    if ctx is not None:
+        ctx.prompt_changed = True
+
+
+def prompt_changed() -> bool:
+    """Whether a tool changed the user's memories or guidelines."""
+    ctx = _tool_context.get()
+    return ctx is not None and ctx.prompt_changed
 
 
 @tool
@@ -77,7 +114,7 @@ async def create_time_block(
 
         # Create the time block
         time_block = TimeBlock(
-            user_id=UUID(user_id),
+            user_id=user_id,
             title=title,
             block_type=block_type,
             start_time=start_dt,
@@ -86,8 +123,11 @@ async def create_time_block(
             task_id=UUID(task_id) if task_id else None,
         )
 
-        db.add(time_block)
-        await db.flush()
+        # Written under a savepoint: a rejected block (e.g. an overlap) rolls
+        # back only this write, not the rest of the chat turn's session
+        async with db.begin_nested():
+            db.add(time_block)
+            await db.flush()
         await db.refresh(time_block)
 
         logger.info(f"Created time block: {title} at {start_time}")
@@ -135,7 +175,7 @@ async def move_time_block(
         result = await db.execute(
             select(TimeBlock).where(
                 TimeBlock.id == UUID(block_id),
-                TimeBlock.user_id == UUID(user_id),
+                TimeBlock.user_id == user_id,
             )
         )
         time_block = result.scalar_one_or_none()
@@ -157,11 +197,11 @@ async def move_time_block(
         new_start_dt = datetime.fromisoformat(new_start_time)
         new_end_dt = new_start_dt + old_duration
 
-        # Update the block
-        time_block.start_time = new_start_dt
-        time_block.end_time = new_end_dt
-
-        await db.flush()
+        # Update the block under a savepoint, as in create_time_block
+        async with db.begin_nested():
+            time_block.start_time = new_start_dt
+            time_block.end_time = new_end_dt
+            await db.flush()
         await db.refresh(time_block)
 
         logger.info(f"Moved time block {block_id} to {new_start_time}")
@@ -204,7 +244,7 @@ async def delete_time_block(block_id: str) -> dict[str, Any]:
         result = await db.execute(
             select(TimeBlock).where(
                 TimeBlock.id == UUID(block_id),
-                TimeBlock.user_id == UUID(user_id),
+                TimeBlock.user_id == user_id,
             )
         )
         time_block = result.scalar_one_or_none()
@@ -264,7 +304,7 @@ async def get_optimized_schedule(target_date: str) -> dict[str, Any]:
 
         # Get the schedule using the scheduler service
         service = SchedulerService(db)
-        schedule = await service.get_day_schedule(UUID(user_id), date)
+        schedule = await service.get_day_schedule(user_id, date)
 
         return {
             "success": True,
@@ -302,7 +342,7 @@ async def get_weekly_timeline(start_date: str) -> dict[str, Any]:
 
         # Get the week schedule
         service = SchedulerService(db)
-        schedules = await service.get_week_schedule(UUID(user_id), date)
+        schedules = await service.get_week_schedule(user_id, date)
 
         return {
             "success": True,
@@ -354,7 +394,7 @@ async def reschedule_all(
         result = await db.execute(
             select(Task)
             .where(
-                Task.user_id == UUID(user_id),
+                Task.user_id == user_id,
                 ~Task.is_completed,
             )
             .order_by(Task.priority.desc())
@@ -394,7 +434,7 @@ async def reschedule_all(
         # Get the scheduler service and optimize
         service = SchedulerService(db)
         schedule_result = await service.optimize_schedule(
-            UUID(user_id),
+            user_id,
             task_inputs,
             date,
             num_days,
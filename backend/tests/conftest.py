@@ -1,7 +1,18 @@
 """Pytest configuration and fixtures for AESA backend tests."""
 
+import os
+from typing import AsyncGenerator, Callable
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
 import pytest
 from datetime import datetime, time, timedelta
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Connect without a pool while testing (see app.core.database)
+os.environ.setdefault("TESTING", "true")
 
 
 @pytest.fixture
@@ -20,3 +31,43 @@ def day_start(sample_date: datetime) -> datetime:
 def day_end(sample_date: datetime) -> datetime:
     """Provide a typical day end time (11:00 PM)."""
     return sample_date.replace(hour=23, minute=0)
+
+
+@pytest.fixture
+def mock_db() -> AsyncMock:
+    """Mock AsyncSession; tests set execute's return value per statement."""
+    session = AsyncMock(spec=AsyncSession)
+    session.add = MagicMock()
+    return session
+
+
+@pytest.fixture
+def api_client(mock_db: AsyncMock) -> Callable[..., TestClient]:
+    """
+    Build a TestClient for some API routers, backed by mock_db.
+
+    The current user is a fresh User, so per-user caches start empty.
+    """
+
+    def build(*routers: APIRouter) -> TestClient:
+        from app.api.schedule import get_current_user, get_current_user_id
+        from app.core.database import get_db
+        from app.models import User
+
+        user = User(id=uuid4(), email="test@example.com", name="Test User")
+
+        async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+            yield mock_db
+
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router, prefix="/api")
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = lambda: user
+        app.dependency_overrides[get_current_user_id] = lambda: user.id
+
+        client = TestClient(app)
+        client.user = user  # type: ignore[attr-defined]
+        return client
+
+    return build
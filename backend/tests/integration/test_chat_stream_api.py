@@ -0,0 +1,197 @@
+"""
+Integration tests for the streaming chat endpoint.
+
+The agent, the LLM health check and the stream's own database session are
+mocked, so these cover the Server-Sent Events frames the endpoint emits and
+how it commits or rolls back, not the LangGraph run itself.
+
+Requirements: 6.1, 6.6
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.api import chat as chat_api
+from app.tools import get_tool_context, mark_prompt_changed
+
+
+class FakeAgent:
+    """Agent stand-in that replays events, then optionally raises."""
+
+    def __init__(
+        self,
+        events: list[dict[str, Any]],
+        error: Optional[Exception] = None,
+        on_stream: Any = None,
+    ) -> None:
+        self.events = events
+        self.error = error
+        self.on_stream = on_stream
+
+    async def stream_message(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        if self.on_stream is not None:
+            self.on_stream()
+        for event in self.events:
+            yield event
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def stream_db(mock_db, monkeypatch):
+    """Make mock_db the stream's own session and stub the prompt preamble."""
+
+    @asynccontextmanager
+    async def session_maker():
+        yield mock_db
+
+    async def load_prompt_and_settings(db, user_id, context):
+        return "system prompt", None
+
+    monkeypatch.setattr(chat_api, "async_session_maker", session_maker)
+    monkeypatch.setattr(chat_api, "_load_prompt_and_settings", load_prompt_and_settings)
+    return mock_db
+
+
+@pytest.fixture
+def client(api_client, stream_db):
+    return api_client(chat_api.router)
+
+
+def _llm_available(monkeypatch, available: bool) -> None:
+    async def check_llm_availability() -> bool:
+        return available
+
+    monkeypatch.setattr(chat_api, "check_llm_availability", check_llm_availability)
+
+
+def _use_agent(monkeypatch, agent: FakeAgent) -> None:
+    monkeypatch.setattr(chat_api, "get_agent", lambda **kwargs: agent)
+
+
+def _stream(client, message: str = "Plan my week") -> list[dict[str, Any]]:
+    """POST to /api/chat/stream and decode the SSE data frames."""
+    response = client.post(
+        "/api/chat/stream", json={"message": message, "user_id": str(uuid4())}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    frames = response.text.split("\n\n")
+    assert frames.pop() == ""
+    return [orjson.loads(frame.removeprefix("data: ")) for frame in frames]
+
+
+class TestChatStream:
+    """POST /api/chat/stream"""
+
+    def test_frames_follow_agent_events(self, client, mock_db, monkeypatch):
+        _llm_available(monkeypatch, True)
+        _use_agent(
+            monkeypatch,
+            FakeAgent(
+                [
+                    {"type": "token", "content": "Let me check. "},
+                    {
+                        "type": "tool_call",
+                        "name": "get_weekly_timeline",
+                        "arguments": {},
+                    },
+                    {
+                        "type": "tool_result",
+                        "name": "get_weekly_timeline",
+                        "content": "[]",
+                    },
+                    {"type": "token", "content": "Your week is free."},
+                ]
+            ),
+        )
+
+        frames = _stream(client)
+
+        assert [frame["type"] for frame in frames] == [
+            "token",
+            "tool_call",
+            "tool_result",
+            "token",
+            "done",
+        ]
+        assert frames[-1]["error"] is None
+        mock_db.commit.assert_awaited_once()
+        mock_db.rollback.assert_not_awaited()
+
+    def test_agent_error_event_is_reported_in_done(self, client, mock_db, monkeypatch):
+        _llm_available(monkeypatch, True)
+        _use_agent(
+            monkeypatch,
+            FakeAgent([{"type": "error", "content": "fallback", "error": "boom"}]),
+        )
+
+        frames = _stream(client)
+
+        assert [frame["type"] for frame in frames] == ["error", "done"]
+        assert frames[-1]["error"] == "boom"
+
+    def test_llm_unavailable_sends_fallback(self, client, mock_db, monkeypatch):
+        _llm_available(monkeypatch, False)
+        _use_agent(monkeypatch, FakeAgent([]))
+
+        frames = _stream(client, "Hello")
+
+        assert [frame["type"] for frame in frames] == ["token", "done"]
+        assert frames[0]["content"] == chat_api.get_fallback_message("Hello")
+        assert frames[1]["error"] == "LLM service unavailable"
+        mock_db.commit.assert_not_awaited()
+
+    def test_exception_rolls_back_and_ends_stream(self, client, mock_db, monkeypatch):
+        _llm_available(monkeypatch, True)
+        _use_agent(
+            monkeypatch,
+            FakeAgent(
+                [{"type": "token", "content": "Partial"}],
+                error=RuntimeError("connection lost"),
+            ),
+        )
+
+        frames = _stream(client)
+
+        assert [frame["type"] for frame in frames] == ["token", "error", "done"]
+        assert frames[1]["error"] == "connection lost"
+        assert frames[2]["error"] == "connection lost"
+        mock_db.rollback.assert_awaited_once()
+        mock_db.commit.assert_not_awaited()
+
+    def test_prompt_cache_is_invalidated_after_commit(
+        self, client, mock_db, monkeypatch
+    ):
+        invalidated = []
+        monkeypatch.setattr(chat_api, "invalidate_prompt_cache", invalidated.append)
+        mock_db.commit.side_effect = lambda: invalidated.append("commit")
+        _llm_available(monkeypatch, True)
+        _use_agent(monkeypatch, FakeAgent([], on_stream=mark_prompt_changed))
+
+        _stream(client)
+
+        assert invalidated[0] == "commit"
+        assert len(invalidated) == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_context_is_reset_when_stream_ends(self, stream_db, monkeypatch):
+        seen = []
+        _llm_available(monkeypatch, True)
+        _use_agent(
+            monkeypatch,
+            FakeAgent([], on_stream=lambda: seen.append(get_tool_context())),
+        )
+        request = chat_api.ChatRequest(message="Hi", user_id=uuid4())
+
+        async for _ in chat_api._chat_event_stream(request):
+            pass
+
+        assert seen == [(request.user_id, stream_db)]
+        with pytest.raises(RuntimeError):
+            get_tool_context()
@@ -47,8 +47,8 @@ class TestEnvironmentConfiguration:
         
         with patch.dict(os.environ, {"DATABASE_URL": test_url}):
             # Clear cache to force reload
-            from app.core.config import get_settings
-            get_settings.cache_clear()
+            from app.core.config import reset_settings
+            reset_settings()
             
             settings = Settings()
             assert settings.database_url == test_url
@@ -66,7 +66,25 @@ class TestEnvironmentConfiguration:
         with patch.dict(os.environ, {"COPILOT_API_URL": test_url}):
             settings = Settings()
             assert settings.copilot_api_url == test_url
-    
+
+    def test_copilot_endpoints_follow_reset_settings(self):
+        """The LLM client picks up a changed COPILOT_API_URL after reset_settings()."""
+        from app.agent.llm import _copilot_endpoints
+        from app.core.config import reset_settings
+
+        test_url = "http://custom-copilot:8080"
+
+        try:
+            _copilot_endpoints()
+            with patch.dict(os.environ, {"COPILOT_API_URL": test_url}):
+                reset_settings()
+                assert _copilot_endpoints() == (
+                    f"{test_url}/health",
+                    f"{test_url}/v1",
+                )
+        finally:
+            reset_settings()
+
     def test_engine_path_configuration(self):
         """
         Test ENGINE_PATH environment variable.
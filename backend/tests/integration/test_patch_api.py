@@ -0,0 +1,195 @@
+"""
+Integration tests for the task and time block PATCH endpoints.
+
+The database session is mocked: db.get serves the row the guards re-read and
+db.execute the results of the UPDATE ... RETURNING and the overlap lookup.
+These cover the no-op early return and the status codes reported when the
+guarded UPDATE changes no row, not the SQL itself.
+
+Requirements: 5.1
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api import tasks as tasks_api
+from app.api import timeline as timeline_api
+from app.models import Task, TimeBlock
+
+START = datetime(2025, 12, 29, 9, 0, 0)
+
+
+def db_result(scalar: Any = None) -> MagicMock:
+    """Result of a mocked db.execute."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = scalar
+    return result
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(tasks_api.router, timeline_api.router)
+
+
+def _task(user_id) -> Task:
+    now = datetime.utcnow()
+    return Task(
+        id=uuid4(),
+        user_id=user_id,
+        title="Read chapter 3",
+        task_type="study",
+        duration_minutes=60,
+        priority=50,
+        is_completed=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _block(user_id, *, is_fixed: bool = False) -> TimeBlock:
+    return TimeBlock(
+        id=uuid4(),
+        user_id=user_id,
+        title="Study COMP101",
+        block_type="study",
+        start_time=START,
+        end_time=START + timedelta(hours=1),
+        is_fixed=is_fixed,
+    )
+
+
+class TestUpdateTask:
+    """PATCH /api/tasks/{id}"""
+
+    def test_noop_patch_returns_task_without_writing(self, client, mock_db):
+        task = _task(client.user.id)
+        mock_db.get.return_value = task
+
+        response = client.patch(f"/api/tasks/{task.id}", json={})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Read chapter 3"
+        mock_db.execute.assert_not_awaited()
+        mock_db.commit.assert_not_awaited()
+
+    def test_noop_patch_of_foreign_task_returns_404(self, client, mock_db):
+        task = _task(uuid4())
+        mock_db.get.return_value = task
+
+        response = client.patch(f"/api/tasks/{task.id}", json={})
+
+        assert response.status_code == 404
+
+    def test_update_of_missing_task_returns_404(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=None)
+
+        response = client.patch(f"/api/tasks/{uuid4()}", json={"title": "New"})
+
+        assert response.status_code == 404
+        mock_db.commit.assert_not_awaited()
+
+
+class TestUpdateTimeBlock:
+    """PATCH /api/timeline/blocks/{id} and the _check_block_update guards."""
+
+    def test_noop_patch_returns_block_without_writing(self, client, mock_db):
+        block = _block(client.user.id)
+        mock_db.get.return_value = block
+
+        response = client.patch(f"/api/timeline/blocks/{block.id}", json={})
+
+        assert response.status_code == 200
+        assert response.json()["block"]["title"] == "Study COMP101"
+        mock_db.execute.assert_not_awaited()
+        mock_db.commit.assert_not_awaited()
+
+    def test_update_applies_returned_row(self, client, mock_db):
+        block = _block(client.user.id)
+        block.title = "Renamed"
+        mock_db.execute.return_value = db_result(scalar=block)
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}", json={"title": "Renamed"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["block"]["title"] == "Renamed"
+        mock_db.commit.assert_awaited_once()
+
+    def test_foreign_block_returns_404(self, client, mock_db):
+        block = _block(uuid4())
+        mock_db.execute.return_value = db_result(scalar=None)
+        mock_db.get.return_value = block
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}", json={"title": "Mine now"}
+        )
+
+        assert response.status_code == 404
+        mock_db.commit.assert_not_awaited()
+
+    def test_fixed_block_returns_400(self, client, mock_db):
+        block = _block(client.user.id, is_fixed=True)
+        mock_db.execute.return_value = db_result(scalar=None)
+        mock_db.get.return_value = block
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}", json={"title": "Moved lecture"}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cannot modify fixed time blocks"
+
+    def test_inverted_range_returns_400(self, client, mock_db):
+        block = _block(client.user.id)
+        mock_db.execute.return_value = db_result(scalar=None)
+        mock_db.get.return_value = block
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}",
+            json={"end_time": (START - timedelta(minutes=30)).isoformat()},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "End time must be after start time"
+
+    def test_overlap_returns_409_naming_the_block(self, client, mock_db):
+        block = _block(client.user.id)
+        mock_db.execute.side_effect = [
+            db_result(scalar=None),  # guarded UPDATE changed nothing
+            db_result(scalar="Lecture"),  # overlap lookup
+        ]
+        mock_db.get.return_value = block
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}",
+            json={"start_time": (START + timedelta(minutes=30)).isoformat()},
+        )
+
+        assert response.status_code == 409
+        assert response.json()["detail"] == "New time range overlaps with: Lecture"
+        mock_db.commit.assert_not_awaited()
+
+    def test_concurrent_change_returns_409(self, client, mock_db):
+        block = _block(client.user.id)
+        mock_db.execute.side_effect = [db_result(scalar=None), db_result(scalar=None)]
+        mock_db.get.return_value = block
+
+        response = client.patch(
+            f"/api/timeline/blocks/{block.id}", json={"title": "Renamed"}
+        )
+
+        assert response.status_code == 409
+        assert response.json()["detail"] == "Time block was modified concurrently"
+
+    def test_unknown_block_type_is_rejected(self, client, mock_db):
+        response = client.patch(
+            f"/api/timeline/blocks/{uuid4()}", json={"block_type": "party"}
+        )
+
+        assert response.status_code == 422
+        mock_db.execute.assert_not_awaited()
@@ -0,0 +1,184 @@
+"""
+Integration tests for the timer REST endpoints.
+
+The database session is mocked: each test queues the results of the
+statements the endpoint runs, so these cover the endpoint logic around the
+single-statement writes and the cached status, not the SQL itself.
+
+Requirements: 15.2
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api import timer as timer_api
+from app.models import ActiveTimer, Subject
+
+
+def db_result(scalar: Any = None, row: Any = None) -> MagicMock:
+    """Result of a mocked db.execute."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = scalar
+    result.one_or_none.return_value = row
+    return result
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(timer_api.router)
+
+
+def _running_timer(user_id, code: Optional[str] = "COMP101") -> ActiveTimer:
+    subject = Subject(id=uuid4(), user_id=user_id, code=code, name="Programming")
+    return ActiveTimer(
+        user_id=user_id,
+        subject_id=subject.id,
+        subject=subject,
+        started_at=datetime.utcnow() - timedelta(minutes=5),
+    )
+
+
+class TestTimerStatus:
+    """GET /api/timer/status: cached state, ETag and 304 revalidation."""
+
+    def test_idle_status_and_etag(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=None)
+
+        response = client.get("/api/timer/status")
+
+        assert response.status_code == 200
+        assert response.json()["is_running"] is False
+        assert response.headers["etag"] == '"idle"'
+
+    def test_matching_etag_returns_304(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=_running_timer(client.user.id))
+        etag = client.get("/api/timer/status").headers["etag"]
+
+        response = client.get("/api/timer/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_stale_etag_returns_body(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=_running_timer(client.user.id))
+
+        response = client.get("/api/timer/status", headers={"If-None-Match": '"idle"'})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["is_running"] is True
+        assert body["subject_code"] == "COMP101"
+        assert body["elapsed_minutes"] == 5
+
+    def test_status_is_served_from_cache(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=None)
+
+        client.get("/api/timer/status")
+        client.get("/api/timer/status")
+
+        assert mock_db.execute.await_count == 1
+
+    def test_cached_status_expires(self, client, mock_db, monkeypatch):
+        monkeypatch.setattr(timer_api._timer_states, "ttl", 0.0)
+        mock_db.execute.return_value = db_result(scalar=None)
+
+        client.get("/api/timer/status")
+        mock_db.execute.return_value = db_result(scalar=_running_timer(client.user.id))
+        response = client.get("/api/timer/status")
+
+        assert mock_db.execute.await_count == 2
+        assert response.json()["is_running"] is True
+
+    def test_subject_change_changes_etag(self, client, mock_db, monkeypatch):
+        monkeypatch.setattr(timer_api._timer_states, "ttl", 0.0)
+        timer = _running_timer(client.user.id)
+        mock_db.execute.return_value = db_result(scalar=timer)
+        etag = client.get("/api/timer/status").headers["etag"]
+
+        timer.subject.code = "COMP102"
+        response = client.get("/api/timer/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["subject_code"] == "COMP102"
+
+    def test_invalidate_forces_a_reread(self, client, mock_db):
+        mock_db.execute.return_value = db_result(scalar=None)
+        client.get("/api/timer/status")
+
+        timer_api.invalidate_timer_status(client.user.id)
+        client.get("/api/timer/status")
+
+        assert mock_db.execute.await_count == 2
+
+
+class TestStartTimer:
+    """POST /api/timer/start: reporting why the INSERT inserted nothing."""
+
+    def test_start_returns_subject_code(self, client, mock_db):
+        mock_db.execute.return_value = db_result(row=("COMP101",))
+
+        response = client.post("/api/timer/start", json={"subject_id": str(uuid4())})
+
+        assert response.status_code == 200
+        assert response.json()["subject_code"] == "COMP101"
+        mock_db.commit.assert_awaited_once()
+
+    def test_second_start_returns_400(self, client, mock_db):
+        mock_db.execute.return_value = db_result(row=None)
+
+        response = client.post("/api/timer/start")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Timer already running. Stop it first."
+        mock_db.commit.assert_not_awaited()
+
+    def test_running_timer_wins_over_bad_subject(self, client, mock_db):
+        mock_db.execute.return_value = db_result(row=None)
+        mock_db.get.return_value = _running_timer(client.user.id)
+
+        response = client.post("/api/timer/start", json={"subject_id": str(uuid4())})
+
+        assert response.status_code == 400
+
+    def test_foreign_subject_returns_404(self, client, mock_db):
+        mock_db.execute.return_value = db_result(row=None)
+        mock_db.get.return_value = None
+
+        response = client.post("/api/timer/start", json={"subject_id": str(uuid4())})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Subject not found"
+        mock_db.commit.assert_not_awaited()
+
+
+class TestStopTimer:
+    """POST /api/timer/stop"""
+
+    def test_stop_records_session(self, client, mock_db):
+        session_id = uuid4()
+        row = SimpleNamespace(id=session_id, duration_minutes=95, is_deep_work=True)
+        mock_db.execute.return_value = db_result(row=row)
+
+        response = client.post("/api/timer/stop")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["session_id"] == str(session_id)
+        assert body["duration_minutes"] == 95
+        assert body["is_deep_work"] is True
+        mock_db.commit.assert_awaited_once()
+
+    def test_stop_with_no_timer_returns_400(self, client, mock_db):
+        mock_db.execute.return_value = db_result(row=None)
+
+        response = client.post("/api/timer/stop")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "No timer running"
+        mock_db.commit.assert_not_awaited()
@@ -7,194 +7,167 @@ Property-based tests for session duration auto-calculation.
 For any study session that is stopped, the duration_minutes field SHALL equal
 the difference between ended_at and started_at timestamps (in minutes), and
 is_deep_work SHALL be true if and only if duration_minutes >= 90.
+
+Both fields are generated by Postgres, so the properties are checked against
+the generation expressions themselves. Evaluating them needs a running
+database; without one those tests are skipped.
 """
 
+import asyncio
+import re
 from datetime import datetime, timedelta
-from hypothesis import given, strategies as st, settings, assume
-import uuid
+from pathlib import Path
+from typing import Optional
 
-from app.models.study import StudySession
+import pytest
+from hypothesis import given, strategies as st, settings
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
+from app.core.database import engine
+from app.models.study import (
+    DEEP_WORK_SESSION_MINUTES,
+    SESSION_DEEP_WORK_SQL,
+    SESSION_DURATION_SQL,
+    StudySession,
+)
 
-class TestSessionDurationAutoCalculation:
-    """
-    Property 15: Session Duration Auto-Calculation
-    
-    Feature: aesa-core-scheduling, Property 15: Session Duration Auto-Calculation
-    Validates: Requirements 11.3, 11.4, 15.3, 15.4
-    """
-    
-    @given(st.integers(min_value=1, max_value=480))
-    @settings(max_examples=100)
-    def test_duration_equals_time_difference(self, duration_minutes: int):
-        """
-        For any session, duration_minutes should equal the difference
-        between ended_at and started_at in minutes.
-        """
-        # Create a session with known start time
-        started_at = datetime(2025, 1, 1, 10, 0, 0)
-        
-        session = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
-        )
-        
-        # Manually set ended_at to simulate the stop
-        session.ended_at = started_at + timedelta(minutes=duration_minutes)
-        session.duration_minutes = int(
-            (session.ended_at - session.started_at).total_seconds() / 60
-        )
-        session.is_deep_work = session.duration_minutes >= 90
-        
-        # Verify duration calculation
-        expected_duration = duration_minutes
-        assert session.duration_minutes == expected_duration, (
-            f"Duration should be {expected_duration}, got {session.duration_minutes}"
-        )
-    
-    @given(st.integers(min_value=90, max_value=480))
-    @settings(max_examples=100)
-    def test_deep_work_true_for_90_plus_minutes(self, duration_minutes: int):
-        """
-        For any session >= 90 minutes, is_deep_work should be True.
-        """
-        started_at = datetime(2025, 1, 1, 10, 0, 0)
-        
-        session = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
+INIT_SQL = Path(__file__).resolve().parents[3] / "database" / "init.sql"
+
+_EVALUATE = text(
+    f"SELECT {SESSION_DURATION_SQL}, {SESSION_DEEP_WORK_SQL} "
+    "FROM (VALUES (CAST(:started_at AS TIMESTAMP), CAST(:ended_at AS TIMESTAMP))) "
+    "AS t(started_at, ended_at)"
+)
+
+
+def _normalize(sql: str) -> str:
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+async def _evaluate_async(
+    pairs: list[tuple[datetime, Optional[datetime]]],
+) -> list[tuple[Optional[int], bool]]:
+    async with engine.connect() as conn:
+        rows = []
+        for started_at, ended_at in pairs:
+            result = await conn.execute(
+                _EVALUATE, {"started_at": started_at, "ended_at": ended_at}
+            )
+            rows.append(tuple(result.one()))
+        return rows
+
+
+def _evaluate(
+    pairs: list[tuple[datetime, Optional[datetime]]],
+) -> list[tuple[Optional[int], bool]]:
+    """(duration_minutes, is_deep_work) as Postgres generates them."""
+    return asyncio.run(_evaluate_async(pairs))
+
+
+@pytest.fixture(scope="module")
+def database() -> None:
+    """Skip unless the configured database is reachable."""
+    try:
+        _evaluate([(datetime(2025, 1, 1), None)])
+    except Exception as e:  # no server, wrong credentials, ...
+        pytest.skip(f"Requires running PostgreSQL database: {e}")
+
+
+class TestGeneratedColumnDefinitions:
+    """The generation expressions are the ones the schema actually uses."""
+
+    def test_model_columns_are_generated_from_expressions(self):
+        ddl = _normalize(
+            str(
+                CreateTable(StudySession.__table__).compile(
+                    dialect=postgresql.dialect()
+                )
+            )
         )
-        
-        # Stop the session after the specified duration
-        session.stop()
-        # Override ended_at to control duration
-        session.ended_at = started_at + timedelta(minutes=duration_minutes)
-        session.duration_minutes = duration_minutes
-        session.is_deep_work = session.duration_minutes >= 90
-        
-        assert session.is_deep_work is True, (
-            f"Session of {duration_minutes} minutes should be deep work"
+        assert (
+            f"duration_minutes INTEGER GENERATED ALWAYS AS ({SESSION_DURATION_SQL}) STORED"
+            in ddl
         )
-    
-    @given(st.integers(min_value=1, max_value=89))
-    @settings(max_examples=100)
-    def test_deep_work_false_for_under_90_minutes(self, duration_minutes: int):
-        """
-        For any session < 90 minutes, is_deep_work should be False.
-        """
-        started_at = datetime(2025, 1, 1, 10, 0, 0)
-        
-        session = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
+        assert (
+            f"is_deep_work BOOLEAN GENERATED ALWAYS AS ({SESSION_DEEP_WORK_SQL}) STORED"
+            in ddl
         )
-        
-        # Set duration manually
-        session.ended_at = started_at + timedelta(minutes=duration_minutes)
-        session.duration_minutes = duration_minutes
-        session.is_deep_work = session.duration_minutes >= 90
-        
-        assert session.is_deep_work is False, (
-            f"Session of {duration_minutes} minutes should NOT be deep work"
+
+    def test_init_sql_uses_the_same_expressions(self):
+        init_sql = _normalize(INIT_SQL.read_text())
+        assert (
+            f"duration_minutes INT GENERATED ALWAYS AS ( {SESSION_DURATION_SQL} ) STORED"
+            in init_sql
         )
-    
-    @given(st.integers(min_value=1, max_value=480))
-    @settings(max_examples=100)
-    def test_stop_method_calculates_correctly(self, duration_minutes: int):
-        """
-        For any session, calling stop() should correctly calculate
-        duration and deep work status.
-        """
-        # Use a fixed reference time to avoid timing issues
-        started_at = datetime(2025, 1, 1, 10, 0, 0)
-        
-        session = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
+        assert (
+            f"is_deep_work BOOLEAN GENERATED ALWAYS AS ( {SESSION_DEEP_WORK_SQL} ) STORED"
+            in init_sql
         )
-        
-        # Simulate stop by setting ended_at and calculating
-        session.ended_at = started_at + timedelta(minutes=duration_minutes)
-        delta = session.ended_at - session.started_at
-        session.duration_minutes = int(delta.total_seconds() / 60)
-        session.is_deep_work = session.duration_minutes >= 90
-        
-        # Verify
+
+    def test_deep_work_threshold_is_90_minutes(self):
+        assert DEEP_WORK_SESSION_MINUTES == 90
+        assert ">= 5400," in SESSION_DEEP_WORK_SQL
+
+    def test_stop_only_stamps_ended_at(self):
+        session = StudySession(started_at=datetime(2025, 1, 1, 10, 0, 0))
+        session.stop()
+
         assert session.ended_at is not None
-        assert session.duration_minutes == duration_minutes
-        assert session.is_deep_work == (duration_minutes >= 90)
-    
+        # Left to Postgres
+        assert session.duration_minutes is None
+
+
+@pytest.mark.usefixtures("database")
+class TestSessionDurationAutoCalculation:
+    """
+    Property 15: Session Duration Auto-Calculation
+
+    Feature: aesa-core-scheduling, Property 15: Session Duration Auto-Calculation
+    Validates: Requirements 11.3, 11.4, 15.3, 15.4
+    """
+
     @given(
-        st.integers(min_value=0, max_value=23),
-        st.integers(min_value=0, max_value=59),
-        st.integers(min_value=1, max_value=480),
+        st.lists(
+            st.tuples(
+                st.datetimes(
+                    min_value=datetime(2024, 1, 1), max_value=datetime(2026, 12, 31)
+                ),
+                st.integers(min_value=0, max_value=8 * 3600),
+            ),
+            min_size=1,
+            max_size=20,
+        )
     )
-    @settings(max_examples=100)
-    def test_duration_independent_of_start_time(
-        self, start_hour: int, start_minute: int, duration_minutes: int
+    @settings(max_examples=25, deadline=None)
+    def test_duration_and_deep_work_follow_timestamps(
+        self, sessions: list[tuple[datetime, int]]
     ):
         """
-        For any start time, the duration calculation should be consistent.
-        """
-        started_at = datetime(2025, 1, 15, start_hour, start_minute, 0)
-        
-        session = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
-        )
-        
-        session.ended_at = started_at + timedelta(minutes=duration_minutes)
-        delta = session.ended_at - session.started_at
-        session.duration_minutes = int(delta.total_seconds() / 60)
-        session.is_deep_work = session.duration_minutes >= 90
-        
-        assert session.duration_minutes == duration_minutes
-    
-    @settings(max_examples=100)
-    @given(st.integers(min_value=1, max_value=480))
-    def test_deep_work_boundary_at_90_minutes(self, _: int):
-        """
-        Test the exact boundary condition at 90 minutes.
+        duration_minutes is the elapsed time in whole minutes, and
+        is_deep_work holds exactly when it is at least 90.
         """
+        pairs = [
+            (started_at, started_at + timedelta(seconds=seconds))
+            for started_at, seconds in sessions
+        ]
+
+        for (_, seconds), (duration, is_deep_work) in zip(sessions, _evaluate(pairs)):
+            assert duration == seconds // 60
+            assert is_deep_work is (duration >= 90)
+
+    def test_deep_work_boundary_at_90_minutes(self):
         started_at = datetime(2025, 1, 1, 10, 0, 0)
-        
-        # Test exactly 89 minutes (not deep work)
-        session_89 = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
-        )
-        session_89.ended_at = started_at + timedelta(minutes=89)
-        session_89.duration_minutes = 89
-        session_89.is_deep_work = session_89.duration_minutes >= 90
-        
-        assert session_89.is_deep_work is False
-        
-        # Test exactly 90 minutes (is deep work)
-        session_90 = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
-        )
-        session_90.ended_at = started_at + timedelta(minutes=90)
-        session_90.duration_minutes = 90
-        session_90.is_deep_work = session_90.duration_minutes >= 90
-        
-        assert session_90.is_deep_work is True
-        
-        # Test exactly 91 minutes (is deep work)
-        session_91 = StudySession(
-            id=uuid.uuid4(),
-            user_id=uuid.uuid4(),
-            started_at=started_at,
-        )
-        session_91.ended_at = started_at + timedelta(minutes=91)
-        session_91.duration_minutes = 91
-        session_91.is_deep_work = session_91.duration_minutes >= 90
-        
-        assert session_91.is_deep_work is True
+        offsets = [
+            timedelta(minutes=89, seconds=59),
+            timedelta(minutes=90),
+            timedelta(minutes=91),
+        ]
+
+        results = _evaluate([(started_at, started_at + offset) for offset in offsets])
+
+        assert results == [(89, False), (90, True), (91, True)]
+
+    def test_running_session_has_no_duration(self):
+        assert _evaluate([(datetime(2025, 1, 1, 10, 0, 0), None)]) == [(None, False)]
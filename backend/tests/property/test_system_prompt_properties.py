@@ -8,9 +8,16 @@ For any user with stored memories or guidelines, the dynamically built
 system prompt SHALL include all active guidelines and relevant memories.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck, assume
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agent.prompt_builder import (
+    get_prompt_sections,
+    invalidate_prompt_cache,
     build_system_prompt_sync,
     format_memories,
     format_guidelines,
@@ -361,3 +368,55 @@ class TestPromptStructure:
         # Should still have base content
         assert "AESA" in prompt
         assert len(prompt) > 100  # Should have substantial content
+
+    def test_empty_sections_are_omitted(self):
+        """
+        Empty memories, guidelines, and context should add no sections.
+        """
+        prompt = build_system_prompt_sync(
+            memories=[],
+            guidelines=[],
+            context=AgentContext(),
+        )
+
+        assert "User Memories" not in prompt
+        assert "User Guidelines" not in prompt
+        assert "Current Session Context" not in prompt
+
+
+class TestPromptSectionCache:
+    """Caching of the rendered memories and guidelines sections."""
+
+    @staticmethod
+    def _db(*rows: tuple) -> AsyncMock:
+        db = AsyncMock(spec=AsyncSession)
+        db.execute.return_value = MagicMock(__iter__=lambda _: iter(rows))
+        return db
+
+    @pytest.mark.asyncio
+    async def test_sections_are_cached_until_invalidated(self):
+        user_id = uuid4()
+        db = self._db(("memory", "study_time", "mornings", None))
+
+        first = await get_prompt_sections(db, user_id)
+        second = await get_prompt_sections(db, user_id)
+        invalidate_prompt_cache(user_id)
+        await get_prompt_sections(db, user_id)
+
+        assert "mornings" in first[0]
+        assert second == first
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_not_cached(self):
+        user_id = uuid4()
+        db = self._db(("guideline", None, "Keep answers short", None))
+        db.execute.side_effect = [
+            RuntimeError("connection reset"),
+            db.execute.return_value,
+        ]
+
+        assert await get_prompt_sections(db, user_id) == ("", "")
+        _, guidelines_section = await get_prompt_sections(db, user_id)
+
+        assert "Keep answers short" in guidelines_section
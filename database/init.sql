@@ -5,6 +5,7 @@
 
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+CREATE EXTENSION IF NOT EXISTS btree_gist;
 
 -- =============================================================================
 -- Core Tables
@@ -79,7 +80,12 @@ CREATE TABLE time_blocks (
     end_time TIMESTAMP NOT NULL,
     is_fixed BOOLEAN DEFAULT FALSE,
     metadata JSONB,
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    -- A user's blocks may not overlap
+    CONSTRAINT time_blocks_no_overlap EXCLUDE USING gist (
+        user_id WITH =,
+        tsrange(start_time, end_time) WITH &&
+    )
 );
 
 -- Revision schedule (spaced repetition)
@@ -104,8 +110,13 @@ CREATE TABLE study_sessions (
     subject_id UUID REFERENCES subjects(id) ON DELETE SET NULL,
     started_at TIMESTAMP NOT NULL,
     ended_at TIMESTAMP,
-    duration_minutes INT,
-    is_deep_work BOOLEAN DEFAULT FALSE,
+    -- Derived from the timestamps; deep work is 90+ minutes (5400 seconds)
+    duration_minutes INT GENERATED ALWAYS AS (
+        FLOOR(EXTRACT(EPOCH FROM (ended_at - started_at)) / 60)::INT
+    ) STORED,
+    is_deep_work BOOLEAN GENERATED ALWAYS AS (
+        COALESCE(EXTRACT(EPOCH FROM (ended_at - started_at)) >= 5400, FALSE)
+    ) STORED,
     notes TEXT,
     created_at TIMESTAMP DEFAULT NOW()
 );
@@ -263,6 +274,14 @@ CREATE INDEX idx_time_blocks_user_date ON time_blocks(user_id, DATE(start_time))
 -- Study sessions indexes
 CREATE INDEX idx_study_sessions_user_date ON study_sessions(user_id, started_at);
 CREATE INDEX idx_study_sessions_subject ON study_sessions(subject_id);
+-- Completed sessions, newest first (timer analytics and recent sessions);
+-- the INCLUDE columns let the analytics aggregate run as an index-only scan
+CREATE INDEX idx_study_sessions_user_completed ON study_sessions(user_id, started_at DESC)
+    INCLUDE (duration_minutes, is_deep_work, subject_id)
+    WHERE ended_at IS NOT NULL;
+-- Deep work sessions only (deep work totals)
+CREATE INDEX idx_study_sessions_user_deep_work ON study_sessions(user_id, started_at)
+    WHERE is_deep_work;
 
 -- Notifications indexes
 CREATE INDEX idx_notifications_user_unread ON notifications(user_id, is_read);
@@ -271,6 +290,9 @@ CREATE INDEX idx_notifications_user_scheduled ON notifications(user_id, schedule
 -- AI memory index
 CREATE INDEX idx_ai_memory_user_key ON ai_memory(user_id, key);
 
+-- AI guidelines index (active guidelines, newest first, for the system prompt)
+CREATE INDEX idx_ai_guidelines_user_active_created ON ai_guidelines(user_id, is_active, created_at DESC);
+
 -- Revision schedule index
 CREATE INDEX idx_revision_schedule_date ON revision_schedule(scheduled_date, is_completed);
 
@@ -315,22 +337,6 @@ CREATE TRIGGER daily_study_stats_updated
     BEFORE UPDATE ON daily_study_stats
     FOR EACH ROW EXECUTE FUNCTION update_timestamp();
 
--- Function to auto-calculate session duration and deep work flag
-CREATE OR REPLACE FUNCTION calculate_session_duration()
-RETURNS TRIGGER AS $$
-BEGIN
-    IF NEW.ended_at IS NOT NULL AND OLD.ended_at IS NULL THEN
-        NEW.duration_minutes = EXTRACT(EPOCH FROM (NEW.ended_at - NEW.started_at)) / 60;
-        NEW.is_deep_work = NEW.duration_minutes >= 90;
-    END IF;
-    RETURN NEW;
-END;
-$$ LANGUAGE plpgsql;
-
-CREATE TRIGGER session_duration
-    BEFORE UPDATE ON study_sessions
-    FOR EACH ROW EXECUTE FUNCTION calculate_session_duration();
-
 -- Function to schedule revisions when chapter is completed
 CREATE OR REPLACE FUNCTION schedule_chapter_revisions()
 RETURNS TRIGGER AS $$